@@ -4,9 +4,13 @@ from __future__ import annotations
 from contextlib import contextmanager
 from typing import Any
 
-from homeassistant.components.trace import ActionTrace, async_store_trace
-from homeassistant.components.trace.const import CONF_STORED_TRACES
+from homeassistant.components.trace import (
+    ActionTrace,
+    async_trace_finished,
+    async_trace_started,
+)
 from homeassistant.core import Context
+from homeassistant.helpers.trace import trace_variables_cv
 
 from .const import DOMAIN
 
@@ -50,7 +54,7 @@ def trace_automation(
 ):
     """Trace action execution of automation with automation_id."""
     trace = AutomationTrace(automation_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    token = trace_variables_cv.set(async_trace_started(hass, trace, trace_config))
 
     try:
         yield trace
@@ -61,3 +65,5 @@ def trace_automation(
     finally:
         if automation_id:
             trace.finished()
+            async_trace_finished(hass, trace, trace_config)
+        trace_variables_cv.reset(token)
@@ -22,7 +22,11 @@ import attr
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
-from homeassistant.components.http import KEY_AUTHENTICATED, HomeAssistantView
+from homeassistant.components.http import (
+    KEY_AUTHENTICATED,
+    KEY_HASS,
+    HomeAssistantView,
+)
 from homeassistant.components.media_player.const import (
     ATTR_MEDIA_CONTENT_ID,
     ATTR_MEDIA_CONTENT_TYPE,
@@ -67,6 +71,7 @@ from .const import (
     STREAM_TYPE_HLS,
     STREAM_TYPE_WEB_RTC,
 )
+from .frame_broker import async_get_frame_broker, async_get_streaming_broker
 from .img_util import scale_jpeg_camera_image
 from .prefs import CameraPreferences
 
@@ -160,6 +165,9 @@ async def _async_get_image(
     that we can scale, however the majority of cases
     are handled.
     """
+    if image := _async_get_streamed_image(camera, width, height):
+        return image
+
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with async_timeout.timeout(timeout):
             # Calling inspect will be removed in 2022.1 after all
@@ -192,6 +200,36 @@ async def _async_get_image(
     raise HomeAssistantError("Unable to get image")
 
 
+@callback
+def _async_get_streamed_image(
+    camera: Camera, width: int | None, height: int | None
+) -> Image | None:
+    """Return the current frame if the camera is streamed from stills.
+
+    Scaled frames are kept until the next frame, so viewers requesting the
+    same size share the scaling.
+    """
+    if (
+        broker := async_get_streaming_broker(camera.hass, camera.async_camera_image)
+    ) is None:
+        return None
+
+    content_type = broker.content_type
+    assert broker.frame is not None
+    if (
+        width is None
+        or height is None
+        or ("jpeg" not in content_type and "jpg" not in content_type)
+    ):
+        return Image(content_type, broker.frame)
+
+    if (scaled := broker.scaled_frames.get((width, height))) is None:
+        scaled = broker.scaled_frames[(width, height)] = scale_jpeg_camera_image(
+            Image(content_type, broker.frame), width, height
+        )
+    return Image(content_type, scaled)
+
+
 @bind_hass
 async def async_get_image(
     hass: HomeAssistant,
@@ -239,36 +277,24 @@ async def async_get_still_stream(
     response.content_type = CONTENT_TYPE_MULTIPART.format("--frameboundary")
     await response.prepare(request)
 
-    async def write_to_mjpeg_stream(img_bytes: bytes) -> None:
-        """Write image to stream."""
-        await response.write(
-            bytes(
-                "--frameboundary\r\n"
-                "Content-Type: {}\r\n"
-                "Content-Length: {}\r\n\r\n".format(content_type, len(img_bytes)),
-                "utf-8",
-            )
-            + img_bytes
-            + b"\r\n"
-        )
-
-    last_image = None
-
-    while True:
-        img_bytes = await image_cb()
-        if not img_bytes:
-            break
+    # Viewers of the same images share the fetched frames
+    broker = async_get_frame_broker(
+        request.app[KEY_HASS], image_cb, content_type, interval
+    )
+    queue = broker.async_subscribe()
+    first_chunk = True
 
-        if img_bytes != last_image:
-            await write_to_mjpeg_stream(img_bytes)
+    try:
+        while (chunk := await queue.get()) is not None:
+            await response.write(chunk)
 
             # Chrome seems to always ignore first picture,
             # print it twice.
-            if last_image is None:
-                await write_to_mjpeg_stream(img_bytes)
-            last_image = img_bytes
-
-        await asyncio.sleep(interval)
+            if first_chunk:
+                await response.write(chunk)
+                first_chunk = False
+    finally:
+        broker.async_unsubscribe(queue)
 
     return response
 
@@ -5,6 +5,7 @@ DOMAIN: Final = "camera"
 
 DATA_CAMERA_PREFS: Final = "camera_prefs"
 DATA_RTSP_TO_WEB_RTC: Final = "rtsp_to_web_rtc"
+DATA_FRAME_BROKERS: Final = "camera_frame_brokers"
 
 PREF_PRELOAD_STREAM: Final = "preload_stream"
 
@@ -0,0 +1,151 @@
+"""Share the frames of MJPEG streams composed from stills between viewers."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+from typing import Optional
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_FRAME_BROKERS
+
+_LOGGER = logging.getLogger(__name__)
+
+ImageCallbackType = Callable[[], Awaitable[Optional[bytes]]]
+FrameBrokerKeyType = tuple[ImageCallbackType, str, float]
+
+# Frame chunks waiting to be written to a viewer, None ends the stream
+ViewerQueueType = asyncio.Queue[Optional[bytes]]
+
+
+def mjpeg_chunk(content_type: str, img_bytes: bytes) -> bytes:
+    """Return an image encoded as a part of a multipart MJPEG stream."""
+    return (
+        bytes(
+            "--frameboundary\r\n"
+            "Content-Type: {}\r\n"
+            "Content-Length: {}\r\n\r\n".format(content_type, len(img_bytes)),
+            "utf-8",
+        )
+        + img_bytes
+        + b"\r\n"
+    )
+
+
+@callback
+def async_get_frame_broker(
+    hass: HomeAssistant,
+    image_cb: ImageCallbackType,
+    content_type: str,
+    interval: float,
+) -> FrameBroker:
+    """Return the broker fetching the frames of an image callback."""
+    brokers: dict[FrameBrokerKeyType, FrameBroker] = hass.data.setdefault(
+        DATA_FRAME_BROKERS, {}
+    )
+    key = (image_cb, content_type, interval)
+    if (broker := brokers.get(key)) is None:
+        broker = brokers[key] = FrameBroker(hass, key)
+    return broker
+
+
+@callback
+def async_get_streaming_broker(
+    hass: HomeAssistant, image_cb: ImageCallbackType
+) -> FrameBroker | None:
+    """Return a broker streaming the frames of an image callback, if any."""
+    brokers: dict[FrameBrokerKeyType, FrameBroker] = hass.data.get(
+        DATA_FRAME_BROKERS, {}
+    )
+    for (broker_image_cb, _, _), broker in brokers.items():
+        if broker_image_cb == image_cb and broker.frame is not None:
+            return broker
+    return None
+
+
+class FrameBroker:
+    """Fetch the frames of an image callback once for all viewers.
+
+    Frames are fetched every interval while there are viewers. A changed
+    frame is encoded once and the same chunk is queued for every viewer. A
+    viewer which is slower than the camera skips to the latest frame.
+    """
+
+    def __init__(self, hass: HomeAssistant, key: FrameBrokerKeyType) -> None:
+        """Initialize the frame broker."""
+        self.hass = hass
+        self._key = key
+        self._image_cb, self.content_type, self._interval = key
+        self._viewers: set[ViewerQueueType] = set()
+        self._task: asyncio.Task | None = None
+        self._frame_id: tuple[int, int] | None = None
+        self._chunk: bytes | None = None
+        self.frame: bytes | None = None
+        # Scaled versions of the current frame by width and height
+        self.scaled_frames: dict[tuple[int, int], bytes] = {}
+
+    @callback
+    def async_subscribe(self) -> ViewerQueueType:
+        """Add a viewer and return the queue of its frame chunks."""
+        queue: ViewerQueueType = asyncio.Queue(maxsize=1)
+        if self._chunk is not None:
+            queue.put_nowait(self._chunk)
+        self._viewers.add(queue)
+        if self._task is None:
+            self._task = self.hass.async_create_task(self._async_fetch_frames())
+        return queue
+
+    @callback
+    def async_unsubscribe(self, queue: ViewerQueueType) -> None:
+        """Remove a viewer, fetching stops when the last viewer is removed."""
+        self._viewers.discard(queue)
+        if self._viewers:
+            return
+        self._async_stop()
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _async_fetch_frames(self) -> None:
+        """Fetch frames and queue the changed frames for the viewers."""
+        try:
+            while True:
+                if not (img_bytes := await self._image_cb()):
+                    break
+
+                # Cheap change detection, the hash of bytes is cached on them
+                frame_id = (len(img_bytes), hash(img_bytes))
+                if frame_id != self._frame_id:
+                    self._frame_id = frame_id
+                    self.frame = img_bytes
+                    self.scaled_frames = {}
+                    self._chunk = mjpeg_chunk(self.content_type, img_bytes)
+                    for queue in self._viewers:
+                        self._async_put(queue, self._chunk)
+
+                await asyncio.sleep(self._interval)
+        except asyncio.CancelledError:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error fetching frame for MJPEG stream")
+
+        self._async_stop()
+        for queue in self._viewers:
+            self._async_put(queue, None)
+
+    @callback
+    def _async_stop(self) -> None:
+        """Stop sharing frames, new viewers get a new broker."""
+        brokers: dict[FrameBrokerKeyType, FrameBroker] = self.hass.data[
+            DATA_FRAME_BROKERS
+        ]
+        if brokers.get(self._key) is self:
+            del brokers[self._key]
+
+    @staticmethod
+    @callback
+    def _async_put(queue: ViewerQueueType, chunk: bytes | None) -> None:
+        """Queue a chunk for a viewer, replacing the chunk not written yet."""
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(chunk)
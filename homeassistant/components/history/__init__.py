@@ -1,10 +1,13 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Generator, Iterable
 from datetime import datetime as dt, timedelta
+from functools import partial
 from http import HTTPStatus
+import json
 import logging
+import math
 import time
 from typing import cast
 
@@ -14,13 +17,19 @@ import voluptuous as vol
 
 from homeassistant.components import frontend, websocket_api
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.http.json_stream import async_stream_json_list
 from homeassistant.components.recorder import history, models as history_models
 from homeassistant.components.recorder.statistics import (
+    async_statistics_during_period,
     list_statistic_ids,
-    statistics_during_period,
 )
 from homeassistant.components.recorder.util import session_scope
-from homeassistant.const import CONF_DOMAINS, CONF_ENTITIES, CONF_EXCLUDE, CONF_INCLUDE
+from homeassistant.const import (
+    CONF_DOMAINS,
+    CONF_ENTITIES,
+    CONF_EXCLUDE,
+    CONF_INCLUDE,
+)
 from homeassistant.core import HomeAssistant
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.deprecation import deprecated_class, deprecated_function
@@ -28,6 +37,7 @@ from homeassistant.helpers.entityfilter import (
     CONF_ENTITY_GLOBS,
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
 )
+from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
@@ -142,8 +152,7 @@ async def ws_get_statistics_during_period(
     else:
         end_time = None
 
-    statistics = await hass.async_add_executor_job(
-        statistics_during_period,
+    statistics = await async_statistics_during_period(
         hass,
         start_time,
         end_time,
@@ -221,6 +230,26 @@ class HistoryPeriodView(HomeAssistantView):
 
         minimal_response = "minimal_response" in request.query
 
+        max_points = None
+        try:
+            if max_points_str := request.query.get("max_points"):
+                max_points = int(max_points_str)
+                if max_points < 2:
+                    raise ValueError
+            if resolution_str := request.query.get("resolution"):
+                # Seconds per point
+                resolution = float(resolution_str)
+                if resolution <= 0:
+                    raise ValueError
+                points = max(
+                    math.ceil((end_time - start_time).total_seconds() / resolution), 2
+                )
+                max_points = min(max_points or points, points)
+        except ValueError:
+            return self.json_message(
+                "Invalid max_points or resolution", HTTPStatus.BAD_REQUEST
+            )
+
         hass = request.app["hass"]
 
         if (
@@ -230,6 +259,18 @@ class HistoryPeriodView(HomeAssistantView):
         ):
             return self.json([])
 
+        if "columnar" in request.query:
+            return await self._stream_columnar_states(
+                request,
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                max_points,
+            )
+
         return cast(
             web.Response,
             await hass.async_add_executor_job(
@@ -241,6 +282,7 @@ class HistoryPeriodView(HomeAssistantView):
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
+                max_points,
             ),
         )
 
@@ -253,6 +295,7 @@ class HistoryPeriodView(HomeAssistantView):
         include_start_time_state,
         significant_changes_only,
         minimal_response,
+        max_points=None,
     ):
         """Fetch significant stats from the database as json."""
         timer_start = time.perf_counter()
@@ -268,6 +311,7 @@ class HistoryPeriodView(HomeAssistantView):
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
+                max_points,
             )
 
         result = list(result.values())
@@ -290,6 +334,72 @@ class HistoryPeriodView(HomeAssistantView):
 
         return self.json(result)
 
+    async def _stream_columnar_states(
+        self,
+        request,
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        max_points,
+    ) -> web.StreamResponse:
+        """Stream the significant states as a JSON list of columnar series.
+
+        The series are encoded in the executor as they are read from the
+        database and written to the client one entity at a time.
+        """
+        return await async_stream_json_list(
+            hass,
+            request,
+            partial(
+                self._iter_columnar_chunks,
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                max_points,
+            ),
+        )
+
+    def _iter_columnar_chunks(
+        self,
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        max_points,
+    ) -> Generator[bytes, None, None]:
+        """Read the columnar series from the database and encode them as JSON."""
+        timer_start = time.perf_counter()
+
+        rows = 0
+        with session_scope(hass=hass) as session:
+            for series in history.stream_significant_states_columnar(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                self.filters,
+                include_start_time_state,
+                significant_changes_only,
+                max_points,
+            ):
+                rows += len(series["state"])
+                yield json.dumps(series, cls=JSONEncoder, allow_nan=False).encode(
+                    "utf-8"
+                )
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            elapsed = time.perf_counter() - timer_start
+            _LOGGER.debug("Streamed %d states in %fs", rows, elapsed)
+
 
 def sqlalchemy_filter_from_include_exclude_conf(conf: ConfigType) -> Filters | None:
     """Build a sql filter from config."""
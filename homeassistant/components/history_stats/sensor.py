@@ -1,6 +1,7 @@
 """Component to make instant statistics about your history."""
 from __future__ import annotations
 
+from collections import deque
 import datetime
 import logging
 import math
@@ -128,6 +129,14 @@ class HistoryStatsSensor(SensorEntity):
         self.value = None
         self.count = None
 
+        # Timestamps at which the entity entered or left the tracked states,
+        # starting with the state at the start of the known history
+        self._history: deque[tuple[float, bool]] | None = None
+        self._history_start: float | None = None
+        # State changes seen since the last load of the history, they may not
+        # have been committed to the database yet when it is read
+        self._recent_changes: list[tuple[float, bool]] = []
+
     async def async_added_to_hass(self):
         """Create listeners when the entity is added."""
 
@@ -140,10 +149,18 @@ class HistoryStatsSensor(SensorEntity):
                 """Force the component to refresh."""
                 self.async_schedule_update_ha_state(True)
 
+            @callback
+            def state_changed(event):
+                """Track the state change and refresh."""
+                self._async_add_state_change(
+                    event.data.get("new_state"), event.time_fired
+                )
+                force_refresh()
+
             force_refresh()
             self.async_on_remove(
                 async_track_state_change_event(
-                    self.hass, [self._entity_id], force_refresh
+                    self.hass, [self._entity_id], state_changed
                 )
             )
 
@@ -195,9 +212,6 @@ class HistoryStatsSensor(SensorEntity):
 
     async def async_update(self):
         """Get the latest data and updates the states."""
-        # Get previous values of start and end
-        p_start, p_end = self._period
-
         # Parse templates
         self.update_period()
         start, end = self._period
@@ -205,63 +219,115 @@ class HistoryStatsSensor(SensorEntity):
         # Convert times to UTC
         start = dt_util.as_utc(start)
         end = dt_util.as_utc(end)
-        p_start = dt_util.as_utc(p_start)
-        p_end = dt_util.as_utc(p_end)
         now = datetime.datetime.now()
 
         # Compute integer timestamps
         start_timestamp = math.floor(dt_util.as_timestamp(start))
         end_timestamp = math.floor(dt_util.as_timestamp(end))
-        p_start_timestamp = math.floor(dt_util.as_timestamp(p_start))
-        p_end_timestamp = math.floor(dt_util.as_timestamp(p_end))
-        now_timestamp = math.floor(dt_util.as_timestamp(now))
-
-        # If period has not changed and current time after the period end...
-        if (
-            start_timestamp == p_start_timestamp
-            and end_timestamp == p_end_timestamp
-            and end_timestamp <= now_timestamp
-        ):
-            # Don't compute anything as the value cannot have changed
-            return
+        now_timestamp = dt_util.as_timestamp(now)
+
+        # The changes since the start of the known history are tracked live,
+        # only go back to the database if the period moved before it
+        if self._history_start is None or start_timestamp < self._history_start:
+            # Collect the state changes seen while loading
+            self._history = self._history_start = None
+            loaded = await self.hass.async_add_executor_job(self._load_history, start)
+            if loaded is None:
+                if not self._recent_changes:
+                    return
+                # Nothing is recorded for the entity, e.g. it is excluded from
+                # the recorder, measure from the changes seen live
+                loaded = (False, [])
+            self._async_set_history(start_timestamp, *loaded)
 
-        await self.hass.async_add_executor_job(
-            self._update, start, end, now_timestamp, start_timestamp, end_timestamp
-        )
+        self._async_measure(start_timestamp, end_timestamp, now_timestamp)
 
-    def _update(self, start, end, now_timestamp, start_timestamp, end_timestamp):
-        # Get history between start and end
+    def _load_history(self, start):
+        """Load the state at start and the state changes after it."""
         history_list = history.state_changes_during_period(
-            self.hass, start, end, str(self._entity_id)
+            self.hass, start, None, str(self._entity_id)
         )
+        start_state = history.get_state(self.hass, start, self._entity_id)
 
-        if self._entity_id not in history_list:
-            return
+        if start_state is None and self._entity_id not in history_list:
+            return None
+
+        return (
+            start_state is not None and start_state.state in self._entity_states,
+            [
+                (item.last_changed.timestamp(), item.state in self._entity_states)
+                for item in history_list.get(self._entity_id, [])
+            ],
+        )
 
-        # Get the first state
-        last_state = history.get_state(self.hass, start, self._entity_id)
-        last_state = last_state is not None and last_state in self._entity_states
+    @callback
+    def _async_set_history(self, start_timestamp, start_state, changes):
+        """Replace the known history with the history loaded from the database."""
+        self._history = deque([(start_timestamp, start_state)])
+        self._history_start = start_timestamp
+        recent_changes = self._recent_changes
+        self._recent_changes = []
+
+        for change in changes:
+            self._async_add_change(*change)
+        # Changes seen live which were not committed yet when loading
+        last_time = self._history[-1][0]
+        for change in recent_changes:
+            if change[0] > last_time:
+                self._async_add_change(*change)
+
+    @callback
+    def _async_add_state_change(self, new_state, time_fired):
+        """Track a state change of the entity."""
+        if new_state is None:
+            change = (time_fired.timestamp(), False)
+        else:
+            change = (
+                new_state.last_changed.timestamp(),
+                new_state.state in self._entity_states,
+            )
+
+        if self._history is None:
+            self._recent_changes.append(change)
+            return
+        self._async_add_change(*change)
+
+    @callback
+    def _async_add_change(self, change_time, current_state):
+        """Add a change to the known history if it enters or leaves the states."""
+        last_time, last_state = self._history[-1]
+        if current_state != last_state:
+            self._history.append((max(change_time, last_time), current_state))
+
+    @callback
+    def _async_measure(self, start_timestamp, end_timestamp, now_timestamp):
+        """Measure the period from the known history and drop what is before it."""
+        if end_timestamp >= math.floor(now_timestamp):
+            # The period ends now, include the changes of the current second
+            end_timestamp = now_timestamp
+        last_state = False
         last_time = start_timestamp
         elapsed = 0
         count = 0
 
-        # Make calculations
-        for item in history_list.get(self._entity_id):
-            current_state = item.state in self._entity_states
-            current_time = item.last_changed.timestamp()
+        for change_time, current_state in self._history:
+            if change_time >= end_timestamp:
+                break
+            if change_time <= start_timestamp:
+                last_state = current_state
+                continue
 
             if last_state:
-                elapsed += current_time - last_time
+                elapsed += change_time - last_time
             if current_state and not last_state:
                 count += 1
 
             last_state = current_state
-            last_time = current_time
+            last_time = change_time
 
         # Count time elapsed between last history state and end of measure
         if last_state:
-            measure_end = min(end_timestamp, now_timestamp)
-            elapsed += measure_end - last_time
+            elapsed += end_timestamp - last_time
 
         # Save value in hours
         self.value = elapsed / 3600
@@ -269,6 +335,12 @@ class HistoryStatsSensor(SensorEntity):
         # Save counter
         self.count = count
 
+        # Advance the start of the known history with the period
+        history_list = self._history
+        while len(history_list) > 1 and history_list[1][0] <= start_timestamp:
+            history_list.popleft()
+        self._history_start = max(self._history_start, start_timestamp)
+
     def update_period(self):
         """Parse the templates and store a datetime tuple in _period."""
         start = None
@@ -0,0 +1,88 @@
+"""Stream JSON lists encoded in the executor to the client."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Generator
+from contextlib import closing
+import threading
+from typing import Union
+
+from aiohttp import web
+from aiohttp.hdrs import CONTENT_TYPE
+
+from homeassistant.const import CONTENT_TYPE_JSON
+from homeassistant.core import HomeAssistant
+
+# Number of chunks encoded ahead of the client
+STREAM_QUEUE_SIZE = 4
+
+# Encoded chunk, the error which stopped producing, or None at the end
+_QueueItemType = Union[bytes, Exception, None]
+
+
+async def async_stream_json_list(
+    hass: HomeAssistant,
+    request: web.Request,
+    produce_chunks: Callable[[], Generator[bytes, None, None]],
+) -> web.StreamResponse:
+    """Stream a JSON list of the chunks produced in the executor.
+
+    Each chunk holds one or more comma separated JSON encoded list items. The
+    next chunks are produced while the client receives the earlier ones. If
+    producing fails, the response is aborted instead of ending the list, so
+    the client never gets a truncated list which looks complete.
+    """
+    response = web.StreamResponse(headers={CONTENT_TYPE: CONTENT_TYPE_JSON})
+    await response.prepare(request)
+
+    queue: asyncio.Queue[_QueueItemType] = asyncio.Queue(STREAM_QUEUE_SIZE)
+    cancel = threading.Event()
+    producer = hass.async_add_executor_job(
+        _produce_chunks, hass, queue, cancel, produce_chunks
+    )
+
+    try:
+        separator = b"["
+        while (chunk := await queue.get()) is not None:
+            if isinstance(chunk, Exception):
+                raise chunk
+            await response.write(separator + chunk)
+            separator = b","
+        await response.write(b"]" if separator == b"," else b"[]")
+    finally:
+        # Stop the producer if the client went away, dropping the queued
+        # chunks unblocks it if it is waiting for space
+        cancel.set()
+        while not queue.empty():
+            queue.get_nowait()
+        await producer
+
+    await response.write_eof()
+    return response
+
+
+def _produce_chunks(
+    hass: HomeAssistant,
+    queue: asyncio.Queue[_QueueItemType],
+    cancel: threading.Event,
+    produce_chunks: Callable[[], Generator[bytes, None, None]],
+) -> None:
+    """Queue the produced chunks until done, failed or cancelled."""
+
+    def _put(item: _QueueItemType) -> bool:
+        if cancel.is_set():
+            return False
+        asyncio.run_coroutine_threadsafe(queue.put(item), hass.loop).result()
+        return True
+
+    try:
+        with closing(produce_chunks()) as chunks:
+            for chunk in chunks:
+                if not _put(chunk):
+                    return
+    except Exception as err:  # pylint: disable=broad-except
+        # Raised by the consumer, which aborts the response
+        _put(err)
+        return
+
+    _put(None)
@@ -1,11 +1,15 @@
 """Event parser and human readable log generator."""
+import asyncio
 from contextlib import suppress
 from datetime import timedelta
 from http import HTTPStatus
 from itertools import groupby
 import json
 import re
+import threading
 
+from aiohttp import web
+from aiohttp.hdrs import CONTENT_TYPE
 import sqlalchemy
 from sqlalchemy.orm import aliased
 from sqlalchemy.sql.expression import literal
@@ -17,6 +21,7 @@ from homeassistant.components.history import sqlalchemy_filter_from_include_excl
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder.models import (
     Events,
+    StateAttributes,
     States,
     process_timestamp_to_utc_isoformat,
 )
@@ -29,6 +34,7 @@ from homeassistant.const import (
     ATTR_ICON,
     ATTR_NAME,
     ATTR_SERVICE,
+    CONTENT_TYPE_JSON,
     EVENT_CALL_SERVICE,
     EVENT_HOMEASSISTANT_START,
     EVENT_HOMEASSISTANT_STOP,
@@ -52,6 +58,7 @@ from homeassistant.helpers.entityfilter import (
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
 )
+from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
@@ -68,6 +75,14 @@ DOMAIN = "logbook"
 
 GROUP_BY_MINUTES = 15
 
+# Number of rows read from the database at once
+PAGE_SIZE = 1000
+# The number of context ids to look up in one query, this is below the sqlite
+# limit of 999 query parameters
+MAX_CONTEXT_IDS_PER_QUERY = 998
+# Number of pages of JSON entries buffered for a client
+STREAM_QUEUE_SIZE = 4
+
 EMPTY_JSON_OBJECT = "{}"
 UNIT_OF_MEASUREMENT_JSON = '"unit_of_measurement":'
 
@@ -94,6 +109,7 @@ ALL_EVENT_TYPES = [
 ]
 
 EVENT_COLUMNS = [
+    Events.event_id,
     Events.event_type,
     Events.event_data,
     Events.time_fired,
@@ -239,22 +255,80 @@ class LogbookView(HomeAssistantView):
                 "Can't combine entity with context_id", HTTPStatus.BAD_REQUEST
             )
 
-        def json_events():
-            """Fetch events and generate JSON."""
-            return self.json(
-                _get_events(
-                    hass,
-                    start_day,
-                    end_day,
-                    entity_ids,
-                    self.filters,
-                    self.entities_filter,
-                    entity_matches_only,
-                    context_id,
-                )
-            )
+        response = web.StreamResponse(headers={CONTENT_TYPE: CONTENT_TYPE_JSON})
+        await response.prepare(request)
+
+        pages: asyncio.Queue[bytes | None] = asyncio.Queue(STREAM_QUEUE_SIZE)
+        cancel = threading.Event()
+        producer = hass.async_add_executor_job(
+            self._produce_pages,
+            hass,
+            pages,
+            cancel,
+            start_day,
+            end_day,
+            entity_ids,
+            entity_matches_only,
+            context_id,
+        )
 
-        return await hass.async_add_executor_job(json_events)
+        try:
+            separator = b"["
+            while (page := await pages.get()) is not None:
+                await response.write(separator + page)
+                separator = b","
+            await response.write(b"]" if separator == b"," else b"[]")
+        finally:
+            # Stop the producer if the client went away, dropping the
+            # queued pages unblocks it if it is waiting for space
+            cancel.set()
+            while not pages.empty():
+                pages.get_nowait()
+            await producer
+
+        await response.write_eof()
+        return response
+
+    def _produce_pages(
+        self,
+        hass,
+        pages,
+        cancel,
+        start_day,
+        end_day,
+        entity_ids,
+        entity_matches_only,
+        context_id,
+    ):
+        """Read the logbook from the database and queue it as JSON pages."""
+
+        def _put(page):
+            if cancel.is_set():
+                return False
+            asyncio.run_coroutine_threadsafe(pages.put(page), hass.loop).result()
+            return True
+
+        try:
+            for entries in _iter_entry_pages(
+                hass,
+                start_day,
+                end_day,
+                entity_ids,
+                self.filters,
+                self.entities_filter,
+                entity_matches_only,
+                context_id,
+            ):
+                if not entries:
+                    continue
+                page = ",".join(
+                    json.dumps(entry, cls=JSONEncoder, allow_nan=False)
+                    for entry in entries
+                )
+                if not _put(page.encode("utf-8")):
+                    return
+        finally:
+            _put(None)
 
 
 def humanify(hass, events, entity_attr_cache, context_lookup):
@@ -421,69 +495,236 @@ def _get_events(
     context_id=None,
 ):
     """Get events for a period of time."""
+    return [
+        entry
+        for entries in _iter_entry_pages(
+            hass,
+            start_day,
+            end_day,
+            entity_ids,
+            filters,
+            entities_filter,
+            entity_matches_only,
+            context_id,
+        )
+        for entry in entries
+    ]
+
+
+def _iter_entry_pages(
+    hass,
+    start_day,
+    end_day,
+    entity_ids=None,
+    filters=None,
+    entities_filter=None,
+    entity_matches_only=False,
+    context_id=None,
+):
+    """Get the logbook entries for a period of time, one page at a time.
+
+    The rows are read with keyset pagination on (time_fired, event_id). A page
+    is extended to the end of its GROUP_BY_MINUTES group so the rows of a
+    group are humanified together, and the contexts the rows refer to are
+    looked up with one query per page instead of keeping all rows in memory.
+    """
     assert not (
         entity_ids and context_id
     ), "can't pass in both entity_ids and context_id"
 
     entity_attr_cache = EntityAttributeCache(hass)
-    context_lookup = {None: None}
 
-    def yield_events(query):
+    if entity_ids is not None:
+        entities_filter = generate_filter([], entity_ids, [], [])
+
+    def keep_event(event):
+        """Return if an event is not filtered away."""
+        if event.event_type == EVENT_CALL_SERVICE:
+            return False
+        return event.event_type == EVENT_STATE_CHANGED or _keep_event(
+            hass, event, entities_filter
+        )
+
+    def yield_events(events, next_event, context_lookup):
         """Yield Events that are not filtered away."""
-        for row in query.yield_per(1000):
-            event = LazyEventPartialState(row)
+        for event in events:
             context_lookup.setdefault(event.context_id, event)
-            if event.event_type == EVENT_CALL_SERVICE:
-                continue
-            if event.event_type == EVENT_STATE_CHANGED or _keep_event(
-                hass, event, entities_filter
-            ):
+            if keep_event(event):
                 yield event
-
-    if entity_ids is not None:
-        entities_filter = generate_filter([], entity_ids, [], [])
+        # Grouping the events reads ahead the first event of the next group
+        if next_event is not None:
+            context_lookup.setdefault(next_event.context_id, next_event)
+
+    def logbook_query(session, *criteria):
+        """Return the logbook query with extra criteria applied to its parts."""
+        return _generate_logbook_query(
+            hass,
+            session,
+            start_day,
+            end_day,
+            entity_ids,
+            filters,
+            entity_matches_only,
+            context_id,
+            criteria,
+        )
 
     with session_scope(hass=hass) as session:
-        old_state = aliased(States, name="old_state")
-
-        if entity_ids is not None:
-            query = _generate_events_query_without_states(session)
-            query = _apply_event_time_filter(query, start_day, end_day)
-            query = _apply_event_types_filter(
-                hass, query, ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
-            )
-            if entity_matches_only:
-                # When entity_matches_only is provided, contexts and events that do not
-                # contain the entity_ids are not included in the logbook response.
-                query = _apply_event_entity_id_matchers(query, entity_ids)
-
-            query = query.union_all(
-                _generate_states_query(
-                    session, start_day, end_day, old_state, entity_ids
+        for page, next_event in _iter_event_pages(logbook_query, session, keep_event):
+            context_lookup = _lookup_contexts(logbook_query, session, page)
+            yield list(
+                humanify(
+                    hass,
+                    yield_events(page, next_event, context_lookup),
+                    entity_attr_cache,
+                    context_lookup,
                 )
             )
-        else:
-            query = _generate_events_query(session)
-            query = _apply_event_time_filter(query, start_day, end_day)
-            query = _apply_events_types_and_states_filter(
-                hass, query, old_state
-            ).filter(
-                (States.last_updated == States.last_changed)
-                | (Events.event_type != EVENT_STATE_CHANGED)
-            )
-            if filters:
-                query = query.filter(
-                    filters.entity_filter() | (Events.event_type != EVENT_STATE_CHANGED)
-                )
 
-            if context_id is not None:
-                query = query.filter(Events.context_id == context_id)
 
-        query = query.order_by(Events.time_fired)
+def _generate_logbook_query(
+    hass,
+    session,
+    start_day,
+    end_day,
+    entity_ids,
+    filters,
+    entity_matches_only,
+    context_id,
+    criteria,
+):
+    """Generate the logbook query, ordered by time_fired and event_id."""
+    old_state = aliased(States, name="old_state")
 
-        return list(
-            humanify(hass, yield_events(query), entity_attr_cache, context_lookup)
+    if entity_ids is not None:
+        query = _generate_events_query_without_states(session)
+        query = _apply_event_time_filter(query, start_day, end_day)
+        query = _apply_event_types_filter(
+            hass, query, ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
+        )
+        if entity_matches_only:
+            # When entity_matches_only is provided, contexts and events that do not
+            # contain the entity_ids are not included in the logbook response.
+            query = _apply_event_entity_id_matchers(query, entity_ids)
+
+        query = query.filter(*criteria).union_all(
+            _generate_states_query(
+                session, start_day, end_day, old_state, entity_ids
+            ).filter(*criteria)
         )
+    else:
+        query = _generate_events_query(session)
+        query = _apply_event_time_filter(query, start_day, end_day)
+        query = _apply_events_types_and_states_filter(
+            hass, query, old_state
+        ).filter(
+            (States.last_updated == States.last_changed)
+            | (Events.event_type != EVENT_STATE_CHANGED)
+        )
+        if filters:
+            query = query.filter(
+                filters.entity_filter() | (Events.event_type != EVENT_STATE_CHANGED)
+            )
+
+        if context_id is not None:
+            query = query.filter(Events.context_id == context_id)
+
+        query = query.filter(*criteria)
+
+    return query.order_by(Events.time_fired, Events.event_id)
+
+
+def _iter_event_pages(logbook_query, session, keep_event):
+    """Yield the events of the logbook query in pages.
+
+    A page ends before the last GROUP_BY_MINUTES group of the events which are
+    kept, as that group may continue in the next rows, or with the last event.
+    The pages are yielded with the first kept event of the next page, if it is
+    known.
+    """
+    page = []
+    after = None
+    while True:
+        if after is None:
+            query = logbook_query(session)
+        else:
+            query = logbook_query(session, _after_key_matcher(*after))
+        rows = query.limit(PAGE_SIZE).all()
+        if not rows:
+            break
+        after = (rows[-1].time_fired, rows[-1].event_id)
+        page.extend(LazyEventPartialState(row) for row in rows)
+
+        # Keep the events of the last group for the next page
+        split = len(page)
+        last_group = None
+        for index in range(len(page) - 1, -1, -1):
+            event = page[index]
+            if not keep_event(event):
+                continue
+            group = event.time_fired_minute // GROUP_BY_MINUTES
+            if last_group is not None and group != last_group:
+                break
+            last_group = group
+            split = index
+        if split:
+            yield page[:split], page[split] if split < len(page) else None
+            page = page[split:]
+
+        if len(rows) < PAGE_SIZE:
+            break
+
+    if page:
+        yield page, None
+
+
+def _after_key_matcher(time_fired, event_id):
+    """Match the rows after the given row in (time_fired, event_id) order."""
+    return (Events.time_fired > time_fired) | (
+        (Events.time_fired == time_fired) & (Events.event_id > event_id)
+    )
+
+
+def _before_key_matcher(time_fired, event_id):
+    """Match the rows before the given row in (time_fired, event_id) order."""
+    return (Events.time_fired < time_fired) | (
+        (Events.time_fired == time_fired) & (Events.event_id < event_id)
+    )
+
+
+def _lookup_contexts(logbook_query, session, page):
+    """Return the first event of each context the events in the page refer to.
+
+    The first event of a context may be in an earlier page, those events are
+    looked up in one query for all contexts of the page. The events of the
+    page itself are added while they are humanified.
+    """
+    context_ids = set()
+    for event in page:
+        context_ids.add(event.context_id)
+        if event.context_parent_id:
+            context_ids.add(event.context_parent_id)
+    context_ids.discard(None)
+
+    context_lookup = {None: None}
+    first = page[0]
+    before_page = _before_key_matcher(first.time_fired, first.event_id)
+    context_ids_list = list(context_ids)
+    for offset in range(0, len(context_ids_list), MAX_CONTEXT_IDS_PER_QUERY):
+        # Only read the first event of each context, not all its events
+        events = logbook_query(
+            session,
+            before_page,
+            Events.context_id.in_(
+                context_ids_list[offset : offset + MAX_CONTEXT_IDS_PER_QUERY]
+            ),
+        ).subquery()
+        first_event_ids = session.query(
+            sqlalchemy.func.min(events.c.event_id)
+        ).group_by(events.c.context_id)
+        for row in logbook_query(session, Events.event_id.in_(first_event_ids)):
+            context_lookup.setdefault(row.context_id, LazyEventPartialState(row))
+    return context_lookup
 
 
 def _generate_events_query(session):
@@ -493,6 +734,7 @@ def _generate_events_query(session):
         States.entity_id,
         States.domain,
         States.attributes,
+        StateAttributes.shared_attrs,
     )
 
 
@@ -503,6 +745,7 @@ def _generate_events_query_without_states(session):
         literal(value=None, type_=sqlalchemy.String).label("entity_id"),
         literal(value=None, type_=sqlalchemy.String).label("domain"),
         literal(value=None, type_=sqlalchemy.Text).label("attributes"),
+        literal(value=None, type_=sqlalchemy.Text).label("shared_attrs"),
     )
 
 
@@ -511,6 +754,9 @@ def _generate_states_query(session, start_day, end_day, old_state, entity_ids):
         _generate_events_query(session)
         .outerjoin(Events, (States.event_id == Events.event_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(_missing_state_matcher(old_state))
         .filter(_continuous_entity_matcher())
         .filter((States.last_updated > start_day) & (States.last_updated < end_day))
@@ -525,6 +771,9 @@ def _apply_events_types_and_states_filter(hass, query, old_state):
     events_query = (
         query.outerjoin(States, (Events.event_id == States.event_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(
             (Events.event_type != EVENT_STATE_CHANGED)
             | _missing_state_matcher(old_state)
@@ -552,9 +801,15 @@ def _continuous_entity_matcher():
     # Prefilter out continuous domains that have
     # ATTR_UNIT_OF_MEASUREMENT as its much faster in sql.
     #
+    # Older states have their attributes in the states table, newer
+    # ones in the state_attributes table; one of them is NULL which
+    # leaves the other one to decide.
     return sqlalchemy.or_(
         sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS)),
         sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON)),
+        sqlalchemy.not_(
+            StateAttributes.shared_attrs.contains(UNIT_OF_MEASUREMENT_JSON)
+        ),
     )
 
 
@@ -703,13 +958,25 @@ class LazyEventPartialState:
         self.context_parent_id = self._row.context_parent_id
         self.time_fired_minute = self._row.time_fired.minute
 
+    @property
+    def event_id(self):
+        """Event id of the row."""
+        return self._row.event_id
+
+    @property
+    def time_fired(self):
+        """Time the event was fired."""
+        return self._row.time_fired
+
     @property
     def attributes_icon(self):
         """Extract the icon from the decoded attributes or json."""
         if self._attributes:
             return self._attributes.get(ATTR_ICON)
 
-        result = ICON_JSON_EXTRACT.search(self._row.attributes)
+        result = ICON_JSON_EXTRACT.search(
+            self._row.shared_attrs or self._row.attributes or ""
+        )
         return result and result.group(1)
 
     @property
@@ -734,13 +1001,11 @@ class LazyEventPartialState:
     def attributes(self):
         """State attributes."""
         if not self._attributes:
-            if (
-                self._row.attributes is None
-                or self._row.attributes == EMPTY_JSON_OBJECT
-            ):
+            source = self._row.shared_attrs or self._row.attributes
+            if source is None or source == EMPTY_JSON_OBJECT:
                 self._attributes = {}
             else:
-                self._attributes = json.loads(self._row.attributes)
+                self._attributes = json.loads(source)
         return self._attributes
 
     @property
@@ -3,10 +3,11 @@ from __future__ import annotations
 
 from ast import literal_eval
 import asyncio
+from collections import deque
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 import datetime as dt
-from functools import lru_cache, partial, wraps
+from functools import partial, wraps
 import inspect
 from itertools import groupby
 import logging
@@ -89,6 +90,7 @@ from .const import (
     PROTOCOL_311,
 )
 from .discovery import LAST_DISCOVERY
+from .matcher import SubscriptionTrie
 from .models import (
     AsyncMessageCallbackType,
     MessageCallbackType,
@@ -135,6 +137,9 @@ CONNECTION_FAILED_RECOVERABLE = "connection_failed_recoverable"
 DISCOVERY_COOLDOWN = 2
 TIMEOUT_ACK = 10
 
+# Maximum number of received messages dispatched in one event loop callback
+MAX_MESSAGES_PER_BATCH = 500
+
 PLATFORMS = [
     Platform.ALARM_CONTROL_PANEL,
     Platform.BINARY_SENSOR,
@@ -751,12 +756,24 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str | None = attr.ib(default="utf-8")
 
 
+@attr.s(slots=True)
+class MessageQueueStatistics:
+    """Class to hold counters about received messages handed to the event loop."""
+
+    batches: int = attr.ib(default=0)
+    messages: int = attr.ib(default=0)
+    last_batch_size: int = attr.ib(default=0)
+    queue_depth: int = attr.ib(default=0)
+    max_queue_depth: int = attr.ib(default=0)
+    last_delay: float = attr.ib(default=0.0)
+    max_delay: float = attr.ib(default=0.0)
+
+
 class MQTT:
     """Home Assistant MQTT client."""
 
@@ -774,7 +791,7 @@ class MQTT:
         self.hass = hass
         self.config_entry = config_entry
         self.conf = conf
-        self.subscriptions: list[Subscription] = []
+        self.subscriptions = SubscriptionTrie()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -782,6 +799,9 @@ class MQTT:
         self._paho_lock = asyncio.Lock()
 
         self._pending_operations: dict[str, asyncio.Event] = {}
+        self._received_messages: deque[tuple[float, Any]] = deque()
+        self._drain_scheduled = False
+        self.message_queue_statistics = MessageQueueStatistics()
 
         if self.hass.state == CoreState.running:
             self._ha_started.set()
@@ -948,11 +968,8 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
-        self.subscriptions.append(subscription)
-        self._matching_subscriptions.cache_clear()
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
+        self.subscriptions.add(subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -965,9 +982,8 @@ class MQTT:
             if subscription not in self.subscriptions:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
-            self._matching_subscriptions.cache_clear()
 
-            if any(other.topic == topic for other in self.subscriptions):
+            if self.subscriptions.subscriptions_for_filter(topic):
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
 
@@ -1055,16 +1071,50 @@ class MQTT:
             )
 
     def _mqtt_on_message(self, _mqttc, _userdata, msg) -> None:
-        """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        """Message received callback.
+
+        Messages are queued and handed to the event loop in batches, the loop is
+        only woken up if no drain of the queue is pending yet.
+        """
+        self._received_messages.append((time.monotonic(), msg))
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self.hass.loop.call_soon_threadsafe(self._async_drain_received_messages)
+
+    @callback
+    def _async_drain_received_messages(self) -> None:
+        """Dispatch a batch of queued messages."""
+        # Clear the flag before draining, a message queued from now on will
+        # schedule a new drain if this one does not pick it up.
+        self._drain_scheduled = False
+        received = self._received_messages
+        batch_size = min(len(received), MAX_MESSAGES_PER_BATCH)
+        delay = 0.0
+
+        for _ in range(batch_size):
+            received_at, msg = received.popleft()
+            delay = time.monotonic() - received_at
+            self._mqtt_handle_message(msg)
+
+        stats = self.message_queue_statistics
+        stats.batches += 1
+        stats.messages += batch_size
+        stats.last_batch_size = batch_size
+        stats.queue_depth = len(received)
+        stats.max_queue_depth = max(stats.max_queue_depth, batch_size + len(received))
+        stats.last_delay = delay
+        stats.max_delay = max(stats.max_delay, delay)
+        _LOGGER.debug(
+            "Dispatched %s received messages, %s queued, %.3f seconds after receiving",
+            batch_size,
+            stats.queue_depth,
+            delay,
+        )
 
-    @lru_cache(2048)
-    def _matching_subscriptions(self, topic):
-        subscriptions = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
+        if received and not self._drain_scheduled:
+            # Yield to the event loop before dispatching the next batch
+            self._drain_scheduled = True
+            self.hass.loop.call_soon(self._async_drain_received_messages)
 
     @callback
     def _mqtt_handle_message(self, msg) -> None:
@@ -1076,7 +1126,7 @@ class MQTT:
         )
         timestamp = dt_util.utcnow()
 
-        subscriptions = self._matching_subscriptions(msg.topic)
+        subscriptions = self.subscriptions.matches(msg.topic)
 
         for subscription in subscriptions:
 
@@ -1176,16 +1226,6 @@ def _raise_on_error(result_code: int | None) -> None:
         )
 
 
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
-
-
 @websocket_api.websocket_command(
     {vol.Required("type"): "mqtt/device/debug_info", vol.Required("device_id"): str}
 )
@@ -0,0 +1,125 @@
+"""Topic trie used to route MQTT messages to subscriptions."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import Subscription
+
+
+class _Node:
+    """A level in the topic trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _Node] = {}
+        self.subscriptions: list[Subscription] = []
+
+
+class SubscriptionTrie:
+    """Prefix tree of topic filters holding the subscriptions for each filter.
+
+    Subscriptions are added and removed incrementally, empty branches are pruned
+    when the last subscription for a filter is removed. Matching a topic walks
+    the tree level by level, so its cost depends on the depth of the topic and
+    the number of wildcards on the way, not on the number of subscriptions.
+    The `+` and `#` wildcards follow the semantics of paho's `MQTTMatcher`,
+    including that wildcards on the first level do not match `$` topics.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _Node()
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of subscriptions."""
+        return self._count
+
+    def __contains__(self, subscription: Subscription) -> bool:
+        """Return if the subscription is stored in the trie."""
+        if (node := self._find(subscription.topic)) is None:
+            return False
+        return subscription in node.subscriptions
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over all subscriptions."""
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            yield from node.subscriptions
+            stack.extend(node.children.values())
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _Node()
+            node = child
+        node.subscriptions.append(subscription)
+        self._count += 1
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription, raise ValueError if it is not stored."""
+        path: list[tuple[_Node, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                raise ValueError(f"{subscription} is not subscribed")
+            path.append((node, level))
+            node = child
+        node.subscriptions.remove(subscription)
+        self._count -= 1
+
+        # Prune the branches which no longer hold any subscriptions
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.subscriptions or child.children:
+                break
+            del parent.children[level]
+
+    def subscriptions_for_filter(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions registered with exactly this topic filter."""
+        if (node := self._find(topic)) is None:
+            return []
+        return list(node.subscriptions)
+
+    def matches(self, topic: str) -> list[Subscription]:
+        """Return all subscriptions with a topic filter matching the topic."""
+        levels = topic.split("/")
+        depth = len(levels)
+        # Wildcards on the first level must not match topics starting with $
+        normal = not topic.startswith("$")
+        result: list[Subscription] = []
+        stack: list[tuple[_Node, int]] = [(self._root, 0)]
+
+        while stack:
+            node, idx = stack.pop()
+            children = node.children
+            wildcards_allowed = normal or idx > 0
+
+            if wildcards_allowed and (multi := children.get("#")) is not None:
+                result.extend(multi.subscriptions)
+
+            if idx == depth:
+                result.extend(node.subscriptions)
+                continue
+
+            if (child := children.get(levels[idx])) is not None:
+                stack.append((child, idx + 1))
+            if wildcards_allowed and (single := children.get("+")) is not None:
+                stack.append((single, idx + 1))
+
+        return result
+
+    def _find(self, topic: str) -> _Node | None:
+        """Return the node for a topic filter."""
+        node: _Node | None = self._root
+        for level in topic.split("/"):
+            if (node := node.children.get(level)) is None:  # type: ignore[union-attr]
+                return None
+        return node
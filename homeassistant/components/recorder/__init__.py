@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import abc
 import asyncio
+from collections import OrderedDict
 from collections.abc import Callable, Iterable
 import concurrent.futures
 from dataclasses import dataclass
@@ -54,6 +55,7 @@ from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
 
 from . import history, migration, purge, statistics, websocket_api
+from .bulk import PendingRows, write_pending_rows
 from .const import (
     CONF_DB_INTEGRITY_CHECK,
     DATA_INSTANCE,
@@ -65,6 +67,7 @@ from .models import (
     Base,
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     process_timestamp,
@@ -120,11 +123,17 @@ DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 1
+# Seconds a purge task may block the recorder before giving way to the queue
+DEFAULT_PURGE_TIME_BUDGET = 1.0
 KEEPALIVE_TIME = 30
 
-# Controls how often we clean up
-# States and Events objects
-EXPIRE_AFTER_COMMITS = 120
+# The number of attribute ids to cache in memory
+#
+# Based on:
+# - The number of overlapping attributes
+# - How frequently states with overlapping attributes will change
+# - How much memory our low end hardware has
+STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
 
 DB_LOCK_TIMEOUT = 30
 DB_LOCK_QUEUE_CHECK_TIMEOUT = 1
@@ -135,6 +144,7 @@ CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
+CONF_PURGE_TIME_BUDGET = "purge_time_budget"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
 
@@ -161,6 +171,9 @@ CONFIG_SCHEMA = vol.Schema(
                         vol.Coerce(int), vol.Range(min=1)
                     ),
                     vol.Optional(CONF_PURGE_INTERVAL, default=1): cv.positive_int,
+                    vol.Optional(
+                        CONF_PURGE_TIME_BUDGET, default=DEFAULT_PURGE_TIME_BUDGET
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0)),
                     vol.Optional(CONF_DB_URL): cv.string,
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
@@ -240,6 +253,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     entity_filter = convert_include_exclude_filter(conf)
     auto_purge = conf[CONF_AUTO_PURGE]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
+    purge_time_budget = conf[CONF_PURGE_TIME_BUDGET]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
@@ -257,6 +271,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         hass=hass,
         auto_purge=auto_purge,
         keep_days=keep_days,
+        purge_time_budget=purge_time_budget,
         commit_interval=commit_interval,
         uri=db_url,
         db_max_retries=db_max_retries,
@@ -371,16 +386,33 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
-        if purge.purge_old_data(
-            instance, self.purge_before, self.repack, self.apply_filter
+        # Commit pending states first so the attributes they
+        # refer to are seen as in use by the purge
+        instance._commit_event_session_or_retry()  # pylint: disable=[protected-access]
+        progress = instance.purge_progress
+        if (
+            progress is None
+            or progress.finished
+            or progress.purge_before != self.purge_before
         ):
-            # We always need to do the db cleanups after a purge
-            # is finished to ensure the WAL checkpoint and other
-            # tasks happen after a vacuum.
-            perodic_db_cleanups(instance)
-            return
-        # Schedule a new purge task if this one didn't finish
-        instance.queue.put(PurgeTask(self.purge_before, self.repack, self.apply_filter))
+            progress = instance.purge_progress = purge.PurgeProgress(self.purge_before)
+        # Purge batches until the time budget is used up, every batch is
+        # committed so the locks it holds are released
+        deadline = time.monotonic() + instance.purge_time_budget
+        while not purge.purge_old_data(
+            instance, self.purge_before, self.repack, self.apply_filter, progress
+        ):
+            if time.monotonic() >= deadline:
+                # Schedule a new purge task if this one didn't finish, the events
+                # queued in the meantime are recorded first
+                instance.queue.put(
+                    PurgeTask(self.purge_before, self.repack, self.apply_filter)
+                )
+                return
+        # We always need to do the db cleanups after a purge
+        # is finished to ensure the WAL checkpoint and other
+        # tasks happen after a vacuum.
+        perodic_db_cleanups(instance)
 
 
 @dataclass
@@ -391,6 +423,9 @@ class PurgeEntitiesTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge entities from the database."""
+        # Commit pending states first so the attributes they
+        # refer to are seen as in use by the purge
+        instance._commit_event_session_or_retry()  # pylint: disable=[protected-access]
         if purge.purge_entity_data(instance, self.entity_filter):
             return
         # Schedule a new purge task if this one didn't finish
@@ -414,6 +449,8 @@ class StatisticsTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Run statistics task."""
+        # Commit pending states first so they are included in the statistics
+        instance._commit_event_session_or_retry()  # pylint: disable=[protected-access]
         if statistics.compile_statistics(instance, self.start):
             return
         # Schedule a new statistics task if this one didn't finish
@@ -488,6 +525,7 @@ class Recorder(threading.Thread):
         hass: HomeAssistant,
         auto_purge: bool,
         keep_days: int,
+        purge_time_budget: float,
         commit_interval: int,
         uri: str,
         db_max_retries: int,
@@ -501,6 +539,8 @@ class Recorder(threading.Thread):
         self.hass = hass
         self.auto_purge = auto_purge
         self.keep_days = keep_days
+        self.purge_time_budget = purge_time_budget
+        self.purge_progress: purge.PurgeProgress | None = None
         self.commit_interval = commit_interval
         self.queue: queue.SimpleQueue[RecorderTask] = queue.SimpleQueue()
         self.recording_start = dt_util.utcnow()
@@ -517,10 +557,12 @@ class Recorder(threading.Thread):
         self.exclude_t = exclude_t
 
         self._timechanges_seen = 0
-        self._commits_without_expire = 0
         self._keepalive_count = 0
-        self._old_states: dict[str, States] = {}
-        self._pending_expunge: list[States] = []
+        self._old_state_ids: dict[str, int] = {}
+        self._state_attributes_ids: OrderedDict[str, int] = OrderedDict()
+        self._pending_rows = PendingRows()
+        # Index of the last pending state of each entity
+        self._pending_old_states: dict[str, int] = {}
         self.event_session = None
         self.get_session = None
         self._completed_first_database_setup = None
@@ -906,44 +948,113 @@ class Recorder(threading.Thread):
 
         try:
             if event.event_type == EVENT_STATE_CHANGED:
-                dbevent = Events.from_event(event, event_data="{}")
+                event_row = Events.row_from_event(event, event_data="{}")
             else:
-                dbevent = Events.from_event(event)
-            dbevent.created = event.time_fired
-            self.event_session.add(dbevent)
+                event_row = Events.row_from_event(event)
         except (TypeError, ValueError):
             _LOGGER.warning("Event is not JSON serializable: %s", event)
             return
 
         if event.event_type == EVENT_STATE_CHANGED:
             try:
-                dbstate = States.from_event(event)
-                has_new_state = event.data.get("new_state")
-                if dbstate.entity_id in self._old_states:
-                    old_state = self._old_states.pop(dbstate.entity_id)
-                    if old_state.state_id:
-                        dbstate.old_state_id = old_state.state_id
-                    else:
-                        dbstate.old_state = old_state
-                if not has_new_state:
-                    dbstate.state = None
-                dbstate.event = dbevent
-                dbstate.created = event.time_fired
-                self.event_session.add(dbstate)
-                if has_new_state:
-                    self._old_states[dbstate.entity_id] = dbstate
-                    self._pending_expunge.append(dbstate)
+                state_row = States.row_from_event(event)
+                shared_attrs = StateAttributes.shared_attrs_from_event(event)
             except (TypeError, ValueError):
                 _LOGGER.warning(
                     "State is not JSON serializable: %s",
                     event.data.get("new_state"),
                 )
+                self._pending_rows.add_event(event_row)
+            else:
+                self._add_pending_state(
+                    self._pending_rows.add_event(event_row),
+                    state_row,
+                    shared_attrs,
+                    event.data.get("new_state") is not None,
+                )
+        else:
+            self._pending_rows.add_event(event_row)
 
         # If they do not have a commit interval
         # than we commit right away
         if not self.commit_interval:
             self._commit_event_session_or_retry()
 
+    def _add_pending_state(
+        self,
+        event_index: int,
+        state_row: dict[str, Any],
+        shared_attrs: str,
+        has_new_state: bool,
+    ) -> None:
+        """Add a state row linked to its event, old state and attributes."""
+        entity_id = state_row["entity_id"]
+        old_state_index = self._pending_old_states.pop(entity_id, None)
+        if old_state_index is None:
+            state_row["old_state_id"] = self._old_state_ids.pop(entity_id, None)
+        else:
+            self._old_state_ids.pop(entity_id, None)
+        if not has_new_state:
+            state_row["state"] = None
+
+        attributes_index = self._set_state_attributes(state_row, shared_attrs)
+        index = self._pending_rows.add_state(
+            state_row, event_index, old_state_index, attributes_index
+        )
+        if has_new_state:
+            self._pending_old_states[entity_id] = index
+
+    def _set_state_attributes(
+        self, state_row: dict[str, Any], shared_attrs: str
+    ) -> int | None:
+        """Link the state to a shared attributes row, adding one if needed.
+
+        Return the index of the attributes if they are pending as well.
+        """
+        # Matching attributes added in the current commit interval
+        pending_index = self._pending_rows.state_attributes_index.get(shared_attrs)
+        if pending_index is not None:
+            return pending_index
+
+        # Matching attributes recently seen
+        if (attributes_id := self._state_attributes_ids.get(shared_attrs)) is not None:
+            self._state_attributes_ids.move_to_end(shared_attrs)
+            state_row["attributes_id"] = attributes_id
+            return None
+
+        # Matching attributes found in the database
+        attributes_row = StateAttributes.row_from_shared_attrs(shared_attrs)
+        if (
+            attributes_id := self._find_shared_attributes_in_db(
+                attributes_row["hash"], shared_attrs
+            )
+        ) is not None:
+            self._cache_state_attributes_id(shared_attrs, attributes_id)
+            state_row["attributes_id"] = attributes_id
+            return None
+
+        # No matching attributes found, save them in the database
+        return self._pending_rows.add_state_attributes(attributes_row)
+
+    def _find_shared_attributes_in_db(
+        self, attr_hash: int, shared_attrs: str
+    ) -> int | None:
+        """Find the id of shared attributes in the database."""
+        attributes = (
+            self.event_session.query(StateAttributes.attributes_id)
+            .filter(StateAttributes.hash == attr_hash)
+            .filter(StateAttributes.shared_attrs == shared_attrs)
+            .first()
+        )
+        return attributes[0] if attributes else None
+
+    def _cache_state_attributes_id(self, shared_attrs: str, attributes_id: int) -> None:
+        """Remember the id of shared attributes, evict the least recently used."""
+        self._state_attributes_ids[shared_attrs] = attributes_id
+        self._state_attributes_ids.move_to_end(shared_attrs)
+        if len(self._state_attributes_ids) > STATE_ATTRIBUTES_ID_CACHE_SIZE:
+            self._state_attributes_ids.popitem(last=False)
+
     def _handle_database_error(self, err):
         """Handle a database error that may result in moving away the corrupt db."""
         if isinstance(err.__cause__, sqlite3.DatabaseError):
@@ -956,7 +1067,11 @@ class Recorder(threading.Thread):
 
     def _commit_event_session_or_retry(self):
         """Commit the event session if there is work to do."""
-        if not self.event_session.new and not self.event_session.dirty:
+        if (
+            not self._pending_rows
+            and not self.event_session.new
+            and not self.event_session.dirty
+        ):
             return
         tries = 1
         while tries <= self.db_max_retries:
@@ -977,24 +1092,30 @@ class Recorder(threading.Thread):
                 time.sleep(self.db_retry_wait)
 
     def _commit_event_session(self):
-        self._commits_without_expire += 1
-
-        if self._pending_expunge:
-            self.event_session.flush()
-            for dbstate in self._pending_expunge:
-                # Expunge the state so its not expired
-                # until we use it later for dbstate.old_state
-                if dbstate in self.event_session:
-                    self.event_session.expunge(dbstate)
-            self._pending_expunge = []
+        pending_rows = self._pending_rows
+        if pending_rows:
+            try:
+                written_ids = write_pending_rows(
+                    self.event_session.connection(), pending_rows
+                )
+            except SQLAlchemyError:
+                # Rollback the partially written rows before the commit is retried
+                self.event_session.rollback()
+                raise
         self.event_session.commit()
 
-        # Expire is an expensive operation (frequently more expensive
-        # than the flush and commit itself) so we only
-        # do it after EXPIRE_AFTER_COMMITS commits
-        if self._commits_without_expire == EXPIRE_AFTER_COMMITS:
-            self._commits_without_expire = 0
-            self.event_session.expire_all()
+        if not pending_rows:
+            return
+
+        # The rows written in this commit now have an id
+        for shared_attrs, index in pending_rows.state_attributes_index.items():
+            self._cache_state_attributes_id(
+                shared_attrs, written_ids.attributes_ids[index]
+            )
+        for entity_id, index in self._pending_old_states.items():
+            self._old_state_ids[entity_id] = written_ids.state_ids[index]
+        self._pending_rows = PendingRows()
+        self._pending_old_states = {}
 
     def _handle_sqlite_corruption(self):
         """Handle the sqlite3 database being corrupt."""
@@ -1006,7 +1127,10 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self):
         """Close the event session."""
-        self._old_states = {}
+        self._old_state_ids = {}
+        self._state_attributes_ids = OrderedDict()
+        self._pending_rows = PendingRows()
+        self._pending_old_states = {}
 
         if not self.event_session:
             return
@@ -0,0 +1,142 @@
+"""Bulk write path for the events and states recorded in a commit interval."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql.schema import Column, Table
+
+from .models import Events, StateAttributes, States
+
+
+class PendingRows:
+    """Rows collected during a commit interval.
+
+    The rows are plain column values. Rows which refer to other rows written
+    in the same commit interval keep the index of that row in its list, the
+    index is resolved to the primary key once the referenced rows are written.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the pending rows."""
+        self.events: list[dict[str, Any]] = []
+        self.state_attributes: list[dict[str, Any]] = []
+        self.states: list[dict[str, Any]] = []
+        # Per state: index of its event, index of its old state if that is also
+        # pending and index of its attributes if they are also pending
+        self.state_links: list[tuple[int, int | None, int | None]] = []
+        # Indexes of the pending state attributes by their shared attributes
+        self.state_attributes_index: dict[str, int] = {}
+
+    def __bool__(self) -> bool:
+        """Return if there are rows to write."""
+        return bool(self.events)
+
+    def add_event(self, row: dict[str, Any]) -> int:
+        """Add an event row and return its index."""
+        self.events.append(row)
+        return len(self.events) - 1
+
+    def add_state_attributes(self, row: dict[str, Any]) -> int:
+        """Add a state attributes row and return its index."""
+        self.state_attributes.append(row)
+        index = self.state_attributes_index[row["shared_attrs"]] = (
+            len(self.state_attributes) - 1
+        )
+        return index
+
+    def add_state(
+        self,
+        row: dict[str, Any],
+        event_index: int,
+        old_state_index: int | None,
+        attributes_index: int | None,
+    ) -> int:
+        """Add a state row and return its index."""
+        self.states.append(row)
+        self.state_links.append((event_index, old_state_index, attributes_index))
+        return len(self.states) - 1
+
+
+@dataclass
+class WrittenIds:
+    """Primary keys assigned to the rows of a PendingRows, in the same order."""
+
+    event_ids: list[int]
+    attributes_ids: list[int]
+    state_ids: list[int]
+
+
+def write_pending_rows(connection: Connection, pending: PendingRows) -> WrittenIds:
+    """Write the pending rows with one executemany per table."""
+    event_ids = _insert_rows(
+        connection, Events.__table__, Events.event_id, pending.events
+    )
+    attributes_ids = _insert_rows(
+        connection,
+        StateAttributes.__table__,
+        StateAttributes.attributes_id,
+        pending.state_attributes,
+    )
+
+    old_state_links: list[tuple[int, int]] = []
+    for index, (row, (event_index, old_state_index, attributes_index)) in enumerate(
+        zip(pending.states, pending.state_links)
+    ):
+        row["event_id"] = event_ids[event_index]
+        if attributes_index is not None:
+            row["attributes_id"] = attributes_ids[attributes_index]
+        if old_state_index is not None:
+            old_state_links.append((index, old_state_index))
+
+    state_ids = _insert_rows(
+        connection, States.__table__, States.state_id, pending.states
+    )
+
+    # The old state of these states was written in this same batch, link them
+    # now that the ids of the new rows are known
+    if old_state_links:
+        connection.execute(
+            update(States.__table__)
+            .where(States.state_id == bindparam("b_state_id"))
+            .values(old_state_id=bindparam("b_old_state_id")),
+            [
+                {
+                    "b_state_id": state_ids[index],
+                    "b_old_state_id": state_ids[old_state_index],
+                }
+                for index, old_state_index in old_state_links
+            ],
+        )
+
+    return WrittenIds(event_ids, attributes_ids, state_ids)
+
+
+def _insert_rows(
+    connection: Connection, table: Table, id_column: Column, rows: list[dict[str, Any]]
+) -> list[int]:
+    """Insert rows with executemany and return their ids in insertion order.
+
+    Executemany does not report the generated primary keys. The recorder is the
+    only writer of these tables, so the rows inserted after the highest id
+    present before the insert are exactly the rows written here.
+    """
+    if not rows:
+        return []
+
+    last_id = connection.execute(select(func.max(id_column))).scalar() or 0
+    connection.execute(table.insert(), rows)
+    ids = [
+        row[0]
+        for row in connection.execute(
+            select(id_column).where(id_column > last_id).order_by(id_column)
+        )
+    ]
+    if len(ids) != len(rows):
+        raise SQLAlchemyError(
+            f"Wrote {len(rows)} rows to {table.name} but found {len(ids)} new rows"
+        )
+    return ids
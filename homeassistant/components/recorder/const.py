@@ -8,6 +8,10 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 
 MAX_QUEUE_BACKLOG = 30000
 
+# Sent with the start of the earliest changed hourly statistics, or None if any
+# statistics may have changed
+SIGNAL_STATISTICS_UPDATED = "recorder_statistics_updated"
+
 # The maximum number of rows (events) we purge in one delete statement
 
 # sqlite3 has a limit of 999 until version 3.32.0
@@ -0,0 +1,114 @@
+"""Downsample recorded state series for graphs."""
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+import math
+from typing import Any, TypeVar
+
+_RowT = TypeVar("_RowT")
+
+
+def largest_triangle_three_buckets(
+    xs: Sequence[float], ys: Sequence[float], threshold: int
+) -> list[int]:
+    """Return the indexes of the points selected by the LTTB algorithm.
+
+    The first and last point are always kept, the points in between are split
+    in threshold - 2 buckets and from each bucket the point forming the
+    largest triangle with the previously selected point and the average of
+    the next bucket is kept. This preserves the visual shape of the series.
+    """
+    count = len(xs)
+    if threshold >= count:
+        return list(range(count))
+    if threshold <= 2:
+        return [0, count - 1]
+
+    every = (count - 2) / (threshold - 2)
+    selected = 0
+    indexes = [0]
+
+    for bucket in range(threshold - 2):
+        avg_start = int((bucket + 1) * every) + 1
+        avg_end = min(int((bucket + 2) * every) + 1, count)
+        avg_len = avg_end - avg_start
+        avg_x = sum(xs[avg_start:avg_end]) / avg_len
+        avg_y = sum(ys[avg_start:avg_end]) / avg_len
+
+        point_x = xs[selected]
+        point_y = ys[selected]
+        max_area = -1.0
+        for idx in range(int(bucket * every) + 1, int((bucket + 1) * every) + 1):
+            area = abs(
+                (point_x - avg_x) * (ys[idx] - point_y)
+                - (point_x - xs[idx]) * (avg_y - point_y)
+            )
+            if area > max_area:
+                max_area = area
+                next_selected = idx
+        indexes.append(next_selected)
+        selected = next_selected
+
+    indexes.append(count - 1)
+    return indexes
+
+
+def downsample_states(
+    rows: Sequence[_RowT],
+    max_points: int,
+    get_state: Callable[[_RowT], Any],
+    get_timestamp: Callable[[_RowT], float],
+) -> list[_RowT]:
+    """Reduce a series of states sorted by time to about max_points.
+
+    Numeric states are downsampled with LTTB. Non numeric states, like
+    unavailable in a numeric series or all states of a binary sensor, are
+    kept where the state changes so no transition is lost.
+    """
+    if len(rows) <= max_points:
+        return list(rows)
+
+    values = [_numeric_value(get_state(row)) for row in rows]
+
+    keep: list[int] = []
+    # Runs of consecutive numeric states
+    runs: list[range] = []
+    run_start: int | None = None
+    prev_state = None
+    for idx, (row, value) in enumerate(zip(rows, values)):
+        if value is None:
+            if run_start is not None:
+                runs.append(range(run_start, idx))
+                run_start = None
+            if (state := get_state(row)) != prev_state:
+                keep.append(idx)
+            prev_state = state
+            continue
+        if run_start is None:
+            run_start = idx
+        prev_state = None
+    if run_start is not None:
+        runs.append(range(run_start, len(rows)))
+
+    if runs:
+        numeric_count = sum(len(run) for run in runs)
+        budget = max(max_points - len(keep), 0)
+        for run in runs:
+            threshold = max(round(budget * len(run) / numeric_count), 2)
+            xs = [get_timestamp(rows[idx]) for idx in run]
+            ys = [values[idx] for idx in run]
+            keep.extend(
+                run[idx] for idx in largest_triangle_three_buckets(xs, ys, threshold)
+            )
+        keep.sort()
+
+    return [rows[idx] for idx in keep]
+
+
+def _numeric_value(state: Any) -> float | None:
+    """Return the state as a finite float or None if it is not numeric."""
+    try:
+        value = float(state)
+    except (TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
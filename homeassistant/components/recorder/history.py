@@ -2,9 +2,12 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Iterator
 from itertools import groupby
+import json
 import logging
 import time
+from typing import Any
 
 from sqlalchemy import and_, bindparam, func
 from sqlalchemy.ext import baked
@@ -13,7 +16,14 @@ from homeassistant.components import recorder
 from homeassistant.core import split_entity_id
 import homeassistant.util.dt as dt_util
 
-from .models import LazyState, States, process_timestamp_to_utc_isoformat
+from .downsample import downsample_states
+from .models import (
+    LazyState,
+    StateAttributes,
+    States,
+    process_timestamp,
+    process_timestamp_to_utc_isoformat,
+)
 from .util import execute, session_scope
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -44,12 +54,23 @@ QUERY_STATES = [
     States.entity_id,
     States.state,
     States.attributes,
+    StateAttributes.shared_attrs,
     States.last_changed,
     States.last_updated,
 ]
 
 HISTORY_BAKERY = "recorder_history_bakery"
 
+# Number of rows fetched from the cursor at a time when streaming
+COLUMNAR_YIELD_PER = 1000
+
+
+def _query_states(session):
+    """Query the states joined with their shared attributes."""
+    return session.query(*QUERY_STATES).outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
+
 
 def async_setup(hass):
     """Set up the history hooks."""
@@ -72,6 +93,7 @@ def get_significant_states_with_session(
     include_start_time_state=True,
     significant_changes_only=True,
     minimal_response=False,
+    max_points=None,
 ):
     """
     Return states changes during UTC period start_time - end_time.
@@ -84,13 +106,53 @@ def get_significant_states_with_session(
     Significant states are all states where there is a state change,
     as well as all states from certain domains (for instance
     thermostat so that we get current temperature in our graphs).
+
+    max_points optionally downsamples the states of each entity to about
+    that many points.
     """
     timer_start = time.perf_counter()
 
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
+    states = execute(
+        _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            significant_changes_only,
+        )
+    )
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug("get_significant_states took %fs", elapsed)
+
+    return _sorted_states_to_dict(
+        hass,
+        session,
+        states,
+        start_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        minimal_response,
+        max_points,
     )
 
+
+def _significant_states_query(
+    hass,
+    session,
+    start_time,
+    end_time,
+    entity_ids,
+    filters,
+    significant_changes_only,
+):
+    """Query the significant states sorted by entity_id and last_updated."""
+    baked_query = hass.data[HISTORY_BAKERY](_query_states)
+
     if significant_changes_only:
         baked_query += lambda q: q.filter(
             (
@@ -116,34 +178,126 @@ def get_significant_states_with_session(
 
     baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
 
-    states = execute(
-        baked_query(session).params(
-            start_time=start_time, end_time=end_time, entity_ids=entity_ids
-        )
+    return baked_query(session).params(
+        start_time=start_time, end_time=end_time, entity_ids=entity_ids
     )
 
-    if _LOGGER.isEnabledFor(logging.DEBUG):
-        elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("get_significant_states took %fs", elapsed)
 
-    return _sorted_states_to_dict(
+def stream_significant_states_columnar(
+    hass,
+    session,
+    start_time,
+    end_time=None,
+    entity_ids=None,
+    filters=None,
+    include_start_time_state=True,
+    significant_changes_only=True,
+    max_points=None,
+) -> Iterator[dict[str, Any]]:
+    """Yield the significant states of one entity at a time as parallel arrays.
+
+    Rows are read from the cursor in batches and appended to the arrays of
+    their entity without creating a state object per row. Each yielded dict
+    holds the entity_id, the last_updated timestamps as epoch floats, the
+    states and the attributes as [index, attributes] pairs, only for the rows
+    where the attributes differ from the previous row. last_changed is given
+    as [index, timestamp] pairs for the rows where it differs from
+    last_updated.
+
+    Entities are yielded sorted by entity_id, entities which only have a
+    state at the start time come last. max_points optionally downsamples the
+    states of each entity to about that many points.
+    """
+    initial_rows = {}
+    if include_start_time_state:
+        run = recorder.run_information_from_instance(hass, start_time)
+        initial_rows = {
+            row.entity_id: row
+            for row in _get_state_rows_with_session(
+                hass, session, start_time, entity_ids, run=run, filters=filters
+            )
+        }
+    start_timestamp = process_timestamp(start_time).timestamp()
+
+    query = _significant_states_query(
         hass,
         session,
-        states,
         start_time,
+        end_time,
         entity_ids,
         filters,
-        include_start_time_state,
-        minimal_response,
+        significant_changes_only,
+    ).with_post_criteria(lambda q: q.yield_per(COLUMNAR_YIELD_PER))
+
+    for ent_id, group in groupby(query, lambda row: row.entity_id):
+        columns = _ColumnarStates(ent_id)
+        if (initial_row := initial_rows.pop(ent_id, None)) is not None:
+            columns.append(initial_row, start_timestamp, start_timestamp)
+        if max_points:
+            group = _downsample_rows(group, max_points)
+        for row in group:
+            columns.append(
+                row,
+                process_timestamp(row.last_updated).timestamp(),
+                process_timestamp(row.last_changed).timestamp(),
+            )
+        yield columns.as_dict()
+
+    for ent_id, initial_row in initial_rows.items():
+        columns = _ColumnarStates(ent_id)
+        columns.append(initial_row, start_timestamp, start_timestamp)
+        yield columns.as_dict()
+
+
+class _ColumnarStates:
+    """Parallel arrays of the states of one entity."""
+
+    __slots__ = (
+        "entity_id",
+        "last_updated",
+        "states",
+        "attributes",
+        "last_changed",
+        "_prev_attrs",
     )
 
+    def __init__(self, entity_id: str) -> None:
+        """Initialize the arrays."""
+        self.entity_id = entity_id
+        self.last_updated: list[float] = []
+        self.states: list[str] = []
+        self.attributes: list[tuple[int, dict[str, Any]]] = []
+        self.last_changed: list[tuple[int, float]] = []
+        self._prev_attrs: str | None = None
+
+    def append(self, row, last_updated: float, last_changed: float) -> None:
+        """Append a state row."""
+        index = len(self.states)
+        self.last_updated.append(last_updated)
+        self.states.append(row.state)
+        if last_changed != last_updated:
+            self.last_changed.append((index, last_changed))
+        # Compare the json encoded attributes to only decode changed ones
+        attrs = row.shared_attrs or row.attributes
+        if attrs != self._prev_attrs:
+            self._prev_attrs = attrs
+            self.attributes.append((index, json.loads(attrs) if attrs else {}))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the arrays as a JSON friendly dict."""
+        return {
+            "entity_id": self.entity_id,
+            "last_updated": self.last_updated,
+            "state": self.states,
+            "attributes": self.attributes,
+            "last_changed": self.last_changed,
+        }
+
 
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](_query_states)
 
         baked_query += lambda q: q.filter(
             (States.last_changed == States.last_updated)
@@ -156,7 +310,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
             )
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
@@ -177,13 +333,13 @@ def get_last_state_changes(hass, number_of_states, entity_id):
     start_time = dt_util.utcnow()
 
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](_query_states)
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(
@@ -229,8 +385,20 @@ def _get_states_with_session(
     hass, session, utc_point_in_time, entity_ids=None, run=None, filters=None
 ):
     """Return the states at a specific point in time."""
+    return [
+        LazyState(row)
+        for row in _get_state_rows_with_session(
+            hass, session, utc_point_in_time, entity_ids, run, filters
+        )
+    ]
+
+
+def _get_state_rows_with_session(
+    hass, session, utc_point_in_time, entity_ids=None, run=None, filters=None
+):
+    """Return the state rows at a specific point in time."""
     if entity_ids and len(entity_ids) == 1:
-        return _get_single_entity_states_with_session(
+        return _get_single_entity_state_rows_with_session(
             hass, session, utc_point_in_time, entity_ids[0]
         )
 
@@ -243,7 +411,7 @@ def _get_states_with_session(
 
     # We have more than one entity to look at so we need to do a query on states
     # since the last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = _query_states(session)
 
     if entity_ids:
         # We got an include-list of entities, accelerate the query by filtering already
@@ -302,15 +470,15 @@ def _get_states_with_session(
         if filters:
             query = filters.apply(query)
 
-    return [LazyState(row) for row in execute(query)]
+    return execute(query)
 
 
-def _get_single_entity_states_with_session(hass, session, utc_point_in_time, entity_id):
+def _get_single_entity_state_rows_with_session(
+    hass, session, utc_point_in_time, entity_id
+):
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
-    )
+    baked_query = hass.data[HISTORY_BAKERY](_query_states)
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
         States.entity_id == bindparam("entity_id"),
@@ -322,7 +490,7 @@ def _get_single_entity_states_with_session(hass, session, utc_point_in_time, ent
         utc_point_in_time=utc_point_in_time, entity_id=entity_id
     )
 
-    return [LazyState(row) for row in execute(query)]
+    return execute(query)
 
 
 def _sorted_states_to_dict(
@@ -334,6 +502,7 @@ def _sorted_states_to_dict(
     filters=None,
     include_start_time_state=True,
     minimal_response=False,
+    max_points=None,
 ):
     """Convert SQL results into JSON friendly data structure.
 
@@ -373,6 +542,8 @@ def _sorted_states_to_dict(
 
     # Append all changes to it
     for ent_id, group in groupby(states, lambda state: state.entity_id):
+        if max_points:
+            group = iter(_downsample_rows(group, max_points))
         domain = split_entity_id(ent_id)[0]
         ent_results = result[ent_id]
         if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
@@ -414,6 +585,16 @@ def _sorted_states_to_dict(
     return {key: val for key, val in result.items() if val}
 
 
+def _downsample_rows(rows, max_points):
+    """Downsample the state rows of one entity."""
+    return downsample_states(
+        list(rows),
+        max_points,
+        lambda row: row.state,
+        lambda row: process_timestamp(row.last_updated).timestamp(),
+    )
+
+
 def get_state(hass, utc_point_in_time, entity_id, run=None):
     """Return a state at a specific point in time."""
     states = get_states(hass, utc_point_in_time, (entity_id,), run)
@@ -25,7 +25,7 @@ from .models import (
     StatisticsShortTerm,
     process_timestamp,
 )
-from .statistics import delete_duplicates, get_start_time
+from .statistics import compile_statistics_rollups, delete_duplicates, get_start_time
 from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
@@ -603,7 +603,21 @@ def _apply_update(instance, session, new_version, old_version):  # noqa: C901
             "statistics_short_term",
             "ix_statistics_short_term_statistic_id_start",
         )
-
+    elif new_version == 25:
+        # The state_attributes table is created by create_all, link states to it.
+        # Existing states keep their attributes in the states table until purged.
+        _add_columns(connection, "states", ["attributes_id INTEGER"])
+        _create_index(connection, "states", "ix_states_attributes_id")
+    elif new_version == 26:
+        # The statistics_daily and statistics_monthly tables are created by
+        # create_all, compile them from the existing hourly statistics.
+        compile_statistics_rollups(
+            session,
+            (
+                process_timestamp(start)
+                for (start,) in session.query(Statistics.start).distinct()
+            ),
+        )
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
@@ -2,16 +2,27 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime
 import logging
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import func
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import distinct
 
+import homeassistant.util.dt as dt_util
+
 from .const import MAX_ROWS_TO_PURGE
-from .models import Events, RecorderRuns, States, StatisticsRuns, StatisticsShortTerm
+from .models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+    StatisticsRuns,
+    StatisticsShortTerm,
+)
 from .repack import repack_database
 from .util import retryable_database_job, session_scope
 
@@ -21,9 +32,46 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass
+class PurgeProgress:
+    """Progress of purging the data older than purge_before."""
+
+    purge_before: datetime
+    started: datetime = field(default_factory=dt_util.utcnow)
+    # Events and states deleted so far
+    rows_purged: int = 0
+    # Seconds spent purging, not counting the time between the batches
+    purge_time: float = 0.0
+    # Estimated number of events left to purge
+    events_remaining: int | None = None
+    finished: bool = False
+
+    @property
+    def rows_per_second(self) -> float | None:
+        """Return the number of rows purged per second spent purging."""
+        if not self.purge_time:
+            return None
+        return self.rows_purged / self.purge_time
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the progress."""
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "started": self.started.isoformat(),
+            "rows_purged": self.rows_purged,
+            "rows_per_second": self.rows_per_second,
+            "events_remaining": self.events_remaining,
+            "finished": self.finished,
+        }
+
+
 @retryable_database_job("purge")
 def purge_old_data(
-    instance: Recorder, purge_before: datetime, repack: bool, apply_filter: bool = False
+    instance: Recorder,
+    purge_before: datetime,
+    repack: bool,
+    apply_filter: bool = False,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge events and states older than purge_before.
 
@@ -33,11 +81,19 @@ def purge_old_data(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    batch_start = time.monotonic()
 
     with session_scope(session=instance.get_session()) as session:  # type: ignore
         # Purge a max of MAX_ROWS_TO_PURGE, based on the oldest states or events record
         event_ids = _select_event_ids_to_purge(session, purge_before)
-        state_ids = _select_state_ids_to_purge(session, purge_before, event_ids)
+        state_ids, attributes_ids = _select_state_and_attributes_ids_to_purge(
+            session, purge_before, event_ids
+        )
+        if progress is not None:
+            progress.rows_purged += len(event_ids) + len(state_ids)
+            progress.events_remaining = max(
+                _estimate_events_to_purge(session, purge_before) - len(event_ids), 0
+            )
         statistics_runs = _select_statistics_runs_to_purge(session, purge_before)
         short_term_statistics = _select_short_term_statistics_to_purge(
             session, purge_before
@@ -46,6 +102,9 @@ def purge_old_data(
         if state_ids:
             _purge_state_ids(instance, session, state_ids)
 
+        if attributes_ids:
+            _purge_unused_attributes_ids(instance, session, attributes_ids)
+
         if event_ids:
             _purge_event_ids(session, event_ids)
 
@@ -58,23 +117,40 @@ def purge_old_data(
         if event_ids or statistics_runs or short_term_statistics:
             # Return false, as we might not be done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
+            _add_purge_time(progress, batch_start)
             return False
 
         if apply_filter and _purge_filtered_data(instance, session) is False:
             _LOGGER.debug("Cleanup filtered data hasn't fully completed yet")
+            _add_purge_time(progress, batch_start)
             return False
 
         _purge_old_recorder_runs(instance, session, purge_before)
     if repack:
         repack_database(instance)
+    _add_purge_time(progress, batch_start)
+    if progress is not None:
+        progress.finished = True
     return True
 
 
+def _add_purge_time(progress: PurgeProgress | None, batch_start: float) -> None:
+    """Add the time spent on a purge batch to the progress."""
+    if progress is not None:
+        progress.purge_time += time.monotonic() - batch_start
+
+
 def _select_event_ids_to_purge(session: Session, purge_before: datetime) -> list[int]:
-    """Return a list of event ids to purge."""
+    """Return a list of event ids to purge.
+
+    The events are the oldest ones, ordering by time_fired makes the selection
+    a range scan of the time_fired index which stops after MAX_ROWS_TO_PURGE
+    rows, instead of a scan of all rows older than purge_before.
+    """
     events = (
         session.query(Events.event_id)
         .filter(Events.time_fired < purge_before)
+        .order_by(Events.time_fired)
         .limit(MAX_ROWS_TO_PURGE)
         .all()
     )
@@ -82,20 +158,48 @@ def _select_event_ids_to_purge(session: Session, purge_before: datetime) -> list
     return [event.event_id for event in events]
 
 
-def _select_state_ids_to_purge(
+def _estimate_events_to_purge(session: Session, purge_before: datetime) -> int:
+    """Estimate the number of events older than purge_before from their ids.
+
+    Counting the rows would scan the index, the ids of the oldest event and of
+    the newest event to purge are found with a single index lookup each.
+    """
+    newest_id = (
+        session.query(Events.event_id)
+        .filter(Events.time_fired < purge_before)
+        .order_by(Events.time_fired.desc())
+        .limit(1)
+        .scalar()
+    )
+    if newest_id is None:
+        return 0
+    oldest_id = session.query(func.min(Events.event_id)).scalar()
+    return max(newest_id - oldest_id + 1, 0)
+
+
+def _select_state_and_attributes_ids_to_purge(
     session: Session, purge_before: datetime, event_ids: list[int]
-) -> set[int]:
-    """Return a list of state ids to purge."""
+) -> tuple[dict[int, str], set[int]]:
+    """Return the state ids and the attributes ids they refer to to purge.
+
+    The state ids map to the entity ids of the states.
+    """
     if not event_ids:
-        return set()
+        return {}, set()
     states = (
-        session.query(States.state_id)
+        session.query(States.state_id, States.entity_id, States.attributes_id)
         .filter(States.last_updated < purge_before)
         .filter(States.event_id.in_(event_ids))
         .all()
     )
     _LOGGER.debug("Selected %s state ids to remove", len(states))
-    return {state.state_id for state in states}
+    state_ids = {}
+    attributes_ids = set()
+    for state in states:
+        state_ids[state.state_id] = state.entity_id
+        if state.attributes_id:
+            attributes_ids.add(state.attributes_id)
+    return state_ids, attributes_ids
 
 
 def _select_statistics_runs_to_purge(
@@ -133,8 +237,13 @@ def _select_short_term_statistics_to_purge(
     return [statistic.id for statistic in statistics]
 
 
-def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int]) -> None:
-    """Disconnect states and delete by state id."""
+def _purge_state_ids(
+    instance: Recorder, session: Session, state_ids: dict[int, str]
+) -> None:
+    """Disconnect states and delete by state id.
+
+    The state ids map to the entity ids of the states.
+    """
 
     # Update old_state_id to NULL before deleting to ensure
     # the delete does not fail due to a foreign key constraint
@@ -142,14 +251,14 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
     # for us.
     disconnected_rows = (
         session.query(States)
-        .filter(States.old_state_id.in_(state_ids))
+        .filter(States.old_state_id.in_(list(state_ids)))
         .update({"old_state_id": None}, synchronize_session=False)
     )
     _LOGGER.debug("Updated %s states to remove old_state_id", disconnected_rows)
 
     deleted_rows = (
         session.query(States)
-        .filter(States.state_id.in_(state_ids))
+        .filter(States.state_id.in_(list(state_ids)))
         .delete(synchronize_session=False)
     )
     _LOGGER.debug("Deleted %s states", deleted_rows)
@@ -159,20 +268,62 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
 
 
 def _evict_purged_states_from_old_states_cache(
-    instance: Recorder, purged_state_ids: set[int]
+    instance: Recorder, purged_state_ids: dict[int, str]
 ) -> None:
     """Evict purged states from the old states cache."""
-    # Make a map from old_state_id to entity_id
-    old_states = instance._old_states  # pylint: disable=protected-access
-    old_state_reversed = {
-        old_state.state_id: entity_id
-        for entity_id, old_state in old_states.items()
-        if old_state.state_id
+    old_state_ids = instance._old_state_ids  # pylint: disable=protected-access
+    for purged_state_id, entity_id in purged_state_ids.items():
+        if old_state_ids.get(entity_id) == purged_state_id:
+            del old_state_ids[entity_id]
+
+
+def _purge_unused_attributes_ids(
+    instance: Recorder, session: Session, attributes_ids: set[int]
+) -> None:
+    """Delete the attributes which are no longer referred to by any state."""
+    # The states have already been purged, only attributes ids that are
+    # not used by any of the remaining states can be deleted.
+    still_used = {
+        state.attributes_id
+        for state in session.query(States.attributes_id)
+        .filter(States.attributes_id.in_(attributes_ids))
+        .distinct()
+        .all()
     }
+    if not (unused_attributes_ids := attributes_ids - still_used):
+        return
 
-    # Evict any purged state from the old states cache
-    for purged_state_id in purged_state_ids.intersection(old_state_reversed):
-        old_states.pop(old_state_reversed[purged_state_id], None)
+    deleted_rows = (
+        session.query(StateAttributes)
+        .filter(StateAttributes.attributes_id.in_(unused_attributes_ids))
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s attribute states", deleted_rows)
+
+    # Evict any entries in the state_attributes_ids cache referring to a purged row
+    _evict_purged_attributes_from_attributes_cache(instance, unused_attributes_ids)
+
+
+def _evict_purged_attributes_from_attributes_cache(
+    instance: Recorder, purged_attributes_ids: set[int]
+) -> None:
+    """Evict purged attribute ids from the attribute ids cache."""
+    # Make a map from attributes_id to the shared attributes
+    state_attributes_ids = (
+        instance._state_attributes_ids  # pylint: disable=protected-access
+    )
+    state_attributes_ids_reversed = {
+        attributes_id: shared_attrs
+        for shared_attrs, attributes_id in state_attributes_ids.items()
+    }
+
+    # Evict any purged attributes from the attribute ids cache
+    for purged_attribute_id in purged_attributes_ids.intersection(
+        state_attributes_ids_reversed
+    ):
+        state_attributes_ids.pop(
+            state_attributes_ids_reversed[purged_attribute_id], None
+        )
 
 
 def _purge_statistics_runs(session: Session, statistics_runs: list[int]) -> None:
@@ -253,10 +404,14 @@ def _purge_filtered_states(
 ) -> None:
     """Remove filtered states and linked events."""
     state_ids: list[int]
+    entity_ids: list[str]
     event_ids: list[int | None]
-    state_ids, event_ids = zip(
+    attributes_ids: list[int | None]
+    state_ids, entity_ids, event_ids, attributes_ids = zip(
         *(
-            session.query(States.state_id, States.event_id)
+            session.query(
+                States.state_id, States.entity_id, States.event_id, States.attributes_id
+            )
             .filter(States.entity_id.in_(excluded_entity_ids))
             .limit(MAX_ROWS_TO_PURGE)
             .all()
@@ -266,8 +421,10 @@ def _purge_filtered_states(
     _LOGGER.debug(
         "Selected %s state_ids to remove that should be filtered", len(state_ids)
     )
-    _purge_state_ids(instance, session, set(state_ids))
+    _purge_state_ids(instance, session, dict(zip(state_ids, entity_ids)))
     _purge_event_ids(session, event_ids)  # type: ignore  # type of event_ids already narrowed to 'list[int]'
+    if unique_attributes_ids := {id_ for id_ in attributes_ids if id_ is not None}:
+        _purge_unused_attributes_ids(instance, session, unique_attributes_ids)
 
 
 def _purge_filtered_events(
@@ -285,11 +442,18 @@ def _purge_filtered_events(
         "Selected %s event_ids to remove that should be filtered", len(event_ids)
     )
     states: list[States] = (
-        session.query(States.state_id).filter(States.event_id.in_(event_ids)).all()
+        session.query(States.state_id, States.entity_id, States.attributes_id)
+        .filter(States.event_id.in_(event_ids))
+        .all()
     )
-    state_ids: set[int] = {state.state_id for state in states}
+    state_ids: dict[int, str] = {state.state_id: state.entity_id for state in states}
+    attributes_ids: set[int] = {
+        state.attributes_id for state in states if state.attributes_id
+    }
     _purge_state_ids(instance, session, state_ids)
     _purge_event_ids(session, event_ids)
+    if attributes_ids:
+        _purge_unused_attributes_ids(instance, session, attributes_ids)
 
 
 @retryable_database_job("purge")
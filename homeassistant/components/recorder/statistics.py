@@ -1,7 +1,7 @@
 """Statistics helper."""
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from collections.abc import Callable, Iterable
 import contextlib
 import dataclasses
@@ -21,6 +21,7 @@ from sqlalchemy.orm.scoping import scoped_session
 from sqlalchemy.sql.expression import literal_column, true
 
 from homeassistant.const import (
+    EVENT_CORE_CONFIG_UPDATE,
     PRESSURE_PA,
     TEMP_CELSIUS,
     VOLUME_CUBIC_FEET,
@@ -29,6 +30,10 @@ from homeassistant.const import (
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    dispatcher_send,
+)
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.storage import STORAGE_DIR
 import homeassistant.util.dt as dt_util
@@ -37,13 +42,20 @@ import homeassistant.util.temperature as temperature_util
 from homeassistant.util.unit_system import UnitSystem
 import homeassistant.util.volume as volume_util
 
-from .const import DATA_INSTANCE, DOMAIN, MAX_ROWS_TO_PURGE
+from .const import (
+    DATA_INSTANCE,
+    DOMAIN,
+    MAX_ROWS_TO_PURGE,
+    SIGNAL_STATISTICS_UPDATED,
+)
 from .models import (
     StatisticData,
     StatisticMetaData,
     StatisticResult,
     Statistics,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
     process_timestamp,
@@ -76,6 +88,28 @@ QUERY_STATISTICS_SHORT_TERM = [
     StatisticsShortTerm.sum,
 ]
 
+QUERY_STATISTICS_DAILY = [
+    StatisticsDaily.metadata_id,
+    StatisticsDaily.start,
+    StatisticsDaily.mean,
+    StatisticsDaily.min,
+    StatisticsDaily.max,
+    StatisticsDaily.last_reset,
+    StatisticsDaily.state,
+    StatisticsDaily.sum,
+]
+
+QUERY_STATISTICS_MONTHLY = [
+    StatisticsMonthly.metadata_id,
+    StatisticsMonthly.start,
+    StatisticsMonthly.mean,
+    StatisticsMonthly.min,
+    StatisticsMonthly.max,
+    StatisticsMonthly.last_reset,
+    StatisticsMonthly.state,
+    StatisticsMonthly.sum,
+]
+
 QUERY_STATISTICS_SUMMARY_MEAN = [
     StatisticsShortTerm.metadata_id,
     func.avg(StatisticsShortTerm.mean),
@@ -104,6 +138,25 @@ QUERY_STATISTICS_SUMMARY_SUM_LEGACY = [
     StatisticsShortTerm.sum,
 ]
 
+QUERY_STATISTICS_ROLLUP_MEAN = [
+    Statistics.metadata_id,
+    func.avg(Statistics.mean),
+    func.min(Statistics.min),
+    func.max(Statistics.max),
+]
+
+QUERY_STATISTICS_ROLLUP_LAST_START = [
+    Statistics.metadata_id,
+    func.max(Statistics.start).label("last_start"),
+]
+
+QUERY_STATISTICS_ROLLUP_SUM = [
+    Statistics.metadata_id,
+    Statistics.last_reset,
+    Statistics.state,
+    Statistics.sum,
+]
+
 QUERY_STATISTIC_META = [
     StatisticsMeta.id,
     StatisticsMeta.statistic_id,
@@ -121,8 +174,14 @@ QUERY_STATISTIC_META_ID = [
 
 MAX_DUPLICATES = 1000000
 
+# The number of statistics_during_period results kept by the StatisticsCache
+MAX_CACHED_STATISTICS = 32
+
 STATISTICS_BAKERY = "recorder_statistics_bakery"
+STATISTICS_CACHE = "recorder_statistics_cache"
+STATISTICS_DAILY_BAKERY = "recorder_statistics_daily_bakery"
 STATISTICS_META_BAKERY = "recorder_statistics_meta_bakery"
+STATISTICS_MONTHLY_BAKERY = "recorder_statistics_monthly_bakery"
 STATISTICS_SHORT_TERM_BAKERY = "recorder_statistics_short_term_bakery"
 
 
@@ -180,8 +239,11 @@ class ValidationIssue:
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the history hooks."""
     hass.data[STATISTICS_BAKERY] = baked.bakery()
+    hass.data[STATISTICS_DAILY_BAKERY] = baked.bakery()
     hass.data[STATISTICS_META_BAKERY] = baked.bakery()
+    hass.data[STATISTICS_MONTHLY_BAKERY] = baked.bakery()
     hass.data[STATISTICS_SHORT_TERM_BAKERY] = baked.bakery()
+    hass.data[STATISTICS_CACHE] = StatisticsCache(hass)
 
     def entity_id_changed(event: Event) -> None:
         """Handle entity_id changed."""
@@ -192,6 +254,7 @@ def async_setup(hass: HomeAssistant) -> None:
                 (StatisticsMeta.statistic_id == old_entity_id)
                 & (StatisticsMeta.source == DOMAIN)
             ).update({StatisticsMeta.statistic_id: entity_id})
+        dispatcher_send(hass, SIGNAL_STATISTICS_UPDATED, None)
 
     @callback
     def entity_registry_changed_filter(event: Event) -> bool:
@@ -526,6 +589,10 @@ def compile_hourly_statistics(
     for metadata_id, stat in summary.items():
         session.add(Statistics.from_stats(metadata_id, stat))
 
+    # Update the daily and monthly statistics of the day and month of the hour
+    if summary:
+        compile_statistics_rollups(session, (start_time,))
+
 
 @retryable_database_job("statistics")
 def compile_statistics(instance: Recorder, start: datetime) -> bool:
@@ -574,6 +641,11 @@ def compile_statistics(instance: Recorder, start: datetime) -> bool:
 
         session.add(StatisticsRuns(start=start))
 
+    if start.minute == 55:
+        dispatcher_send(
+            instance.hass, SIGNAL_STATISTICS_UPDATED, start.replace(minute=0)
+        )
+
     return True
 
 
@@ -596,7 +668,7 @@ def _insert_statistics(
 
 def _update_statistics(
     session: scoped_session,
-    table: type[Statistics | StatisticsShortTerm],
+    table: type[Statistics | StatisticsShortTerm | StatisticsDaily | StatisticsMonthly],
     stat_id: int,
     statistic: StatisticData,
 ) -> None:
@@ -621,6 +693,98 @@ def _update_statistics(
         )
 
 
+def compile_statistics_rollups(
+    session: scoped_session,
+    starts: Iterable[datetime],
+    metadata_id: int | None = None,
+) -> None:
+    """Compile daily and monthly statistics of the periods the starts fall within.
+
+    Each period is compiled in full from the hourly statistics, this keeps the
+    rollups identical to reducing the hourly statistics when they are queried.
+    If metadata_id is given, only that statistic is compiled.
+    """
+    # Flush the pending hourly statistics before querying them, this lets errors
+    # like duplicated rows surface here rather than within a query retry loop
+    session.flush()
+    starts = list(starts)
+    for table, period_start_end in STATISTICS_ROLLUPS.items():
+        for start, end in sorted({period_start_end(start) for start in starts}):
+            _compile_statistics_rollup(session, table, start, end, metadata_id)
+
+
+def _compile_statistics_rollup(
+    session: scoped_session,
+    table: type[StatisticsDaily | StatisticsMonthly],
+    start: datetime,
+    end: datetime,
+    metadata_id: int | None,
+) -> None:
+    """Compile the hourly statistics during start - end into a rollup table.
+
+    - average, min max is computed by a database query
+    - sum is taken from the last hourly entry during the period
+    """
+    filters = [Statistics.start >= start, Statistics.start < end]
+    if metadata_id is not None:
+        filters.append(Statistics.metadata_id == metadata_id)
+
+    summary: dict[int, StatisticData] = {}
+    for stat_metadata_id, _mean, _min, _max in execute(
+        session.query(*QUERY_STATISTICS_ROLLUP_MEAN)
+        .filter(*filters)
+        .group_by(Statistics.metadata_id)
+    ):
+        summary[stat_metadata_id] = {
+            "start": start,
+            "mean": _mean,
+            "min": _min,
+            "max": _max,
+        }
+
+    last_start = (
+        session.query(*QUERY_STATISTICS_ROLLUP_LAST_START)
+        .filter(*filters)
+        .group_by(Statistics.metadata_id)
+        .subquery()
+    )
+    for stat_metadata_id, last_reset, state, _sum in execute(
+        session.query(*QUERY_STATISTICS_ROLLUP_SUM).join(
+            last_start,
+            (Statistics.metadata_id == last_start.c.metadata_id)
+            & (Statistics.start == last_start.c.last_start),
+        )
+    ):
+        summary[stat_metadata_id].update(
+            {
+                "last_reset": process_timestamp(last_reset),
+                "state": state,
+                "sum": _sum,
+            }
+        )
+
+    # Rollups compiled for another time zone do not start at the period start
+    stale_query = session.query(table).filter(
+        (table.start > start) & (table.start < end)
+    )
+    existing_query = session.query(table.id, table.metadata_id).filter(
+        table.start == start
+    )
+    if metadata_id is not None:
+        stale_query = stale_query.filter(table.metadata_id == metadata_id)
+        existing_query = existing_query.filter(table.metadata_id == metadata_id)
+    stale_query.delete(synchronize_session=False)
+    existing = {
+        stat_metadata_id: stat_id for stat_id, stat_metadata_id in existing_query
+    }
+
+    for stat_metadata_id, stat in summary.items():
+        if stat_id := existing.get(stat_metadata_id):
+            _update_statistics(session, table, stat_id, stat)
+        else:
+            session.add(table.from_stats(stat_metadata_id, stat))
+
+
 def get_metadata_with_session(
     hass: HomeAssistant,
     session: scoped_session,
@@ -714,6 +878,7 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
         session.query(StatisticsMeta).filter(
             StatisticsMeta.statistic_id.in_(statistic_ids)
         ).delete(synchronize_session=False)
+    dispatcher_send(instance.hass, SIGNAL_STATISTICS_UPDATED, None)
 
 
 def update_statistics_metadata(
@@ -724,6 +889,7 @@ def update_statistics_metadata(
         session.query(StatisticsMeta).filter(
             StatisticsMeta.statistic_id == statistic_id
         ).update({StatisticsMeta.unit_of_measurement: unit_of_measurement})
+    dispatcher_send(instance.hass, SIGNAL_STATISTICS_UPDATED, None)
 
 
 def list_statistic_ids(
@@ -793,7 +959,7 @@ def _statistics_during_period_query(
     statistic_ids: list[str] | None,
     bakery: Any,
     base_query: Iterable,
-    table: type[Statistics | StatisticsShortTerm],
+    table: type[Statistics | StatisticsShortTerm | StatisticsDaily | StatisticsMonthly],
 ) -> Callable:
     """Prepare a database query for statistics during a given period.
 
@@ -872,10 +1038,11 @@ def same_day(time1: datetime, time2: datetime) -> bool:
 
 def day_start_end(time: datetime) -> tuple[datetime, datetime]:
     """Return the start and end of the period (day) time is within."""
-    start = dt_util.as_utc(
-        dt_util.as_local(time).replace(hour=0, minute=0, second=0, microsecond=0)
+    start_local = dt_util.as_local(time).replace(
+        hour=0, minute=0, second=0, microsecond=0
     )
-    end = start + timedelta(days=1)
+    start = dt_util.as_utc(start_local)
+    end = dt_util.as_utc(start_local + timedelta(days=1))
     return (start, end)
 
 
@@ -913,6 +1080,16 @@ def _reduce_statistics_per_month(
     return _reduce_statistics(stats, same_month, month_start_end, timedelta(days=31))
 
 
+# Tables holding hourly statistics rolled up per local day or month
+STATISTICS_ROLLUPS: dict[
+    type[StatisticsDaily | StatisticsMonthly],
+    Callable[[datetime], tuple[datetime, datetime]],
+] = {
+    StatisticsDaily: day_start_end,
+    StatisticsMonthly: month_start_end,
+}
+
+
 def statistics_during_period(
     hass: HomeAssistant,
     start_time: datetime,
@@ -937,6 +1114,18 @@ def statistics_during_period(
         if statistic_ids is not None:
             metadata_ids = [metadata_id for metadata_id, _ in metadata.values()]
 
+        if period in ("day", "month"):
+            return _rollup_statistics_during_period(
+                hass,
+                session,
+                start_time,
+                end_time,
+                statistic_ids,
+                metadata,
+                metadata_ids,
+                period,
+            )
+
         if period == "5minute":
             bakery = STATISTICS_SHORT_TERM_BAKERY
             base_query = QUERY_STATISTICS_SHORT_TERM
@@ -958,8 +1147,101 @@ def statistics_during_period(
         if not stats:
             return {}
         # Return statistics combined with metadata
-        if period not in ("day", "month"):
-            return _sorted_statistics_to_dict(
+        return _sorted_statistics_to_dict(
+            hass,
+            session,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            start_time,
+            start_time_as_datetime,
+        )
+
+
+def _rollup_statistics_during_period(
+    hass: HomeAssistant,
+    session: scoped_session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: list[str] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    metadata_ids: list[int] | None,
+    period: str,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return daily or monthly statistics during start_time - end_time.
+
+    Periods entirely within start_time - end_time are read from the rollup tables,
+    the partial periods at the edges are reduced from the hourly statistics.
+    """
+    if period == "day":
+        bakery = STATISTICS_DAILY_BAKERY
+        base_query = QUERY_STATISTICS_DAILY
+        table: type[StatisticsDaily | StatisticsMonthly] = StatisticsDaily
+    else:
+        bakery = STATISTICS_MONTHLY_BAKERY
+        base_query = QUERY_STATISTICS_MONTHLY
+        table = StatisticsMonthly
+    period_start_end = STATISTICS_ROLLUPS[table]
+
+    rollup_start, first_period_end = period_start_end(start_time)
+    if rollup_start != start_time:
+        rollup_start = first_period_end
+    rollup_end = None if end_time is None else period_start_end(end_time)[0]
+    if rollup_end is not None and rollup_end <= rollup_start:
+        return _reduced_statistics_during_period(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata,
+            metadata_ids,
+            period,
+        )
+
+    baked_query = _statistics_during_period_query(
+        hass, rollup_end, statistic_ids, bakery, base_query, table
+    )
+    stats = execute(
+        baked_query(session).params(
+            start_time=rollup_start, end_time=rollup_end, metadata_ids=metadata_ids
+        )
+    )
+    if stats and any(
+        period_start_end(start := process_timestamp(stat.start))[0] != start
+        for stat in stats
+    ):
+        # The rollups were compiled in another time zone
+        return _reduced_statistics_during_period(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata,
+            metadata_ids,
+            period,
+        )
+
+    parts: list[dict[str, list[dict[str, Any]]]] = []
+    if rollup_start != start_time:
+        parts.append(
+            _reduced_statistics_during_period(
+                hass,
+                session,
+                start_time,
+                rollup_start,
+                statistic_ids,
+                metadata,
+                metadata_ids,
+                period,
+            )
+        )
+    if stats:
+        parts.append(
+            _sorted_statistics_to_dict(
                 hass,
                 session,
                 stats,
@@ -967,18 +1249,259 @@ def statistics_during_period(
                 metadata,
                 True,
                 table,
+                None if parts else start_time,
+            )
+        )
+    if rollup_end is not None and rollup_end != end_time:
+        parts.append(
+            _reduced_statistics_during_period(
+                hass,
+                session,
+                rollup_end,
+                end_time,
+                statistic_ids,
+                metadata,
+                metadata_ids,
+                period,
+                include_stat_at_start=False,
+            )
+        )
+
+    result: dict[str, list[dict[str, Any]]] = {}
+    for part in parts:
+        for statistic_id, stat_list in part.items():
+            result.setdefault(statistic_id, []).extend(stat_list)
+    return result
+
+
+def _reduced_statistics_during_period(
+    hass: HomeAssistant,
+    session: scoped_session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: list[str] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    metadata_ids: list[int] | None,
+    period: str,
+    include_stat_at_start: bool = True,
+) -> dict[str, list[dict[str, Any]]]:
+    """Reduce hourly statistics during start_time - end_time to daily or monthly.
+
+    If include_stat_at_start is False, the last statistics before start_time are
+    not added when the first statistics are later, because the statistics before
+    start_time are already part of the result.
+    """
+    baked_query = _statistics_during_period_query(
+        hass, end_time, statistic_ids, STATISTICS_BAKERY, QUERY_STATISTICS, Statistics
+    )
+    stats = execute(
+        baked_query(session).params(
+            start_time=start_time, end_time=end_time, metadata_ids=metadata_ids
+        )
+    )
+    if not stats:
+        return {}
+
+    result = _sorted_statistics_to_dict(
+        hass,
+        session,
+        stats,
+        statistic_ids,
+        metadata,
+        True,
+        Statistics,
+        start_time if include_stat_at_start else None,
+        True,
+    )
+
+    if period == "day":
+        return _reduce_statistics_per_day(result)
+
+    return _reduce_statistics_per_month(result)
+
+
+@dataclasses.dataclass
+class _CachedStatistics:
+    """A cached statistics_during_period result."""
+
+    result: dict[str, list[dict[str, Any]]]
+    # Periods starting at or after refresh_from need to be queried again
+    refresh_from: datetime | None = None
+
+
+class StatisticsCache:
+    """Cache of statistics_during_period results.
+
+    Compiled hourly statistics don't change. When an hour is compiled, cached
+    results only need to query the period the hour belongs to and any later
+    periods again, earlier periods are served from memory.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self._cache: OrderedDict[tuple, _CachedStatistics] = OrderedDict()
+        # Incremented when statistics are updated, results of queries which ran
+        # while statistics were updated are not cached
+        self._generation = 0
+
+        async_dispatcher_connect(
+            hass, SIGNAL_STATISTICS_UPDATED, self.async_statistics_updated
+        )
+        hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, self._async_clear)
+
+    async def async_statistics_during_period(
+        self,
+        start_time: datetime,
+        end_time: datetime | None = None,
+        statistic_ids: list[str] | None = None,
+        period: Literal["5minute", "day", "hour", "month"] = "hour",
+        start_time_as_datetime: bool = False,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Return statistics during UTC period start_time - end_time.
+
+        The returned statistics are shared with other callers and must not be
+        modified.
+        """
+        if period == "5minute":
+            # Short term statistics are purged, they are not cached
+            return await self.hass.async_add_executor_job(
+                statistics_during_period,
+                self.hass,
                 start_time,
+                end_time,
+                statistic_ids,
+                period,
                 start_time_as_datetime,
             )
 
-        result = _sorted_statistics_to_dict(
-            hass, session, stats, statistic_ids, metadata, True, table, start_time, True
+        key = (
+            start_time,
+            end_time,
+            None if statistic_ids is None else tuple(statistic_ids),
+            period,
+            start_time_as_datetime,
         )
+        generation = self._generation
+        if (cached := self._cache.get(key)) is None:
+            result = await self.hass.async_add_executor_job(
+                statistics_during_period,
+                self.hass,
+                start_time,
+                end_time,
+                statistic_ids,
+                period,
+                start_time_as_datetime,
+            )
+        elif (refresh_from := cached.refresh_from) is None:
+            self._cache.move_to_end(key)
+            return cached.result
+        else:
+            result = _merge_statistics(
+                cached.result,
+                await self.hass.async_add_executor_job(
+                    statistics_during_period,
+                    self.hass,
+                    refresh_from,
+                    end_time,
+                    statistic_ids,
+                    period,
+                    start_time_as_datetime,
+                ),
+                refresh_from,
+            )
+
+        if generation == self._generation:
+            self._cache[key] = _CachedStatistics(result)
+            self._cache.move_to_end(key)
+            if len(self._cache) > MAX_CACHED_STATISTICS:
+                self._cache.popitem(last=False)
+        return result
 
-        if period == "day":
-            return _reduce_statistics_per_day(result)
+    @callback
+    def async_statistics_updated(self, start: datetime | None) -> None:
+        """Invalidate cached periods of statistics updated from start."""
+        self._generation += 1
+        if start is None:
+            self._cache.clear()
+            return
+
+        for key, cached in list(self._cache.items()):
+            start_time, end_time, _, period, _ = key
+            if end_time is not None and start >= end_time:
+                continue
+            if period in ("day", "month"):
+                table = StatisticsDaily if period == "day" else StatisticsMonthly
+                refresh_from = STATISTICS_ROLLUPS[table](start)[0]
+            else:
+                refresh_from = start
+            if refresh_from <= start_time:
+                del self._cache[key]
+            elif cached.refresh_from is None or refresh_from < cached.refresh_from:
+                cached.refresh_from = refresh_from
 
-        return _reduce_statistics_per_month(result)
+    @callback
+    def _async_clear(self, event: Event) -> None:
+        """Clear the cache when the unit system or time zone may have changed."""
+        self._generation += 1
+        self._cache.clear()
+
+
+def _merge_statistics(
+    cached: dict[str, list[dict[str, Any]]],
+    refreshed: dict[str, list[dict[str, Any]]],
+    refresh_from: datetime,
+) -> dict[str, list[dict[str, Any]]]:
+    """Replace the cached periods starting at or after refresh_from."""
+
+    def first_refreshed(stat_list: list[dict[str, Any]]) -> int:
+        """Return the index of the first period starting at or after refresh_from."""
+        index = len(stat_list)
+        while index and _period_start(stat_list[index - 1]) >= refresh_from:
+            index -= 1
+        return index
+
+    result: dict[str, list[dict[str, Any]]] = {}
+    for statistic_id in chain(cached, refreshed):
+        if statistic_id in result:
+            continue
+        stat_list = cached.get(statistic_id, [])
+        stat_list = stat_list[: first_refreshed(stat_list)]
+        refreshed_list = refreshed.get(statistic_id, [])
+        if stat_list:
+            # Drop the last known statistics before refresh_from which
+            # statistics_during_period adds if there are none at refresh_from
+            refreshed_list = [
+                stat for stat in refreshed_list if _period_start(stat) >= refresh_from
+            ]
+        if stat_list := stat_list + refreshed_list:
+            result[statistic_id] = stat_list
+    return result
+
+
+def _period_start(stat: dict[str, Any]) -> datetime:
+    """Return the start of a statistics period."""
+    if isinstance(start := stat["start"], datetime):
+        return start
+    return dt_util.parse_datetime(start)  # type: ignore[return-value]
+
+
+async def async_statistics_during_period(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    statistic_ids: list[str] | None = None,
+    period: Literal["5minute", "day", "hour", "month"] = "hour",
+    start_time_as_datetime: bool = False,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return statistics during UTC period start_time - end_time, using the cache.
+
+    The returned statistics are shared with other callers and must not be modified.
+    """
+    cache: StatisticsCache = hass.data[STATISTICS_CACHE]
+    return await cache.async_statistics_during_period(
+        start_time, end_time, statistic_ids, period, start_time_as_datetime
+    )
 
 
 def _get_last_statistics(
@@ -1054,13 +1577,17 @@ def get_last_short_term_statistics(
 def _statistics_at_time(
     session: scoped_session,
     metadata_ids: set[int],
-    table: type[Statistics | StatisticsShortTerm],
+    table: type[Statistics | StatisticsShortTerm | StatisticsDaily | StatisticsMonthly],
     start_time: datetime,
 ) -> list | None:
     """Return last known statics, earlier than start_time, for the metadata_ids."""
     # Fetch metadata for the given (or all) statistic_ids
     if table == StatisticsShortTerm:
         base_query = QUERY_STATISTICS_SHORT_TERM
+    elif table == StatisticsDaily:
+        base_query = QUERY_STATISTICS_DAILY
+    elif table == StatisticsMonthly:
+        base_query = QUERY_STATISTICS_MONTHLY
     else:
         base_query = QUERY_STATISTICS
 
@@ -1090,7 +1617,7 @@ def _sorted_statistics_to_dict(
     statistic_ids: list[str] | None,
     _metadata: dict[str, tuple[int, StatisticMetaData]],
     convert_units: bool,
-    table: type[Statistics | StatisticsShortTerm],
+    table: type[Statistics | StatisticsShortTerm | StatisticsDaily | StatisticsMonthly],
     start_time: datetime | None,
     start_time_as_datetime: bool = False,
 ) -> dict[str, list[dict]]:
@@ -1100,6 +1627,8 @@ def _sorted_statistics_to_dict(
     metadata = dict(_metadata.values())
     need_stat_at_start_time = set()
     stats_at_start_time = {}
+    # The length of daily and monthly periods depends on the local calendar
+    period_start_end = STATISTICS_ROLLUPS.get(table)  # type: ignore[arg-type]
 
     def no_conversion(val: Any, _: Any) -> float | None:
         """Return x."""
@@ -1136,7 +1665,10 @@ def _sorted_statistics_to_dict(
         ent_results = result[meta_id]
         for db_state in chain(stats_at_start_time.get(meta_id, ()), group):
             start = process_timestamp(db_state.start)
-            end = start + table.duration
+            if period_start_end:
+                end = period_start_end(start)[1]
+            else:
+                end = start + table.duration
             ent_results.append(
                 {
                     "statistic_id": statistic_id,
@@ -1271,4 +1803,15 @@ def add_external_statistics(
             else:
                 _insert_statistics(session, Statistics, metadata_id, stat)
 
+        compile_statistics_rollups(
+            session, (stat["start"] for stat in statistics), metadata_id
+        )
+
+    if statistics:
+        dispatcher_send(
+            instance.hass,
+            SIGNAL_STATISTICS_UPDATED,
+            min(stat["start"] for stat in statistics),
+        )
+
     return True
@@ -28,7 +28,9 @@ from .models import (
     TABLE_RECORDER_RUNS,
     TABLE_SCHEMA_CHANGES,
     TABLE_STATISTICS,
+    TABLE_STATISTICS_DAILY,
     TABLE_STATISTICS_META,
+    TABLE_STATISTICS_MONTHLY,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
     RecorderRuns,
@@ -208,6 +210,8 @@ def basic_sanity_check(cursor):
             TABLE_STATISTICS_META,
             TABLE_STATISTICS_RUNS,
             TABLE_STATISTICS_SHORT_TERM,
+            TABLE_STATISTICS_DAILY,
+            TABLE_STATISTICS_MONTHLY,
         ]:
             continue
         if table in (TABLE_RECORDER_RUNS, TABLE_SCHEMA_CHANGES):
@@ -5,9 +5,13 @@ from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import Any
 
-from homeassistant.components.trace import ActionTrace, async_store_trace
-from homeassistant.components.trace.const import CONF_STORED_TRACES
+from homeassistant.components.trace import (
+    ActionTrace,
+    async_trace_finished,
+    async_trace_started,
+)
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.helpers.trace import trace_variables_cv
 
 from .const import DOMAIN
 
@@ -29,7 +33,7 @@ def trace_script(
 ) -> Iterator[ScriptTrace]:
     """Trace execution of a script."""
     trace = ScriptTrace(item_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    token = trace_variables_cv.set(async_trace_started(hass, trace, trace_config))
 
     try:
         yield trace
@@ -40,3 +44,5 @@ def trace_script(
     finally:
         if item_id:
             trace.finished()
+            async_trace_finished(hass, trace, trace_config)
+        trace_variables_cv.reset(token)
@@ -7,6 +7,7 @@ import datetime
 import itertools
 import logging
 import math
+import threading
 from typing import Any
 
 from sqlalchemy.orm.session import Session
@@ -41,10 +42,11 @@ from homeassistant.const import (
     TEMP_CELSIUS,
     TEMP_FAHRENHEIT,
     TEMP_KELVIN,
+    EVENT_STATE_CHANGED,
     VOLUME_CUBIC_FEET,
     VOLUME_CUBIC_METERS,
 )
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
 import homeassistant.util.dt as dt_util
@@ -128,6 +130,139 @@ WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
 
+STATES_BUFFER = "sensor_recorder_states_buffer"
+# Maximum number of states buffered per sensor between two compile runs
+MAX_BUFFERED_STATES = 1000
+
+
+class StatesBuffer:
+    """Sensor states changed since the last compiled statistics period.
+
+    The buffer is filled from state_changed events in the event loop as the
+    states are recorded, and consumed by the statistics compilation in the
+    recorder thread. Compiling a period the buffer covers is then done without
+    querying the states of the period from the database. Periods which started
+    before the buffer was filled, e.g. when catching up on missed periods after
+    a restart, are compiled from the database.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the buffer."""
+        self._lock = threading.Lock()
+        # Per entity: the last state before the oldest uncompiled period followed
+        # by the states changed since, ordered by last_updated
+        self._states: dict[str, list[State]] = {}
+        # Periods starting at or after this time are covered by the buffer
+        self._covered_since: datetime.datetime | None = None
+        self._started = False
+
+    def async_start_if_needed(self, hass: HomeAssistant) -> None:
+        """Start filling the buffer, can be called from any thread."""
+        if self._started:
+            return
+        self._started = True
+        hass.add_job(self.async_start, hass)
+
+    @callback
+    def async_start(self, hass: HomeAssistant) -> None:
+        """Start filling the buffer with the current sensor states."""
+
+        @callback
+        def _async_state_changed_filter(event: Event) -> bool:
+            """Filter state changes of sensors."""
+            return (
+                event.data["new_state"] is not None
+                and event.data["entity_id"].startswith(f"{DOMAIN}.")
+            )
+
+        with self._lock:
+            covered_since = dt_util.utcnow()
+            for state in hass.states.async_all(DOMAIN):
+                self._states[state.entity_id] = [state]
+                # Earlier states of the sensor are not in the buffer
+                covered_since = max(
+                    covered_since, state.last_updated + datetime.timedelta.resolution
+                )
+            self._covered_since = covered_since
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=_async_state_changed_filter,
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Add a changed sensor state to the buffer."""
+        new_state: State = event.data["new_state"]
+        with self._lock:
+            if (states := self._states.get(new_state.entity_id)) is None:
+                self._states[new_state.entity_id] = [new_state]
+                return
+            states.append(new_state)
+            if states[-2].last_updated > new_state.last_updated:
+                states.sort(key=lambda state: state.last_updated)
+            if len(states) > MAX_BUFFERED_STATES:
+                # The statistics are not compiled, stop covering the periods
+                # for which states are dropped
+                del states[0]
+                assert self._covered_since is not None
+                self._covered_since = max(
+                    self._covered_since,
+                    states[0].last_updated + datetime.timedelta.resolution,
+                )
+
+    def covers(self, start: datetime.datetime) -> bool:
+        """Return if the buffer has all states of the period starting at start."""
+        return self._covered_since is not None and self._covered_since <= start
+
+    def period_states(
+        self,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        entity_ids: Iterable[str],
+        significant_changes_only: bool,
+    ) -> dict[str, list[State]]:
+        """Return the states during start-end, like the history queries do.
+
+        The states include the state at the start of the period. With
+        significant_changes_only, only states where the state changed are
+        included after the start of the period.
+        """
+        result: dict[str, list[State]] = {}
+        with self._lock:
+            for entity_id in entity_ids:
+                if not (states := self._states.get(entity_id)):
+                    continue
+                period_states = []
+                for state in states:
+                    if state.last_updated >= end:
+                        break
+                    if state.last_updated < start:
+                        period_states = [state]
+                        continue
+                    if (
+                        significant_changes_only
+                        and state.last_changed != state.last_updated
+                    ):
+                        continue
+                    period_states.append(state)
+                if period_states:
+                    result[entity_id] = period_states
+        return result
+
+    def compiled(self, end: datetime.datetime) -> None:
+        """Drop the states which are not needed for the periods after end."""
+        with self._lock:
+            for states in self._states.values():
+                keep_from = 0
+                for index, state in enumerate(states):
+                    if state.last_updated >= end:
+                        break
+                    keep_from = index
+                del states[:keep_from]
+            if self._covered_since is not None:
+                self._covered_since = max(self._covered_since, end)
+
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     """Get the current state of all sensors for which to compile statistics."""
@@ -412,34 +547,46 @@ def _compile_statistics(  # noqa: C901
         hass, session, statistic_ids=[i.entity_id for i in sensor_states]
     )
 
+    if (states_buffer := hass.data.get(STATES_BUFFER)) is None:
+        states_buffer = hass.data[STATES_BUFFER] = StatesBuffer()
+    states_buffer.async_start_if_needed(hass)
+
     # Get history between start and end
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
     ]
-    history_list = {}
-    if entities_full_history:
-        history_list = history.get_significant_states_with_session(  # type: ignore
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_full_history,
-            significant_changes_only=False,
-        )
     entities_significant_history = [
         i.entity_id
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
     ]
-    if entities_significant_history:
-        _history_list = history.get_significant_states_with_session(  # type: ignore
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_significant_history,
-        )
-        history_list = {**history_list, **_history_list}
+    history_list: dict[str, Iterable[State]] = {}
+    if states_buffer.covers(start):
+        history_list = {
+            **states_buffer.period_states(start, end, entities_full_history, False),
+            **states_buffer.period_states(
+                start, end, entities_significant_history, True
+            ),
+        }
+    else:
+        if entities_full_history:
+            history_list = history.get_significant_states_with_session(  # type: ignore
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entity_ids=entities_full_history,
+                significant_changes_only=False,
+            )
+        if entities_significant_history:
+            _history_list = history.get_significant_states_with_session(  # type: ignore
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entity_ids=entities_significant_history,
+            )
+            history_list = {**history_list, **_history_list}
     # If there are no recent state changes, the sensor's state may already be pruned
     # from the recorder. Get the state from the state machine instead.
     for _state in sensor_states:
@@ -593,6 +740,7 @@ def _compile_statistics(  # noqa: C901
 
         result.append({"meta": meta, "stat": stat})
 
+    states_buffer.compiled(end)
     return result
 
 
@@ -0,0 +1,193 @@
+"""Incrementally maintained statistics of a sliding window of samples.
+
+Samples are always removed in the order they were added, the accumulators rely
+on this to update in constant or logarithmic time instead of recomputing the
+statistics of the whole window.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from collections.abc import Callable, Iterable
+import operator
+
+
+class RunningSum:
+    """Sum of the samples, using Neumaier summation to limit rounding errors."""
+
+    def __init__(self) -> None:
+        """Initialize the sum."""
+        self.count = 0
+        self._sum = 0.0
+        self._compensation = 0.0
+
+    def reset(self, values: Iterable[float]) -> None:
+        """Recompute the sum of the samples."""
+        self.count = 0
+        self._sum = self._compensation = 0.0
+        for value in values:
+            self.add(value)
+
+    @property
+    def value(self) -> float:
+        """Return the sum of the samples."""
+        return self._sum + self._compensation
+
+    def add(self, value: float) -> None:
+        """Add a sample."""
+        self.count += 1
+        self._add(value)
+
+    def remove(self, value: float) -> None:
+        """Remove the oldest sample."""
+        self.count -= 1
+        if not self.count:
+            self._sum = self._compensation = 0.0
+            return
+        self._add(-value)
+
+    def _add(self, value: float) -> None:
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._compensation += (self._sum - total) + value
+        else:
+            self._compensation += (value - total) + self._sum
+        self._sum = total
+
+
+class RunningVariance:
+    """Mean and sample variance of the samples, using Welford's algorithm."""
+
+    def __init__(self) -> None:
+        """Initialize the variance."""
+        self.count = 0
+        self.mean = 0.0
+        self._sum_squared_deviations = 0.0
+
+    def reset(self, values: Iterable[float]) -> None:
+        """Recompute the variance of the samples.
+
+        Removing samples accumulates rounding errors relative to the removed
+        samples, recomputing drops them.
+        """
+        self.count = 0
+        self.mean = self._sum_squared_deviations = 0.0
+        for value in values:
+            self.add(value)
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, at least two samples are needed."""
+        return self._sum_squared_deviations / (self.count - 1)
+
+    def add(self, value: float) -> None:
+        """Add a sample."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._sum_squared_deviations += delta * (value - self.mean)
+
+    def remove(self, value: float) -> None:
+        """Remove the oldest sample."""
+        self.count -= 1
+        if not self.count:
+            self.mean = self._sum_squared_deviations = 0.0
+            return
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self._sum_squared_deviations = max(
+            self._sum_squared_deviations - delta * (value - self.mean), 0.0
+        )
+
+
+class SlidingExtreme:
+    """Minimum or maximum of the samples, using a monotonic deque.
+
+    The deque holds the samples which can still become the extreme once the
+    older samples are removed, the current extreme is the first one.
+    """
+
+    def __init__(self, compare: Callable[[float, float], bool]) -> None:
+        """Initialize the extreme, compare returns if a sample replaces another."""
+        self._compare = compare
+        self._candidates: deque[float] = deque()
+
+    @classmethod
+    def minimum(cls) -> SlidingExtreme:
+        """Return an accumulator of the minimum."""
+        return cls(operator.lt)
+
+    @classmethod
+    def maximum(cls) -> SlidingExtreme:
+        """Return an accumulator of the maximum."""
+        return cls(operator.gt)
+
+    @property
+    def value(self) -> float:
+        """Return the extreme of the samples."""
+        return self._candidates[0]
+
+    def add(self, value: float) -> None:
+        """Add a sample."""
+        candidates = self._candidates
+        while candidates and self._compare(value, candidates[-1]):
+            candidates.pop()
+        candidates.append(value)
+
+    def remove(self, value: float) -> None:
+        """Remove the oldest sample."""
+        # An older sample is only left in the deque if it is the extreme
+        if self._candidates[0] == value:
+            self._candidates.popleft()
+
+
+class SortedSamples:
+    """The samples in sorted order, for the median and quantiles.
+
+    Samples are located by bisection, the list insert and delete are memory
+    moves which are fast for the window sizes of a statistics sensor.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the sorted samples."""
+        self._samples: list[float] = []
+
+    def add(self, value: float) -> None:
+        """Add a sample."""
+        insort(self._samples, value)
+
+    def remove(self, value: float) -> None:
+        """Remove the oldest sample."""
+        del self._samples[bisect_left(self._samples, value)]
+
+    def median(self) -> float:
+        """Return the median, like statistics.median."""
+        samples = self._samples
+        middle = len(samples) // 2
+        if len(samples) % 2 == 1:
+            return samples[middle]
+        return (samples[middle - 1] + samples[middle]) / 2
+
+    def quantiles(self, intervals: int, method: str) -> list[float]:
+        """Return the cut points of the intervals, like statistics.quantiles."""
+        samples = self._samples
+        count = len(samples)
+        result = []
+        if method == "inclusive":
+            scale = count - 1
+            for i in range(1, intervals):
+                j, delta = divmod(i * scale, intervals)
+                result.append(
+                    (samples[j] * (intervals - delta) + samples[j + 1] * delta)
+                    / intervals
+                )
+            return result
+
+        scale = count + 1
+        for i in range(1, intervals):
+            j = min(max(i * scale // intervals, 1), count - 1)
+            delta = i * scale - j * intervals
+            result.append(
+                (samples[j - 1] * (intervals - delta) + samples[j] * delta) / intervals
+            )
+        return result
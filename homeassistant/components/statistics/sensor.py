@@ -4,11 +4,13 @@ from __future__ import annotations
 from collections import deque
 from collections.abc import Callable
 import contextlib
+from itertools import islice
 from datetime import datetime, timedelta
 import logging
-import statistics
+import math
 from typing import Any, Literal, cast
 
+from sqlalchemy.orm import joinedload
 import voluptuous as vol
 
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
@@ -48,6 +50,7 @@ from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, StateTyp
 from homeassistant.util import dt as dt_util
 
 from . import DOMAIN, PLATFORMS
+from .accumulators import RunningSum, RunningVariance, SlidingExtreme, SortedSamples
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -275,8 +278,51 @@ class StatisticsSensor(SensorEntity):
                 self, f"_stat_{self._state_characteristic}"
             )
 
+        # Statistics of the samples are maintained when samples are added and
+        # removed, only the accumulators the characteristic needs are updated
+        self._sum = RunningSum()
+        self._variance = RunningVariance()
+        self._minimum = SlidingExtreme.minimum()
+        self._maximum = SlidingExtreme.maximum()
+        self._sorted = SortedSamples()
+        # Sum of a value of each pair of consecutive samples
+        self._segment_sum = RunningSum()
+        self._segment_value: Callable[
+            [float, datetime, float, datetime], float
+        ] | None = None
+        self._accumulators: list[
+            RunningSum | RunningVariance | SlidingExtreme | SortedSamples
+        ] = []
+        self._removed_samples = 0
+        self._setup_accumulators()
+
         self._update_listener: CALLBACK_TYPE | None = None
 
+    def _setup_accumulators(self) -> None:
+        """Select the accumulators needed for the state characteristic."""
+        characteristic = self._state_characteristic
+        if characteristic in (STAT_AVERAGE_TIMELESS, STAT_MEAN, STAT_TOTAL):
+            self._accumulators.append(self._sum)
+        elif characteristic in (
+            STAT_DISTANCE_95P,
+            STAT_DISTANCE_99P,
+            STAT_STANDARD_DEVIATION,
+            STAT_VARIANCE,
+        ):
+            self._accumulators.append(self._variance)
+        elif characteristic in (STAT_MEDIAN, STAT_QUANTILES):
+            self._accumulators.append(self._sorted)
+        elif characteristic == STAT_AVERAGE_LINEAR:
+            self._segment_value = _linear_area
+        elif characteristic == STAT_AVERAGE_STEP:
+            self._segment_value = _step_area
+        elif characteristic == STAT_NOISINESS:
+            self._segment_value = _absolute_change
+        if characteristic in (STAT_DISTANCE_ABSOLUTE, STAT_VALUE_MIN):
+            self._accumulators.append(self._minimum)
+        if characteristic in (STAT_DISTANCE_ABSOLUTE, STAT_VALUE_MAX):
+            self._accumulators.append(self._maximum)
+
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
 
@@ -318,10 +364,10 @@ class StatisticsSensor(SensorEntity):
         try:
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                value: float | bool = new_state.state == "on"
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_updated)
+                value = float(new_state.state)
+            self._add_sample(value, new_state.last_updated)
             self.attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -334,6 +380,55 @@ class StatisticsSensor(SensorEntity):
 
         self._unit_of_measurement = self._derive_unit_of_measurement(new_state)
 
+    def _add_sample(self, value: float | bool, age: datetime) -> None:
+        """Add a sample, removing the oldest one if the buffer is full."""
+        if len(self.states) == self._samples_max_buffer_size:
+            self._remove_oldest_sample()
+        if self._segment_value and self.states:
+            self._segment_sum.add(
+                self._segment_value(self.states[-1], self.ages[-1], value, age)
+            )
+        self.states.append(value)
+        self.ages.append(age)
+        for accumulator in self._accumulators:
+            accumulator.add(value)
+
+    def _remove_oldest_sample(self) -> None:
+        """Remove the oldest sample."""
+        value = self.states.popleft()
+        age = self.ages.popleft()
+        if self._segment_value and self.states:
+            self._segment_sum.remove(
+                self._segment_value(value, age, self.states[0], self.ages[0])
+            )
+        for accumulator in self._accumulators:
+            accumulator.remove(value)
+        self._removed_samples += 1
+        if self._removed_samples >= self._samples_max_buffer_size:
+            self._resync_accumulators()
+
+    def _resync_accumulators(self) -> None:
+        """Recompute the running sums once as many samples as fit were removed.
+
+        This drops the rounding errors accumulated by removing samples, at an
+        amortized constant cost per sample.
+        """
+        self._removed_samples = 0
+        if self._sum in self._accumulators:
+            self._sum.reset(self.states)
+        if self._variance in self._accumulators:
+            self._variance.reset(self.states)
+        if self._segment_value:
+            self._segment_sum.reset(
+                self._segment_value(value, age, next_value, next_age)
+                for value, age, next_value, next_age in zip(
+                    self.states,
+                    self.ages,
+                    islice(self.states, 1, None),
+                    islice(self.ages, 1, None),
+                )
+            )
+
     def _derive_unit_of_measurement(self, new_state: State) -> str | None:
         base_unit: str | None = new_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         unit: str | None
@@ -428,8 +523,7 @@ class StatisticsSensor(SensorEntity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._remove_oldest_sample()
 
     def _next_to_purge_timestamp(self) -> datetime | None:
         """Find the timestamp when the next purge would occur."""
@@ -484,8 +578,10 @@ class StatisticsSensor(SensorEntity):
         _LOGGER.debug("%s: initializing values from the database", self.entity_id)
 
         with session_scope(hass=self.hass) as session:
-            query = session.query(States).filter(
-                States.entity_id == self._source_entity_id.lower()
+            query = (
+                session.query(States)
+                .options(joinedload(States.state_attributes))
+                .filter(States.entity_id == self._source_entity_id.lower())
             )
 
             if self._samples_max_age is not None:
@@ -546,27 +642,14 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_average_linear(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    0.5
-                    * (self.states[i] + self.states[i - 1])
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+            return self._segment_sum.value / age_range_seconds
         return None
 
     def _stat_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    self.states[i - 1]
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+            return self._segment_sum.value / age_range_seconds
         return None
 
     def _stat_average_timeless(self) -> StateType:
@@ -614,25 +697,22 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_distance_absolute(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states) - min(self.states)
+            return self._maximum.value - self._minimum.value
         return None
 
     def _stat_mean(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.mean(self.states)
+            return self._sum.value / len(self.states)
         return None
 
     def _stat_median(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.median(self.states)
+            return self._sorted.median()
         return None
 
     def _stat_noisiness(self) -> StateType:
         if len(self.states) >= 2:
-            diff_sum = sum(
-                abs(j - i) for i, j in zip(list(self.states), list(self.states)[1:])
-            )
-            return diff_sum / (len(self.states) - 1)
+            return self._segment_sum.value / (len(self.states) - 1)
         return None
 
     def _stat_quantiles(self) -> StateType:
@@ -640,10 +720,8 @@ class StatisticsSensor(SensorEntity):
             return str(
                 [
                     round(quantile, self._precision)
-                    for quantile in statistics.quantiles(
-                        self.states,
-                        n=self._quantile_intervals,
-                        method=self._quantile_method,
+                    for quantile in self._sorted.quantiles(
+                        self._quantile_intervals, self._quantile_method
                     )
                 ]
             )
@@ -651,39 +729,35 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_standard_deviation(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.stdev(self.states)
+            return math.sqrt(self._variance.variance)
         return None
 
     def _stat_total(self) -> StateType:
         if len(self.states) > 0:
-            return sum(self.states)
+            return self._sum.value
         return None
 
     def _stat_value_max(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states)
+            return self._maximum.value
         return None
 
     def _stat_value_min(self) -> StateType:
         if len(self.states) > 0:
-            return min(self.states)
+            return self._minimum.value
         return None
 
     def _stat_variance(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.variance(self.states)
+            return self._variance.variance
         return None
 
     # Statistics for binary sensor
 
     def _stat_binary_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            on_seconds: float = 0
-            for i in range(1, len(self.states)):
-                if self.states[i - 1] is True:
-                    on_seconds += (self.ages[i] - self.ages[i - 1]).total_seconds()
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return 100 / age_range_seconds * on_seconds
+            return 100 / age_range_seconds * self._segment_sum.value
         return None
 
     def _stat_binary_average_timeless(self) -> StateType:
@@ -694,5 +768,26 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_binary_mean(self) -> StateType:
         if len(self.states) > 0:
-            return 100.0 / len(self.states) * self.states.count(True)
+            return 100.0 / len(self.states) * self._sum.value
         return None
+
+
+def _linear_area(
+    value: float, age: datetime, next_value: float, next_age: datetime
+) -> float:
+    """Return the area below the line between two samples."""
+    return 0.5 * (value + next_value) * (next_age - age).total_seconds()
+
+
+def _step_area(
+    value: float, age: datetime, next_value: float, next_age: datetime
+) -> float:
+    """Return the area below a sample until the next sample."""
+    return value * (next_age - age).total_seconds()
+
+
+def _absolute_change(
+    value: float, age: datetime, next_value: float, next_age: datetime
+) -> float:
+    """Return the absolute change between two samples."""
+    return abs(next_value - value)
@@ -28,11 +28,19 @@ import homeassistant.util.uuid as uuid_util
 
 from . import websocket_api
 from .const import (
+    CONF_SAMPLE_EVERY,
     CONF_STORED_TRACES,
+    CONF_TRACE_MODE,
     DATA_TRACE,
+    DATA_TRACE_SAMPLES,
     DATA_TRACE_STORE,
     DATA_TRACES_RESTORED,
+    DEFAULT_SAMPLE_EVERY,
     DEFAULT_STORED_TRACES,
+    TRACE_MODE_ERRORS,
+    TRACE_MODE_FULL,
+    TRACE_MODE_SAMPLED,
+    TRACE_MODES,
 )
 from .utils import LimitedSizeDict
 
@@ -44,7 +52,11 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    vol.Optional(CONF_TRACE_MODE, default=TRACE_MODE_FULL): vol.In(TRACE_MODES),
+    vol.Optional(CONF_SAMPLE_EVERY, default=DEFAULT_SAMPLE_EVERY): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
 }
 
 
@@ -142,6 +154,32 @@ def async_store_trace(hass, trace, stored_traces):
         traces[key][trace.run_id] = trace
 
 
+def async_trace_started(hass, trace, trace_config):
+    """Store a started trace if it is retained from the start.
+
+    Return if the trace may be retained. Variables are only snapshotted in
+    the trace elements of traces which may be retained.
+    """
+    mode = trace_config[CONF_TRACE_MODE]
+    if mode == TRACE_MODE_SAMPLED:
+        samples = hass.data.setdefault(DATA_TRACE_SAMPLES, {})
+        run = samples.get(trace.key, 0)
+        samples[trace.key] = run + 1
+        if run % trace_config[CONF_SAMPLE_EVERY] == 0:
+            mode = TRACE_MODE_FULL
+
+    if mode == TRACE_MODE_FULL:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+        return True
+    return mode == TRACE_MODE_ERRORS
+
+
+def async_trace_finished(hass, trace, trace_config):
+    """Store a finished trace which is only retained if the run failed."""
+    if trace_config[CONF_TRACE_MODE] == TRACE_MODE_ERRORS and trace.failed:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+
+
 def _async_store_restored_trace(hass, trace):
     """Store a restored trace and move it to the end of the LimitedSizeDict."""
     key = trace.key
@@ -251,6 +289,11 @@ class ActionTrace(BaseTrace):
         self._state = "stopped"
         self._script_execution = script_execution_get()
 
+    @property
+    def failed(self) -> bool:
+        """Return if the run ended with an error."""
+        return self._error is not None or self._script_execution == "error"
+
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this ActionTrace."""
         if self._dict:
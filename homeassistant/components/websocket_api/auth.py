@@ -30,6 +30,7 @@ AUTH_MESSAGE_SCHEMA: Final = vol.Schema(
         vol.Required("type"): TYPE_AUTH,
         vol.Exclusive("api_password", "auth"): str,
         vol.Exclusive("access_token", "auth"): str,
+        vol.Optional("supported_features", default={}): {str: vol.Coerce(float)},
     }
 )
 
@@ -67,7 +68,7 @@ class AuthPhase:
         self._logger = logger
         self._request = request
 
-    async def async_handle(self, msg: dict[str, str]) -> ActiveConnection:
+    async def async_handle(self, msg: dict[str, Any]) -> ActiveConnection:
         """Handle authentication."""
         try:
             msg = AUTH_MESSAGE_SCHEMA(msg)
@@ -86,6 +87,7 @@ class AuthPhase:
             )
             if refresh_token is not None:
                 conn = await self._async_finish_auth(refresh_token.user, refresh_token)
+                conn.supported_features = msg["supported_features"]
                 conn.subscriptions[
                     "auth"
                 ] = self._hass.auth.async_register_revoke_token_callback(
@@ -15,7 +15,7 @@ from homeassistant.const import (
     MATCH_ALL,
     SIGNAL_BOOTSTRAP_INTEGRATONS,
 )
-from homeassistant.core import Context, Event, HomeAssistant, callback
+from homeassistant.core import Context, Event, HomeAssistant, State, callback
 from homeassistant.exceptions import (
     HomeAssistantError,
     ServiceNotFound,
@@ -58,6 +58,7 @@ def async_register_commands(
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
+    async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
     async_reg(hass, handle_test_condition)
@@ -118,6 +119,81 @@ def handle_subscribe_events(
     connection.send_message(messages.result_message(msg["id"]))
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "subscribe_entities",
+        vol.Optional("entity_ids"): cv.entity_ids,
+    }
+)
+def handle_subscribe_entities(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle subscribe entities command.
+
+    Sends the compressed states of the entities and then the changes to
+    them, collected per event loop iteration.
+    """
+    entity_ids = set(msg.get("entity_ids", []))
+    check_entity = connection.user.permissions.check_entity
+    # The state last sent and the current state of the changed entities
+    pending: dict[str, tuple[State | None, State | None]] = {}
+
+    @callback
+    def forward_entity_changes(event: Event) -> None:
+        """Collect entity changes to forward."""
+        entity_id = event.data["entity_id"]
+        if not check_entity(entity_id, POLICY_READ):
+            return
+
+        if not pending:
+            hass.loop.call_soon(send_entity_changes)
+
+        if entity_id in pending:
+            pending[entity_id] = (pending[entity_id][0], event.data["new_state"])
+        else:
+            pending[entity_id] = (event.data["old_state"], event.data["new_state"])
+
+    @callback
+    def send_entity_changes() -> None:
+        """Forward the entity changes collected in this loop iteration."""
+        changes = [
+            (entity_id, old_state, new_state)
+            for entity_id, (old_state, new_state) in pending.items()
+        ]
+        pending.clear()
+
+        if msg["id"] not in connection.subscriptions:
+            return
+
+        if event := messages.entity_changes_event(changes):
+            connection.send_message(messages.event_message(msg["id"], event))
+
+    @callback
+    def entity_ids_filter(event: Event) -> bool:
+        """Filter state changes of the subscribed entities."""
+        return event.data["entity_id"] in entity_ids
+
+    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+        EVENT_STATE_CHANGED,
+        forward_entity_changes,
+        event_filter=entity_ids_filter if entity_ids else None,
+    )
+    connection.send_result(msg["id"])
+
+    connection.send_message(
+        messages.event_message(
+            msg["id"],
+            messages.entity_changes_event(
+                (state.entity_id, None, state)
+                for state in hass.states.async_all()
+                if (not entity_ids or state.entity_id in entity_ids)
+                and check_entity(state.entity_id, POLICY_READ)
+            ),
+        )
+    )
+
+
 @callback
 @decorators.websocket_command(
     {
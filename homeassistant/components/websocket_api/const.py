@@ -52,5 +52,10 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 
 # Data used to store the current connection list
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
+# Data used to store the frames and messages sent to all connections
+DATA_WRITER_STATS: Final = f"{DOMAIN}.writer_stats"
+
+# Features a client can request in the auth message
+FEATURE_COALESCE_MESSAGES: Final = "coalesce_messages"
 
 JSON_DUMP: Final = partial(json.dumps, cls=JSONEncoder, allow_nan=False)
@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from dataclasses import dataclass
 import datetime as dt
 import logging
 from typing import Any, Final
@@ -20,6 +21,8 @@ from .auth import AuthPhase, auth_required_message
 from .const import (
     CANCELLATION_ERRORS,
     DATA_CONNECTIONS,
+    DATA_WRITER_STATS,
+    FEATURE_COALESCE_MESSAGES,
     MAX_PENDING_MSG,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -46,6 +49,14 @@ class WebsocketAPIView(HomeAssistantView):
         return await WebSocketHandler(request.app["hass"], request).async_handle()
 
 
+@dataclass
+class WriterStats:
+    """Frames and messages sent by a websocket writer."""
+
+    frames_sent: int = 0
+    messages_sent: int = 0
+
+
 class WebSocketAdapter(logging.LoggerAdapter):
     """Add connection id to websocket messages."""
 
@@ -67,23 +78,59 @@ class WebSocketHandler:
         self._writer_task: asyncio.Task | None = None
         self._logger = WebSocketAdapter(_WS_LOGGER, {"connid": id(self)})
         self._peak_checker_unsub: Callable[[], None] | None = None
+        self._coalesce_messages = False
+        self.writer_stats = WriterStats()
+        self._total_writer_stats: WriterStats = hass.data.setdefault(
+            DATA_WRITER_STATS, WriterStats()
+        )
 
     async def _writer(self) -> None:
-        """Write outgoing messages."""
+        """Write outgoing messages.
+
+        If the client supports it, all messages pending when the writer
+        is ready are sent in a single frame as a JSON array.
+        """
+        to_write = self._to_write
         # Exceptions if Socket disconnected or cancelled by connection handler
         with suppress(RuntimeError, ConnectionResetError, *CANCELLATION_ERRORS):
             while not self.wsock.closed:
-                if (message := await self._to_write.get()) is None:
+                if (message := await to_write.get()) is None:
                     break
 
-                self._logger.debug("Sending %s", message)
-                await self.wsock.send_str(message)
+                if not self._coalesce_messages or to_write.empty():
+                    self._logger.debug("Sending %s", message)
+                    await self.wsock.send_str(message)
+                    self._count_sent(1)
+                    continue
+
+                messages = [message]
+                closing = False
+                while not to_write.empty():
+                    if (message := to_write.get_nowait()) is None:
+                        closing = True
+                        break
+                    messages.append(message)
+
+                coalesced = f"[{','.join(messages)}]"
+                self._logger.debug("Sending %s", coalesced)
+                await self.wsock.send_str(coalesced)
+                self._count_sent(len(messages))
+
+                if closing:
+                    break
 
         # Clean up the peaker checker when we shut down the writer
         if self._peak_checker_unsub is not None:
             self._peak_checker_unsub()
             self._peak_checker_unsub = None
 
+    @callback
+    def _count_sent(self, messages_sent: int) -> None:
+        """Count a frame sent with messages_sent messages."""
+        for stats in (self.writer_stats, self._total_writer_stats):
+            stats.frames_sent += 1
+            stats.messages_sent += messages_sent
+
     @callback
     def _send_message(self, message: str | dict[str, Any]) -> None:
         """Send a message to the client.
@@ -197,6 +244,9 @@ class WebSocketHandler:
 
             self._logger.debug("Received %s", msg_data)
             connection = await auth.async_handle(msg_data)
+            self._coalesce_messages = bool(
+                connection.supported_features.get(FEATURE_COALESCE_MESSAGES)
+            )
             self.hass.data[DATA_CONNECTIONS] = (
                 self.hass.data.get(DATA_CONNECTIONS, 0) + 1
             )
@@ -248,6 +298,11 @@ class WebSocketHandler:
                 self._writer_task.cancel()
 
             finally:
+                self._logger.debug(
+                    "Sent %s messages in %s frames",
+                    self.writer_stats.messages_sent,
+                    self.writer_stats.frames_sent,
+                )
                 if disconnect_warn is None:
                     self._logger.debug("Disconnected")
                 else:
@@ -1,13 +1,15 @@
 """Message templates for websocket commands."""
 from __future__ import annotations
 
+from collections.abc import Iterable
 from functools import lru_cache
 import logging
 from typing import Any, Final
 
 import voluptuous as vol
 
-from homeassistant.core import Event
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.util.json import (
     find_paths_unserializable_data,
@@ -31,6 +33,25 @@ BASE_COMMAND_MESSAGE_SCHEMA: Final = vol.Schema({vol.Required("id"): cv.positive
 IDEN_TEMPLATE: Final = "__IDEN__"
 IDEN_JSON_TEMPLATE: Final = '"__IDEN__"'
 
+DATA_TEMPLATE: Final = "__DATA__"
+DATA_JSON_TEMPLATE: Final = '"__DATA__"'
+
+# Keys of the entity change events of subscribe_entities
+ENTITY_EVENT_ADD: Final = "a"
+ENTITY_EVENT_REMOVE: Final = "r"
+ENTITY_EVENT_CHANGE: Final = "c"
+
+# Keys of a compressed state
+COMPRESSED_STATE_STATE: Final = "s"
+COMPRESSED_STATE_ATTRIBUTES: Final = "a"
+COMPRESSED_STATE_CONTEXT: Final = "c"
+COMPRESSED_STATE_LAST_CHANGED: Final = "lc"
+COMPRESSED_STATE_LAST_UPDATED: Final = "lu"
+
+# Keys of a compressed state diff
+STATE_DIFF_ADDITIONS: Final = "+"
+STATE_DIFF_REMOVALS: Final = "-"
+
 
 def result_message(iden: int, result: Any = None) -> dict[str, Any]:
     """Return a success result message."""
@@ -52,6 +73,111 @@ def event_message(iden: JSON_TYPE, event: Any) -> dict[str, Any]:
     return {"id": iden, "type": "event", "event": event}
 
 
+def compressed_state_dict(state: State) -> dict[str, Any]:
+    """Return a compressed dict representation of a state.
+
+    last_updated is only included if it differs from last_changed.
+    """
+    compressed_state: dict[str, Any] = {
+        COMPRESSED_STATE_STATE: state.state,
+        COMPRESSED_STATE_ATTRIBUTES: dict(state.attributes),
+        COMPRESSED_STATE_CONTEXT: _compressed_context(state.context),
+        COMPRESSED_STATE_LAST_CHANGED: state.last_changed.timestamp(),
+    }
+    if state.last_updated != state.last_changed:
+        compressed_state[COMPRESSED_STATE_LAST_UPDATED] = state.last_updated.timestamp()
+    return compressed_state
+
+
+def _compressed_context(context: Context) -> str | dict[str, Any]:
+    """Return the context id or the context if it has a user or parent."""
+    if context.user_id is None and context.parent_id is None:
+        return context.id
+    return context.as_dict()
+
+
+def compressed_state_diff(old_state: State, new_state: State) -> dict[str, Any]:
+    """Return the difference between two states in compressed form.
+
+    Only the state, timestamps, context and attributes that changed
+    are sent. Removed attributes are listed by their name.
+    """
+    additions: dict[str, Any] = {}
+    diff: dict[str, Any] = {}
+
+    if old_state.state != new_state.state:
+        additions[COMPRESSED_STATE_STATE] = new_state.state
+
+    if old_state.last_changed != new_state.last_changed:
+        additions[COMPRESSED_STATE_LAST_CHANGED] = new_state.last_changed.timestamp()
+        if new_state.last_updated != new_state.last_changed:
+            additions[
+                COMPRESSED_STATE_LAST_UPDATED
+            ] = new_state.last_updated.timestamp()
+    elif old_state.last_updated != new_state.last_updated:
+        additions[COMPRESSED_STATE_LAST_UPDATED] = new_state.last_updated.timestamp()
+
+    old_context = old_state.context
+    new_context = new_state.context
+    if (
+        old_context.id != new_context.id
+        or old_context.user_id != new_context.user_id
+        or old_context.parent_id != new_context.parent_id
+    ):
+        additions[COMPRESSED_STATE_CONTEXT] = _compressed_context(new_context)
+
+    old_attributes = old_state.attributes
+    new_attributes = new_state.attributes
+    if old_attributes != new_attributes:
+        if changed_attributes := {
+            key: value
+            for key, value in new_attributes.items()
+            if key not in old_attributes or old_attributes[key] != value
+        }:
+            additions[COMPRESSED_STATE_ATTRIBUTES] = changed_attributes
+        if removed_attributes := [
+            key for key in old_attributes if key not in new_attributes
+        ]:
+            diff[STATE_DIFF_REMOVALS] = {
+                COMPRESSED_STATE_ATTRIBUTES: removed_attributes
+            }
+
+    if additions:
+        diff[STATE_DIFF_ADDITIONS] = additions
+    return diff
+
+
+def entity_changes_event(
+    changes: Iterable[tuple[str, State | None, State | None]]
+) -> dict[str, Any]:
+    """Return the event of subscribe_entities for entity changes.
+
+    Each change is the entity_id, the state the subscriber has last
+    seen and the current state.
+    """
+    added: dict[str, dict[str, Any]] = {}
+    changed: dict[str, dict[str, Any]] = {}
+    removed: list[str] = []
+
+    for entity_id, old_state, new_state in changes:
+        if new_state is None:
+            if old_state is not None:
+                removed.append(entity_id)
+        elif old_state is None:
+            added[entity_id] = compressed_state_dict(new_state)
+        elif diff := compressed_state_diff(old_state, new_state):
+            changed[entity_id] = diff
+
+    event: dict[str, Any] = {}
+    if added:
+        event[ENTITY_EVENT_ADD] = added
+    if changed:
+        event[ENTITY_EVENT_CHANGE] = changed
+    if removed:
+        event[ENTITY_EVENT_REMOVE] = removed
+    return event
+
+
 def cached_event_message(iden: int, event: Event) -> str:
     """Return an event message.
 
@@ -71,9 +197,32 @@ def _cached_event_message(event: Event) -> str:
     The IDEN_TEMPLATE is used which will be replaced
     with the actual iden in cached_event_message
     """
+    if event.event_type == EVENT_STATE_CHANGED:
+        return _state_changed_event_message_to_json(event)
     return message_to_json(event_message(IDEN_TEMPLATE, event))
 
 
+def _state_changed_event_message_to_json(event: Event) -> str:
+    """Serialize a state changed event message to json.
+
+    The states are spliced in from their cached json since the
+    new state of a state change is the old state of the next one.
+    """
+    try:
+        data = ", ".join(
+            f"{const.JSON_DUMP(key)}: "
+            + (value.as_json() if isinstance(value, State) else const.JSON_DUMP(value))
+            for key, value in event.data.items()
+        )
+    except (ValueError, TypeError):
+        return message_to_json(event_message(IDEN_TEMPLATE, event))
+
+    event_dict = {**event.as_dict(), "data": DATA_TEMPLATE}
+    return message_to_json(event_message(IDEN_TEMPLATE, event_dict)).replace(
+        DATA_JSON_TEMPLATE, f"{{{data}}}", 1
+    )
+
+
 def message_to_json(message: dict[str, Any]) -> str:
     """Serialize a websocket message to json."""
     try:
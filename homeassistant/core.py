@@ -18,6 +18,7 @@ from collections.abc import (
 import datetime
 import enum
 import functools
+import json
 import logging
 import os
 import pathlib
@@ -77,6 +78,7 @@ from .exceptions import (
     ServiceNotFound,
     Unauthorized,
 )
+from .helpers.json import JSONEncoder
 from .util import dt as dt_util, location, uuid as uuid_util
 from .util.async_ import (
     fire_coroutine_threadsafe,
@@ -115,6 +117,9 @@ CORE_STORAGE_VERSION = 1
 
 DOMAIN = "homeassistant"
 
+# Number of entity IDs whose strings are shared between states
+MAX_EXPECTED_ENTITY_IDS = 16384
+
 # How long to wait to log tasks that are blocking
 BLOCK_LOG_TIMEOUT = 60
 
@@ -147,6 +152,18 @@ def split_entity_id(entity_id: str) -> list[str]:
     return entity_id.split(".", 1)
 
 
+@functools.lru_cache(MAX_EXPECTED_ENTITY_IDS)
+def _shared_entity_id_parts(entity_id: str) -> tuple[str, str, str]:
+    """Return the lower case entity ID, its domain and its object ID.
+
+    The same string objects are returned for every state of an entity,
+    instead of new copies for each state held in memory.
+    """
+    entity_id = entity_id.lower()
+    domain, object_id = split_entity_id(entity_id)
+    return entity_id, domain, object_id
+
+
 VALID_ENTITY_ID = re.compile(r"^(?!.+__)(?!_)[\da-z_]+(?<!_)\.(?!_)[\da-z_]+(?<!_)$")
 
 
@@ -720,7 +737,7 @@ class EventOrigin(enum.Enum):
 class Event:
     """Representation of an event within the bus."""
 
-    __slots__ = ["event_type", "data", "origin", "time_fired", "context"]
+    __slots__ = ["event_type", "data", "origin", "time_fired", "context", "_as_dict"]
 
     def __init__(
         self,
@@ -736,6 +753,7 @@ class Event:
         self.origin = origin
         self.time_fired = time_fired or dt_util.utcnow()
         self.context: Context = context or Context()
+        self._as_dict: dict[str, Any] | None = None
 
     def __hash__(self) -> int:
         """Make hashable."""
@@ -746,14 +764,18 @@ class Event:
         """Create a dict representation of this Event.
 
         Async friendly.
+
+        The dict is cached, events are not modified once fired.
         """
-        return {
-            "event_type": self.event_type,
-            "data": dict(self.data),
-            "origin": str(self.origin.value),
-            "time_fired": self.time_fired.isoformat(),
-            "context": self.context.as_dict(),
-        }
+        if self._as_dict is None:
+            self._as_dict = {
+                "event_type": self.event_type,
+                "data": dict(self.data),
+                "origin": str(self.origin.value),
+                "time_fired": self.time_fired.isoformat(),
+                "context": self.context.as_dict(),
+            }
+        return self._as_dict
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -787,6 +809,10 @@ class EventBus:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJob]] = {}
+        self._match_all_listeners: list[_FilterableJob] = []
+        # event_type -> event data key -> value of the key -> jobs
+        self._keyed_listeners: dict[str, dict[str, dict[Any, list[HassJob]]]] = {}
+        self._keyed_listener_count: dict[str, int] = {}
         self._hass = hass
 
     @callback
@@ -795,7 +821,10 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, count in self._keyed_listener_count.items():
+            listeners[event_type] = listeners.get(event_type, 0) + count
+        return listeners
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -832,21 +861,43 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
+        listeners = self._listeners.get(event_type)
+        keyed_listeners = self._keyed_listeners.get(event_type)
 
         # EVENT_HOMEASSISTANT_CLOSE should go only to this listeners
-        match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
+        match_all_listeners = (
+            self._match_all_listeners
+            if event_type != EVENT_HOMEASSISTANT_CLOSE
+            else None
+        )
 
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if event_type != EVENT_TIME_CHANGED:
             _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners:
-            return
+        if match_all_listeners:
+            self._async_run_filterable_jobs(match_all_listeners, event)
 
+        if listeners is not None:
+            self._async_run_filterable_jobs(listeners, event)
+
+        if keyed_listeners is not None:
+            for data_key, jobs_by_value in keyed_listeners.items():
+                try:
+                    jobs = jobs_by_value.get(event.data.get(data_key))
+                except TypeError:
+                    # The value is not hashable so no listener can match it
+                    continue
+                if jobs is not None:
+                    for job in jobs:
+                        self._hass.async_add_hass_job(job, event)
+
+    @callback
+    def _async_run_filterable_jobs(
+        self, listeners: list[_FilterableJob], event: Event
+    ) -> None:
+        """Schedule the listeners whose filter accepts the event."""
         for job, event_filter in listeners:
             if event_filter is not None:
                 try:
@@ -901,11 +952,61 @@ class EventBus:
             event_type, _FilterableJob(HassJob(listener), event_filter)
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: str,
+        data_key: str,
+        keys: Iterable[Any],
+        listener: Callable[[Event], None | Awaitable[None]],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a type with one of keys as value of data_key.
+
+        For example, listening to EVENT_STATE_CHANGED with data_key entity_id
+        only receives the state changes of the given entities. The listeners
+        are looked up by the value in the event data, so no filter has to run
+        for every event.
+
+        This method must be run in the event loop.
+        """
+        keys = set(keys)
+        job = HassJob(listener)
+        jobs_by_value = self._keyed_listeners.setdefault(event_type, {}).setdefault(
+            data_key, {}
+        )
+        for key in keys:
+            jobs_by_value.setdefault(key, []).append(job)
+        self._keyed_listener_count[event_type] = (
+            self._keyed_listener_count.get(event_type, 0) + 1
+        )
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            keyed_listeners = self._keyed_listeners[event_type]
+            for key in keys:
+                jobs = jobs_by_value[key]
+                jobs.remove(job)
+                if not jobs:
+                    del jobs_by_value[key]
+            if not jobs_by_value:
+                del keyed_listeners[data_key]
+                if not keyed_listeners:
+                    del self._keyed_listeners[event_type]
+            if (count := self._keyed_listener_count[event_type] - 1) == 0:
+                del self._keyed_listener_count[event_type]
+            else:
+                self._keyed_listener_count[event_type] = count
+
+        return remove_listener
+
     @callback
     def _async_listen_filterable_job(
         self, event_type: str, filterable_job: _FilterableJob
     ) -> CALLBACK_TYPE:
         self._listeners.setdefault(event_type, []).append(filterable_job)
+        if event_type == MATCH_ALL:
+            self._match_all_listeners = self._listeners[MATCH_ALL]
 
         def remove_listener() -> None:
             """Remove the listener."""
@@ -986,6 +1087,8 @@ class EventBus:
             # delete event_type list if empty
             if not self._listeners[event_type]:
                 self._listeners.pop(event_type)
+                if event_type == MATCH_ALL:
+                    self._match_all_listeners = []
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
@@ -1020,6 +1123,7 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_as_json",
     ]
 
     def __init__(
@@ -1047,14 +1151,14 @@ class State:
                 "State max length is 255 characters."
             )
 
-        self.entity_id = entity_id.lower()
+        self.entity_id, self.domain, self.object_id = _shared_entity_id_parts(entity_id)
         self.state = state
         self.attributes = MappingProxyType(attributes or {})
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
-        self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: dict[str, Collection[Any]] | None = None
+        self._as_json: str | None = None
 
     @property
     def name(self) -> str:
@@ -1087,6 +1191,19 @@ class State:
             }
         return self._as_dict
 
+    def as_json(self) -> str:
+        """Return a JSON representation of the State.
+
+        Async friendly.
+
+        The JSON is cached so a state sent to many websocket
+        connections, and as both the new and the old state of
+        consecutive state changes, is only serialized once.
+        """
+        if self._as_json is None:
+            self._as_json = json.dumps(self.as_dict(), cls=JSONEncoder, allow_nan=False)
+        return self._as_json
+
     @classmethod
     def from_dict(cls: type[_StateT], json_dict: dict[str, Any]) -> _StateT | None:
         """Initialize a state from a dict.
@@ -1918,7 +2035,7 @@ def _async_create_timer(hass: HomeAssistant) -> None:
         """Schedule a timer tick when the next second rolls around."""
         nonlocal handle
 
-        slp_seconds = 1 - (now.microsecond / 10 ** 6)
+        slp_seconds = 1 - (now.microsecond / 10**6)
         target = monotonic() + slp_seconds
         handle = hass.loop.call_later(slp_seconds, fire_time_event, target)
 
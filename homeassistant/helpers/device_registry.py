@@ -213,6 +213,8 @@ class DeviceRegistry:
     deleted_devices: dict[str, DeletedDeviceEntry]
     _registered_index: _DeviceIndex
     _deleted_index: _DeviceIndex
+    _area_id_index: dict[str, dict[str, DeviceEntry]]
+    _config_entry_id_index: dict[str, dict[str, DeviceEntry]]
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the device registry."""
@@ -266,6 +268,7 @@ class DeviceRegistry:
         else:
             devices_index = self._registered_index
             self.devices[device.id] = device
+            self._add_device_to_lookup(device)
 
         _add_device_to_index(devices_index, device)
 
@@ -277,26 +280,54 @@ class DeviceRegistry:
         else:
             devices_index = self._registered_index
             self.devices.pop(device.id)
+            self._remove_device_from_lookup(device)
 
         _remove_device_from_index(devices_index, device)
 
     def _update_device(self, old_device: DeviceEntry, new_device: DeviceEntry) -> None:
         """Update a device and the index."""
         self.devices[new_device.id] = new_device
+        if old_device.area_id is not None and old_device.area_id != new_device.area_id:
+            _remove_from_lookup(self._area_id_index, old_device.area_id, old_device.id)
+        for config_entry_id in old_device.config_entries - new_device.config_entries:
+            _remove_from_lookup(
+                self._config_entry_id_index, config_entry_id, old_device.id
+            )
+        # Devices which stay under a key keep their position in the lookup
+        self._add_device_to_lookup(new_device)
 
         devices_index = self._registered_index
         _remove_device_from_index(devices_index, old_device)
         _add_device_to_index(devices_index, new_device)
 
+    def _add_device_to_lookup(self, device: DeviceEntry) -> None:
+        """Add a registered device to the area and config entry lookups."""
+        if device.area_id is not None:
+            self._area_id_index.setdefault(device.area_id, {})[device.id] = device
+        for config_entry_id in device.config_entries:
+            self._config_entry_id_index.setdefault(config_entry_id, {})[
+                device.id
+            ] = device
+
+    def _remove_device_from_lookup(self, device: DeviceEntry) -> None:
+        """Remove a registered device from the area and config entry lookups."""
+        if device.area_id is not None:
+            _remove_from_lookup(self._area_id_index, device.area_id, device.id)
+        for config_entry_id in device.config_entries:
+            _remove_from_lookup(self._config_entry_id_index, config_entry_id, device.id)
+
     def _clear_index(self) -> None:
         """Clear the index."""
         self._registered_index = _DeviceIndex(identifiers={}, connections={})
         self._deleted_index = _DeviceIndex(identifiers={}, connections={})
+        self._area_id_index = {}
+        self._config_entry_id_index = {}
 
     def _rebuild_index(self) -> None:
         """Create the index after loading devices."""
         self._clear_index()
         for device in self.devices.values():
+            self._add_device_to_lookup(device)
             _add_device_to_index(self._registered_index, device)
         for deleted_device in self.deleted_devices.values():
             _add_device_to_index(self._deleted_index, deleted_device)
@@ -631,7 +662,7 @@ class DeviceRegistry:
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
         now_time = time.time()
-        for device in list(self.devices.values()):
+        for device in async_entries_for_config_entry(self, config_entry_id):
             self.async_update_device(device.id, remove_config_entry_id=config_entry_id)
         for deleted_device in list(self.deleted_devices.values()):
             config_entries = deleted_device.config_entries
@@ -672,9 +703,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self.async_update_device(dev_id, area_id=None)
+        for device in async_entries_for_area(self, area_id):
+            self.async_update_device(device.id, area_id=None)
 
 
 @callback
@@ -702,7 +732,7 @@ async def async_get_registry(hass: HomeAssistant) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return list(registry._area_id_index.get(area_id, {}).values())
 
 
 @callback
@@ -710,11 +740,7 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    return list(registry._config_entry_id_index.get(config_entry_id, {}).values())
 
 
 @callback
@@ -875,3 +901,13 @@ def _remove_device_from_index(
     for connection in device.connections:
         if connection in devices_index.connections:
             del devices_index.connections[connection]
+
+
+def _remove_from_lookup(
+    lookup: dict[str, dict[str, DeviceEntry]], key: str, device_id: str
+) -> None:
+    """Remove a device from a lookup and drop the key once it is empty."""
+    devices = lookup[key]
+    del devices[device_id]
+    if not devices:
+        del lookup[key]
@@ -265,6 +265,28 @@ class Entity(ABC):
     # If entity is added to an entity platform
     _added = False
 
+    # If the attributes other than state_attributes and extra_state_attributes
+    # only change with the registry entry. These static attributes are then
+    # cached and only read again after async_invalidate_static_attributes.
+    _cache_static_attributes = False
+
+    # Minimum number of seconds between two writes from async_write_ha_state.
+    # Writes within the interval are coalesced into one write of the latest
+    # state at the end of the interval. None writes every update.
+    _write_coalesce_interval: float | None = None
+    _last_write_time = -math.inf
+    _coalesced_write: asyncio.TimerHandle | None = None
+
+    # Cached capability and static attributes
+    _static_attributes: tuple[dict[str, Any], dict[str, Any]] | None = None
+    _static_attributes_customize: Any = None
+
+    # Dynamic attributes, unit before conversion, if the temperature was
+    # converted and the attributes of the last write with cached attributes
+    _last_written_attributes: tuple[
+        dict[str, Any], Any, bool, dict[str, Any]
+    ] | None = None
+
     # Entity Properties
     _attr_assumed_state: bool = False
     _attr_attribution: str | None = None
@@ -504,6 +526,25 @@ class Entity(ABC):
                 f"No entity id specified for entity {self.name}"
             )
 
+        if (interval := self._write_coalesce_interval) is not None:
+            if self._coalesced_write is not None:
+                # The pending write will read the latest state
+                return
+            now = self.hass.loop.time()
+            if (delay := self._last_write_time + interval - now) > 0:
+                self._coalesced_write = self.hass.loop.call_later(
+                    delay, self._async_write_coalesced_ha_state
+                )
+                return
+            self._last_write_time = now
+
+        self._async_write_ha_state()
+
+    @callback
+    def _async_write_coalesced_ha_state(self) -> None:
+        """Write the state at the end of a coalescing interval."""
+        self._coalesced_write = None
+        self._last_write_time = self.hass.loop.time()
         self._async_write_ha_state()
 
     def _stringify_state(self) -> str:
@@ -534,31 +575,80 @@ class Entity(ABC):
 
         start = timer()
 
-        attr = self.capability_attributes
-        attr = dict(attr) if attr else {}
+        if self._cache_static_attributes:
+            state, attr = self._async_state_with_cached_attributes()
+        else:
+            attr = self.capability_attributes
+            attr = dict(attr) if attr else {}
 
-        state = self._stringify_state()
-        if self.available:
-            attr.update(self.state_attributes or {})
-            extra_state_attributes = self.extra_state_attributes
-            # Backwards compatibility for "device_state_attributes" deprecated in 2021.4
-            # Warning added in 2021.12, will be removed in 2022.4
-            if (
-                self.device_state_attributes is not None
-                and not self._deprecated_device_state_attributes_reported
-            ):
-                report_issue = self._suggest_report_issue()
-                _LOGGER.warning(
-                    "Entity %s (%s) implements device_state_attributes. Please %s",
-                    self.entity_id,
-                    type(self),
-                    report_issue,
-                )
-                self._deprecated_device_state_attributes_reported = True
-            if extra_state_attributes is None:
-                extra_state_attributes = self.device_state_attributes
-            attr.update(extra_state_attributes or {})
+            state = self._stringify_state()
+            if self.available:
+                attr.update(self._async_dynamic_attributes())
+
+            self._async_update_static_attributes(attr)
+
+        end = timer()
+
+        if end - start > 0.4 and not self._slow_reported:
+            self._slow_reported = True
+            report_issue = self._suggest_report_issue()
+            _LOGGER.warning(
+                "Updating state for %s (%s) took %.3f seconds. Please %s",
+                self.entity_id,
+                type(self),
+                end - start,
+                report_issue,
+            )
+
+        if not self._cache_static_attributes:
+            # Overwrite properties that have been set in the config file.
+            if DATA_CUSTOMIZE in self.hass.data:
+                attr.update(self.hass.data[DATA_CUSTOMIZE].get(self.entity_id))
+
+            # Convert temperature if we detect one
+            converted_state = self._convert_temperature(
+                state, attr.get(ATTR_UNIT_OF_MEASUREMENT)
+            )
+            if converted_state is not None:
+                state = converted_state
+                attr[ATTR_UNIT_OF_MEASUREMENT] = self.hass.config.units.temperature_unit
+
+        if (
+            self._context_set is not None
+            and dt_util.utcnow() - self._context_set > self.context_recent_time
+        ):
+            self._context = None
+            self._context_set = None
 
+        self.hass.states.async_set(
+            self.entity_id, state, attr, self.force_update, self._context
+        )
+
+    def _async_dynamic_attributes(self) -> dict[str, Any]:
+        """Return the state attributes and extra state attributes."""
+        attr = dict(self.state_attributes or {})
+        extra_state_attributes = self.extra_state_attributes
+        # Backwards compatibility for "device_state_attributes" deprecated in 2021.4
+        # Warning added in 2021.12, will be removed in 2022.4
+        if (
+            self.device_state_attributes is not None
+            and not self._deprecated_device_state_attributes_reported
+        ):
+            report_issue = self._suggest_report_issue()
+            _LOGGER.warning(
+                "Entity %s (%s) implements device_state_attributes. Please %s",
+                self.entity_id,
+                type(self),
+                report_issue,
+            )
+            self._deprecated_device_state_attributes_reported = True
+        if extra_state_attributes is None:
+            extra_state_attributes = self.device_state_attributes
+        attr.update(extra_state_attributes or {})
+        return attr
+
+    def _async_update_static_attributes(self, attr: dict[str, Any]) -> None:
+        """Update attr with the attributes which do not depend on the state."""
         unit_of_measurement = self.unit_of_measurement
         if unit_of_measurement is not None:
             attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
@@ -588,49 +678,88 @@ class Entity(ABC):
         if (supported_features := self.supported_features) is not None:
             attr[ATTR_SUPPORTED_FEATURES] = supported_features
 
-        end = timer()
+    def _async_state_with_cached_attributes(self) -> tuple[str, dict[str, Any]]:
+        """Return the state and attributes, reading only the dynamic attributes.
 
-        if end - start > 0.4 and not self._slow_reported:
-            self._slow_reported = True
-            report_issue = self._suggest_report_issue()
-            _LOGGER.warning(
-                "Updating state for %s (%s) took %.3f seconds. Please %s",
-                self.entity_id,
-                type(self),
-                end - start,
-                report_issue,
+        The attributes of the last write are reused if the dynamic attributes
+        did not change, which makes the comparison in the state machine cheap.
+        """
+        customize = self.hass.data.get(DATA_CUSTOMIZE)
+        if (
+            self._static_attributes is None
+            or customize is not self._static_attributes_customize
+        ):
+            capability_attributes = self.capability_attributes
+            static_attributes: dict[str, Any] = {}
+            self._async_update_static_attributes(static_attributes)
+            # Overwrite properties that have been set in the config file.
+            if customize is not None:
+                static_attributes.update(customize.get(self.entity_id))
+            self._static_attributes = (
+                dict(capability_attributes) if capability_attributes else {},
+                static_attributes,
             )
+            self._static_attributes_customize = customize
+            self._last_written_attributes = None
 
-        # Overwrite properties that have been set in the config file.
-        if DATA_CUSTOMIZE in self.hass.data:
-            attr.update(self.hass.data[DATA_CUSTOMIZE].get(self.entity_id))
+        capability_attributes, static_attributes = self._static_attributes
+        state = self._stringify_state()
+        dynamic_attributes = self._async_dynamic_attributes() if self.available else {}
 
-        # Convert temperature if we detect one
-        try:
+        attr: dict[str, Any] | None = None
+        if (last := self._last_written_attributes) is not None and (
+            last[0] == dynamic_attributes
+        ):
+            unit_of_measure = last[1]
+        else:
+            attr = {**capability_attributes, **dynamic_attributes, **static_attributes}
             unit_of_measure = attr.get(ATTR_UNIT_OF_MEASUREMENT)
-            units = self.hass.config.units
-            if (
-                unit_of_measure in (TEMP_CELSIUS, TEMP_FAHRENHEIT)
-                and unit_of_measure != units.temperature_unit
-            ):
-                prec = len(state) - state.index(".") - 1 if "." in state else 0
-                temp = units.temperature(float(state), unit_of_measure)
-                state = str(round(temp) if prec == 0 else round(temp, prec))
-                attr[ATTR_UNIT_OF_MEASUREMENT] = units.temperature_unit
-        except ValueError:
-            # Could not convert state to float
-            pass
 
+        # Convert temperature if we detect one
+        converted_state = self._convert_temperature(state, unit_of_measure)
+        converted = converted_state is not None
+        if converted_state is not None:
+            state = converted_state
+
+        if attr is None:
+            assert last is not None
+            if last[2] == converted:
+                return state, last[3]
+            attr = {**capability_attributes, **dynamic_attributes, **static_attributes}
+
+        if converted:
+            attr[ATTR_UNIT_OF_MEASUREMENT] = self.hass.config.units.temperature_unit
+        self._last_written_attributes = (
+            dynamic_attributes,
+            unit_of_measure,
+            converted,
+            attr,
+        )
+        return state, attr
+
+    def _convert_temperature(self, state: str, unit_of_measure: Any) -> str | None:
+        """Return the state converted to the temperature unit of the system.
+
+        None is returned if the state does not need or allow a conversion.
+        """
+        units = self.hass.config.units
         if (
-            self._context_set is not None
-            and dt_util.utcnow() - self._context_set > self.context_recent_time
+            unit_of_measure not in (TEMP_CELSIUS, TEMP_FAHRENHEIT)
+            or unit_of_measure == units.temperature_unit
         ):
-            self._context = None
-            self._context_set = None
+            return None
+        try:
+            prec = len(state) - state.index(".") - 1 if "." in state else 0
+            temp = units.temperature(float(state), unit_of_measure)
+        except ValueError:
+            # Could not convert state to float
+            return None
+        return str(round(temp) if prec == 0 else round(temp, prec))
 
-        self.hass.states.async_set(
-            self.entity_id, state, attr, self.force_update, self._context
-        )
+    @callback
+    def async_invalidate_static_attributes(self) -> None:
+        """Read the static attributes again on the next state write."""
+        self._static_attributes = None
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
@@ -766,6 +895,10 @@ class Entity(ABC):
 
         self._added = False
 
+        if self._coalesced_write is not None:
+            self._coalesced_write.cancel()
+            self._coalesced_write = None
+
         if self._on_remove is not None:
             while self._on_remove:
                 self._on_remove.pop()()
@@ -850,6 +983,7 @@ class Entity(ABC):
         old = self.registry_entry
         self.registry_entry = ent_reg.async_get(data["entity_id"])
         assert self.registry_entry is not None
+        self.async_invalidate_static_attributes()
 
         if self.registry_entry.disabled:
             await self.async_remove()
@@ -168,9 +168,12 @@ class EntityRegistryStore(storage.Store):
 class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains two additional indexes:
+    Maintains additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entry
+    - device_id -> entity_id -> entry
+    - area_id -> entity_id -> entry
+    - config_entry_id -> entity_id -> entry
     """
 
     def __init__(self) -> None:
@@ -178,22 +181,57 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         super().__init__()
         self._entry_ids: dict[str, RegistryEntry] = {}
         self._index: dict[tuple[str, str, str], str] = {}
+        self._device_id_index: dict[str, dict[str, RegistryEntry]] = {}
+        self._area_id_index: dict[str, dict[str, RegistryEntry]] = {}
+        self._config_entry_id_index: dict[str, dict[str, RegistryEntry]] = {}
+
+    def __copy__(self) -> EntityRegistryItems:
+        """Return a copy which does not share the indexes."""
+        items = type(self)()
+        items.update(self.data)
+        return items
 
     def __setitem__(self, key: str, entry: RegistryEntry) -> None:
         """Add an item."""
-        if key in self:
-            old_entry = self[key]
+        old_entry = self.data.get(key)
+        if old_entry is not None:
             del self._entry_ids[old_entry.id]
             del self._index[(old_entry.domain, old_entry.platform, old_entry.unique_id)]
         super().__setitem__(key, entry)
         self._entry_ids.__setitem__(entry.id, entry)
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        _update_index(
+            self._device_id_index,
+            key,
+            old_entry.device_id if old_entry else None,
+            entry,
+            entry.device_id,
+        )
+        _update_index(
+            self._area_id_index,
+            key,
+            old_entry.area_id if old_entry else None,
+            entry,
+            entry.area_id,
+        )
+        _update_index(
+            self._config_entry_id_index,
+            key,
+            old_entry.config_entry_id if old_entry else None,
+            entry,
+            entry.config_entry_id,
+        )
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         self._entry_ids.__delitem__(entry.id)
         self._index.__delitem__((entry.domain, entry.platform, entry.unique_id))
+        _update_index(self._device_id_index, key, entry.device_id, None, None)
+        _update_index(self._area_id_index, key, entry.area_id, None, None)
+        _update_index(
+            self._config_entry_id_index, key, entry.config_entry_id, None, None
+        )
         super().__delitem__(key)
 
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
@@ -204,6 +242,38 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         """Get entry from id."""
         return self._entry_ids.get(key)
 
+    def get_entries_for_device_id(self, device_id: str) -> list[RegistryEntry]:
+        """Get entries for device."""
+        return list(self._device_id_index.get(device_id, {}).values())
+
+    def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
+        """Get entries for area."""
+        return list(self._area_id_index.get(area_id, {}).values())
+
+    def get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[RegistryEntry]:
+        """Get entries for config entry."""
+        return list(self._config_entry_id_index.get(config_entry_id, {}).values())
+
+
+def _update_index(
+    index: dict[str, dict[str, RegistryEntry]],
+    entity_id: str,
+    old_key: str | None,
+    entry: RegistryEntry | None,
+    new_key: str | None,
+) -> None:
+    """Move an entry of a secondary index from its old key to its new key."""
+    if old_key is not None and old_key != new_key:
+        entries = index[old_key]
+        del entries[entity_id]
+        if not entries:
+            del index[old_key]
+    if new_key is not None:
+        assert entry is not None
+        index.setdefault(new_key, {})[entity_id] = entry
+
 
 class EntityRegistry:
     """Class to hold a registry of entities."""
@@ -645,19 +715,14 @@ class EntityRegistry:
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
-            self.async_remove(entity_id)
+        for entry in self.entities.get_entries_for_config_entry_id(config_entry):
+            self.async_remove(entry.entity_id)
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if area_id == entry.area_id:
-                self.async_update_entity(entity_id, area_id=None)
+        for entry in self.entities.get_entries_for_area_id(area_id):
+            self.async_update_entity(entry.entity_id, area_id=None)
 
 
 @callback
@@ -689,9 +754,8 @@ def async_entries_for_device(
     """Return entries that match a device."""
     return [
         entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
+        for entry in registry.entities.get_entries_for_device_id(device_id)
+        if not entry.disabled_by or include_disabled_entities
     ]
 
 
@@ -700,7 +764,7 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    return registry.entities.get_entries_for_area_id(area_id)
 
 
 @callback
@@ -708,11 +772,7 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return registry.entities.get_entries_for_config_entry_id(config_entry_id)
 
 
 @callback
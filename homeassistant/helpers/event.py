@@ -56,6 +56,8 @@ TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
 
+TRACK_TEMPLATE_SCHEDULER = "track_template_scheduler"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -93,6 +95,18 @@ class TrackTemplate:
     rate_limit: timedelta | None = None
 
 
+@dataclass
+class TemplateRenderStats:
+    """Class for keeping track of the renders of a tracked template.
+
+    renders: Number of times the template was rendered
+    render_time: Total time spent rendering the template in seconds
+    """
+
+    renders: int = 0
+    render_time: float = 0.0
+
+
 @dataclass
 class TrackTemplateResult:
     """Class for result of template tracking.
@@ -765,6 +779,157 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+class _TemplateRenderScheduler:
+    """Schedule the refresh of tracked templates from state changes.
+
+    Keeps an index from entity_id and domain to the template trackers
+    depending on them, so a state change is only routed to the trackers
+    that may be affected. The state changes are collected and each affected
+    tracker is refreshed once per event loop iteration with all of them.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._track_states: dict[_TrackTemplateResultInfo, TrackStates] = {}
+        self._entities: dict[str, set[_TrackTemplateResultInfo]] = {}
+        self._domains: dict[str, set[_TrackTemplateResultInfo]] = {}
+        self._all_states: set[_TrackTemplateResultInfo] = set()
+        self._pending: dict[_TrackTemplateResultInfo, list[Event]] = {}
+        self._flush_scheduled = False
+        self._listener: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_update(
+        self, tracker: _TrackTemplateResultInfo, track_states: TrackStates
+    ) -> None:
+        """Update the states a tracker depends on."""
+        if (last_track_states := self._track_states.get(tracker)) is not None:
+            if last_track_states == track_states:
+                return
+            self._remove_from_index(tracker, last_track_states)
+
+        self._track_states[tracker] = track_states
+        if track_states.all_states:
+            self._all_states.add(tracker)
+        else:
+            for entity_id in track_states.entities:
+                self._entities.setdefault(entity_id, set()).add(tracker)
+            for domain in track_states.domains:
+                self._domains.setdefault(domain, set()).add(tracker)
+
+        if self._listener is None:
+            self._listener = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_flush,
+                event_filter=self._async_state_changed_filter,
+            )
+
+    @callback
+    def async_remove(self, tracker: _TrackTemplateResultInfo) -> None:
+        """Stop scheduling refreshes of a tracker."""
+        if (track_states := self._track_states.pop(tracker, None)) is None:
+            return
+
+        self._remove_from_index(tracker, track_states)
+        self._pending.pop(tracker, None)
+
+        if not self._track_states and self._listener is not None:
+            self._listener()
+            self._listener = None
+
+    @callback
+    def async_render_stats(self) -> dict[Template, TemplateRenderStats]:
+        """Return the render statistics of all tracked templates."""
+        return {
+            template: stats
+            for tracker in self._track_states
+            for template, stats in tracker.render_stats.items()
+        }
+
+    @callback
+    def _remove_from_index(
+        self, tracker: _TrackTemplateResultInfo, track_states: TrackStates
+    ) -> None:
+        """Remove a tracker from the entity and domain index."""
+        if track_states.all_states:
+            self._all_states.discard(tracker)
+            return
+
+        for index, keys in (
+            (self._entities, track_states.entities),
+            (self._domains, track_states.domains),
+        ):
+            for key in keys:
+                trackers = index[key]
+                trackers.discard(tracker)
+                if not trackers:
+                    del index[key]
+
+    @callback
+    def _async_state_changed_filter(self, event: Event) -> bool:
+        """Collect a state change for the trackers depending on it.
+
+        The filter runs when the event is fired, the listener is only
+        scheduled for the first relevant state change of a loop iteration
+        and refreshes the trackers with all state changes collected until
+        it runs.
+        """
+        entity_id: str = event.data[ATTR_ENTITY_ID]
+        pending = self._pending
+
+        for trackers in (
+            self._all_states,
+            self._entities.get(entity_id, ()),
+            self._domains.get(split_entity_id(entity_id)[0], ()),
+        ):
+            for tracker in trackers:
+                events = pending.setdefault(tracker, [])
+                # A tracker can depend on both the entity and its domain
+                if not events or events[-1] is not event:
+                    events.append(event)
+
+        if not pending or self._flush_scheduled:
+            return False
+        self._flush_scheduled = True
+        return True
+
+    @callback
+    def _async_flush(self, _: Event) -> None:
+        """Refresh the trackers affected by the collected state changes."""
+        self._flush_scheduled = False
+        pending = self._pending
+        self._pending = {}
+
+        for tracker, events in pending.items():
+            # The tracker may have been removed by an earlier refresh
+            if tracker not in self._track_states:
+                continue
+            try:
+                tracker.async_refresh_from_events(events)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error while refreshing tracked templates")
+
+
+@callback
+def _async_get_template_scheduler(hass: HomeAssistant) -> _TemplateRenderScheduler:
+    """Return the scheduler of tracked templates."""
+    if (scheduler := hass.data.get(TRACK_TEMPLATE_SCHEDULER)) is None:
+        scheduler = hass.data[TRACK_TEMPLATE_SCHEDULER] = _TemplateRenderScheduler(
+            hass
+        )
+    return cast(_TemplateRenderScheduler, scheduler)
+
+
+@callback
+@bind_hass
+def async_template_render_stats(
+    hass: HomeAssistant,
+) -> dict[Template, TemplateRenderStats]:
+    """Return how often and how long each tracked template was rendered."""
+    return _async_get_template_scheduler(hass).async_render_stats()
+
+
 class _TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -788,8 +953,10 @@ class _TrackTemplateResultInfo:
 
         self._rate_limit = KeyedRateLimit(hass)
         self._info: dict[Template, RenderInfo] = {}
-        self._track_state_changes: _TrackStateChangeFiltered | None = None
+        self._scheduler = _async_get_template_scheduler(hass)
+        self._last_track_states: TrackStates | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
+        self.render_stats: dict[Template, TemplateRenderStats] = {}
 
     def async_setup(self, raise_on_template_error: bool, strict: bool = False) -> None:
         """Activation of template tracking."""
@@ -800,8 +967,8 @@ class _TrackTemplateResultInfo:
         if super_template is not None:
             template = super_template.template
             variables = super_template.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict
+            self._info[template] = info = self._render_to_info(
+                template, variables, strict
             )
 
             # If the super template did not render to True, don't update other templates
@@ -821,8 +988,8 @@ class _TrackTemplateResultInfo:
                 continue
             template = track_template_.template
             variables = track_template_.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict
+            self._info[template] = info = self._render_to_info(
+                template, variables, strict
             )
 
             if info.exception:
@@ -834,9 +1001,8 @@ class _TrackTemplateResultInfo:
                     exc_info=info.exception,
                 )
 
-        self._track_state_changes = async_track_state_change_filtered(
-            self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
-        )
+        self._last_track_states = _render_infos_to_track_states(self._info.values())
+        self._scheduler.async_update(self, self._last_track_states)
         self._update_time_listeners()
         _LOGGER.debug(
             "Template group %s listens for %s, first render blocker by super template: %s",
@@ -848,9 +1014,12 @@ class _TrackTemplateResultInfo:
     @property
     def listeners(self) -> dict:
         """State changes that will cause a re-render."""
-        assert self._track_state_changes
+        track_states = self._last_track_states
+        assert track_states
         return {
-            **self._track_state_changes.listeners,
+            _ALL_LISTENER: track_states.all_states,
+            _ENTITIES_LISTENER: track_states.entities,
+            _DOMAINS_LISTENER: track_states.domains,
             "time": bool(self._time_listeners),
         }
 
@@ -887,8 +1056,7 @@ class _TrackTemplateResultInfo:
     @callback
     def async_remove(self) -> None:
         """Cancel the listener."""
-        assert self._track_state_changes
-        self._track_state_changes.async_remove()
+        self._scheduler.async_remove(self)
         self._rate_limit.async_remove()
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
@@ -898,14 +1066,34 @@ class _TrackTemplateResultInfo:
         """Force recalculate the template."""
         self._refresh(None)
 
+    @callback
+    def async_refresh_from_events(self, events: Sequence[Event]) -> None:
+        """Refresh the templates with the state changes of a loop iteration."""
+        self._refresh(events[-1], events=events)
+
+    @callback
+    def _render_to_info(
+        self, template: Template, variables: TemplateVarsType, strict: bool = False
+    ) -> RenderInfo:
+        """Render a template and keep track of the time it took."""
+        start = time.perf_counter()
+        info = template.async_render_to_info(variables, strict=strict)
+        stats = self.render_stats.setdefault(template, TemplateRenderStats())
+        stats.renders += 1
+        stats.render_time += time.perf_counter() - start
+        return info
+
     def _render_template_if_ready(
         self,
         track_template_: TrackTemplate,
         now: datetime,
-        event: Event | None,
+        events: Sequence[Event],
     ) -> bool | TrackTemplateResult:
         """Re-render the template if conditions match.
 
+        The template is only re-rendered for the last of the events
+        that is relevant to it.
+
         Returns False if the template was not re-rendered.
 
         Returns True if the template re-rendered and did not
@@ -916,11 +1104,12 @@ class _TrackTemplateResultInfo:
         """
         template = track_template_.template
 
-        if event:
+        if events:
             info = self._info[template]
 
-            if not _event_triggers_rerender(event, info):
+            if (index := _last_event_triggering_rerender(events, info)) < 0:
                 return False
+            event = events[index]
 
             had_timer = self._rate_limit.async_has_timer(template)
 
@@ -942,8 +1131,8 @@ class _TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
+        self._info[template] = info = self._render_to_info(
+            template, track_template_.variables
         )
 
         try:
@@ -976,12 +1165,16 @@ class _TrackTemplateResultInfo:
         event: Event | None,
         track_templates: Iterable[TrackTemplate] | None = None,
         replayed: bool | None = False,
+        events: Sequence[Event] | None = None,
     ) -> None:
         """Refresh the template.
 
         The event is the state_changed event that caused the refresh
         to be considered.
 
+        events is an optional list of state_changed events collected
+        in the same loop iteration, event being the last of them.
+
         track_templates is an optional list of TrackTemplate objects
         to refresh.  If not provided, all tracked templates will be
         considered.
@@ -992,6 +1185,8 @@ class _TrackTemplateResultInfo:
         updates: list[TrackTemplateResult] = []
         info_changed = False
         now = event.time_fired if not replayed and event else dt_util.utcnow()
+        if events is None:
+            events = (event,) if event else ()
 
         def _apply_update(
             update: bool | TrackTemplateResult, template: Template
@@ -1014,7 +1209,7 @@ class _TrackTemplateResultInfo:
 
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            update = self._render_template_if_ready(super_template, now, events)
             info_changed |= _apply_update(update, super_template.template)
 
             if isinstance(update, TrackTemplateResult):
@@ -1037,29 +1232,37 @@ class _TrackTemplateResultInfo:
                 # Super template changed from not True to True, force re-render
                 # of all templates in the group
                 event = None
+                events = ()
                 track_templates = self._track_templates
 
         # Then update the remaining templates unless blocked by the super template
         if not block_updates:
+            if len(events) > 1:
+                # Render the templates in the order of the state changes
+                # that triggered them
+                track_templates = sorted(
+                    track_templates,
+                    key=lambda track_template_: _last_event_triggering_rerender(
+                        events, self._info[track_template_.template]
+                    ),
+                )
             for track_template_ in track_templates:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                update = self._render_template_if_ready(track_template_, now, events)
                 info_changed |= _apply_update(update, track_template_.template)
 
         if info_changed:
-            assert self._track_state_changes
-            self._track_state_changes.async_update_listeners(
-                _render_infos_to_track_states(
-                    [
-                        _suppress_domain_all_in_render_info(info)
-                        if self._rate_limit.async_has_timer(template)
-                        else info
-                        for template, info in self._info.items()
-                    ]
-                )
+            self._last_track_states = _render_infos_to_track_states(
+                [
+                    _suppress_domain_all_in_render_info(info)
+                    if self._rate_limit.async_has_timer(template)
+                    else info
+                    for template, info in self._info.items()
+                ]
             )
+            self._scheduler.async_update(self, self._last_track_states)
             _LOGGER.debug(
                 "Template group %s listens for %s, re-render blocker by super template: %s",
                 self._track_templates,
@@ -1600,6 +1803,24 @@ def _event_triggers_rerender(event: Event, info: RenderInfo) -> bool:
     return bool(info.filter_lifecycle(entity_id))
 
 
+@callback
+def _last_event_triggering_rerender(events: Sequence[Event], info: RenderInfo) -> int:
+    """Return the index of the last event triggering a re-render or -1.
+
+    The state changes of specifically referenced entities are preferred
+    as they are excluded from the rate limit.
+    """
+    triggering = -1
+    for index in range(len(events) - 1, -1, -1):
+        if not _event_triggers_rerender(events[index], info):
+            continue
+        if events[index].data.get(ATTR_ENTITY_ID) in info.entities:
+            return index
+        if triggering < 0:
+            triggering = index
+    return triggering
+
+
 @callback
 def _rate_limit_for_event(
     event: Event, info: RenderInfo, track_template_: TrackTemplate
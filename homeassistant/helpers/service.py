@@ -574,42 +574,31 @@ async def entity_service_call(
     # A list with entities to call the service on.
     entity_candidates: list[Entity] = []
 
-    if entity_perms is None:
+    if target_all_entities:
         for platform in platforms:
-            if target_all_entities:
+            if entity_perms is None:
                 entity_candidates.extend(platform.entities.values())
             else:
-                assert all_referenced is not None
+                # If we target all entities, we will select all entities the user
+                # is allowed to control.
                 entity_candidates.extend(
                     [
                         entity
                         for entity in platform.entities.values()
-                        if entity.entity_id in all_referenced
+                        if entity_perms(entity.entity_id, POLICY_CONTROL)
                     ]
                 )
 
-    elif target_all_entities:
-        # If we target all entities, we will select all entities the user
-        # is allowed to control.
-        for platform in platforms:
-            entity_candidates.extend(
-                [
-                    entity
-                    for entity in platform.entities.values()
-                    if entity_perms(entity.entity_id, POLICY_CONTROL)
-                ]
-            )
-
     else:
         assert all_referenced is not None
 
         for platform in platforms:
-            platform_entities = []
-            for entity in platform.entities.values():
-
-                if entity.entity_id not in all_referenced:
-                    continue
+            entity_candidates.extend(
+                _get_referenced_entities(platform.entities, all_referenced)
+            )
 
+        if entity_perms is not None:
+            for entity in entity_candidates:
                 if not entity_perms(entity.entity_id, POLICY_CONTROL):
                     raise Unauthorized(
                         context=call.context,
@@ -617,10 +606,6 @@ async def entity_service_call(
                         permission=POLICY_CONTROL,
                     )
 
-                platform_entities.append(entity)
-
-            entity_candidates.extend(platform_entities)
-
     if not target_all_entities:
         assert referenced is not None
 
@@ -685,6 +670,21 @@ async def entity_service_call(
             future.result()  # pop exception if have
 
 
+def _get_referenced_entities(
+    entities: dict[str, Entity], referenced: set[str]
+) -> list[Entity]:
+    """Return the entities of a platform that are referenced.
+
+    The platform entities are indexed by entity_id so only the referenced
+    entity ids are looked up, unless the platform has fewer entities.
+    """
+    if len(referenced) < len(entities):
+        return [
+            entities[entity_id] for entity_id in referenced if entity_id in entities
+        ]
+    return [entity for entity_id, entity in entities.items() if entity_id in referenced]
+
+
 async def _handle_entity_call(
     hass: HomeAssistant,
     entity: Entity,
@@ -25,17 +25,30 @@ class TraceElement:
         self._result: dict[str, Any] | None = None
         self.reuse_by_child = False
         self._timestamp = dt_util.utcnow()
-
-        if variables is None:
-            variables = {}
-        last_variables = variables_cv.get() or {}
-        variables_cv.set(dict(variables))
-        changed_variables = {
-            key: value
-            for key, value in variables.items()
-            if key not in last_variables or last_variables[key] != value
-        }
-        self._variables = changed_variables
+        self._variables: dict[str, Any] | None = None
+        self._last_variables: dict[str, Any] | None = None
+        self._variables_snapshot: dict[str, Any] | None = None
+
+        if not trace_variables_cv.get():
+            return
+
+        # The changed variables are only computed if the trace is serialized
+        self._last_variables = variables_cv.get() or {}
+        self._variables_snapshot = dict(variables) if variables is not None else {}
+        variables_cv.set(self._variables_snapshot)
+
+    @property
+    def changed_variables(self) -> dict[str, Any]:
+        """Return the variables which changed since the previous element."""
+        if self._variables is None:
+            last_variables = self._last_variables or {}
+            self._variables = {
+                key: value
+                for key, value in (self._variables_snapshot or {}).items()
+                if key not in last_variables or last_variables[key] != value
+            }
+            self._last_variables = self._variables_snapshot = None
+        return self._variables
 
     def __repr__(self) -> str:
         """Container for trace data."""
@@ -69,8 +82,8 @@ class TraceElement:
                 "item_id": item_id,
                 "run_id": str(self._child_run_id),
             }
-        if self._variables:
-            result["changed_variables"] = self._variables
+        if changed_variables := self.changed_variables:
+            result["changed_variables"] = changed_variables
         if self._error is not None:
             result["error"] = str(self._error)
         if self._result is not None:
@@ -93,6 +106,8 @@ trace_path_stack_cv: ContextVar[list[str] | None] = ContextVar(
 )
 # Copy of last variables
 variables_cv: ContextVar[Any | None] = ContextVar("variables_cv", default=None)
+# If trace elements snapshot the variables, false if the trace is not retained
+trace_variables_cv: ContextVar[bool] = ContextVar("trace_variables_cv", default=True)
 # (domain.item_id, Run ID)
 trace_id_cv: ContextVar[tuple[str, str] | None] = ContextVar(
     "trace_id_cv", default=None
@@ -9,12 +9,21 @@ from contextlib import suppress
 from datetime import datetime
 import json
 import logging
+import os
+import tempfile
+import tracemalloc
 from timeit import default_timer as timer
 from typing import TypeVar
 
-from homeassistant import core
+from homeassistant import config_entries, core
 from homeassistant.components.websocket_api.const import JSON_DUMP
-from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
+from homeassistant.const import (
+    ATTR_NOW,
+    EVENT_HOMEASSISTANT_STARTED,
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
+    EVENT_TIME_CHANGED,
+)
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.util import dt as dt_util
@@ -65,7 +74,7 @@ async def fire_events(hass):
     """Fire a million events."""
     count = 0
     event_name = "benchmark_event"
-    events_to_fire = 10 ** 6
+    events_to_fire = 10**6
 
     @core.callback
     def listener(_):
@@ -92,7 +101,7 @@ async def fire_events_with_filter(hass):
     """Fire a million events with a filter that rejects them."""
     count = 0
     event_name = "benchmark_event"
-    events_to_fire = 10 ** 6
+    events_to_fire = 10**6
 
     @core.callback
     def event_filter(event):
@@ -131,13 +140,13 @@ async def time_changed_helper(hass):
         nonlocal count
         count += 1
 
-        if count == 10 ** 6:
+        if count == 10**6:
             event.set()
 
     hass.helpers.event.async_track_time_change(listener, minute=0, second=0)
     event_data = {ATTR_NOW: datetime(2017, 10, 10, 15, 0, 0, tzinfo=dt_util.UTC)}
 
-    for _ in range(10 ** 6):
+    for _ in range(10**6):
         hass.bus.async_fire(EVENT_TIME_CHANGED, event_data)
 
     start = timer()
@@ -160,7 +169,7 @@ async def state_changed_helper(hass):
         nonlocal count
         count += 1
 
-        if count == 10 ** 6:
+        if count == 10**6:
             event.set()
 
     for idx in range(1000):
@@ -173,7 +182,7 @@ async def state_changed_helper(hass):
         "new_state": core.State(entity_id, "on"),
     }
 
-    for _ in range(10 ** 6):
+    for _ in range(10**6):
         hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
 
     start = timer()
@@ -188,7 +197,7 @@ async def state_changed_event_helper(hass):
     """Run a million events through state changed event helper with 1000 entities."""
     count = 0
     entity_id = "light.kitchen"
-    events_to_fire = 10 ** 6
+    events_to_fire = 10**6
 
     @core.callback
     def listener(*args):
@@ -223,7 +232,7 @@ async def state_changed_event_filter_helper(hass):
     """Run a million events through state changed event helper with 1000 entities that all get filtered."""
     count = 0
     entity_id = "light.kitchen"
-    events_to_fire = 10 ** 6
+    events_to_fire = 10**6
 
     @core.callback
     def listener(*args):
@@ -292,7 +301,7 @@ async def _logbook_filtering(hass, last_changed, last_updated):
     )
 
     def yield_events(event):
-        for _ in range(10 ** 5):
+        for _ in range(10**5):
             # pylint: disable=protected-access
             if logbook._keep_event(hass, event, entities_filter):
                 yield event
@@ -363,7 +372,7 @@ async def filtering_entity_id(hass):
 
     start = timer()
 
-    for i in range(10 ** 5):
+    for i in range(10**5):
         entities_filter(entity_ids[i % size])
 
     return timer() - start
@@ -373,7 +382,7 @@ async def filtering_entity_id(hass):
 async def valid_entity_id(hass):
     """Run valid entity ID a million times."""
     start = timer()
-    for _ in range(10 ** 6):
+    for _ in range(10**6):
         core.valid_entity_id("light.kitchen")
     return timer() - start
 
@@ -383,7 +392,7 @@ async def json_serialize_states(hass):
     """Serialize million states with websocket default encoder."""
     states = [
         core.State("light.kitchen", "on", {"friendly_name": "Kitchen Lights"})
-        for _ in range(10 ** 6)
+        for _ in range(10**6)
     ]
 
     start = timer()
@@ -391,6 +400,90 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def state_memory(hass):
+    """Create an old and a new state for each of 6000 entities."""
+    entity_ids = [f"sensor.power_{idx}" for idx in range(6000)]
+
+    tracemalloc.start()
+    start = timer()
+    states = [
+        core.State(entity_id, str(value), {"unit_of_measurement": "W"})
+        for value in range(2)
+        for entity_id in entity_ids
+    ]
+    runtime = timer() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{size / len(states):.0f} bytes per state")
+    return runtime
+
+
+@benchmark
+async def state_as_dict(hass):
+    """Convert 6000 states to dicts a hundred times."""
+    states = [
+        core.State(f"sensor.power_{idx}", str(idx), {"unit_of_measurement": "W"})
+        for idx in range(6000)
+    ]
+
+    start = timer()
+    for _ in range(100):
+        for state in states:
+            state.as_dict()
+    return timer() - start
+
+
+@benchmark
+async def recorder_write_states(hass):
+    """Record 20k state changes of 200 entities to a SQLite database."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components import recorder
+    from homeassistant.setup import async_setup_component
+
+    entities = 200
+    state_changes = 20000
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_url = f"sqlite:///{os.path.join(tmpdir, 'benchmark.db')}"
+        hass.config.config_dir = tmpdir
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        assert await async_setup_component(
+            hass,
+            recorder.DOMAIN,
+            {recorder.DOMAIN: {recorder.CONF_DB_URL: db_url, "commit_interval": 1}},
+        )
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        instance = hass.data[recorder.DATA_INSTANCE]
+        await instance.async_recorder_ready.wait()
+        await hass.async_add_executor_job(instance.block_till_done)
+
+        start = timer()
+
+        for idx in range(state_changes):
+            hass.states.async_set(
+                f"sensor.power_{idx % entities}",
+                idx,
+                {"unit_of_measurement": "W", "friendly_name": "Power"},
+            )
+            # The recorder commits every commit_interval time changed events,
+            # this commits about 200 state changes at a time
+            if idx % entities == entities - 1:
+                hass.bus.async_fire(EVENT_TIME_CHANGED, {ATTR_NOW: dt_util.utcnow()})
+        await hass.async_block_till_done()
+        await hass.async_add_executor_job(instance.block_till_done)
+
+        runtime = timer() - start
+        print(f"Recorded {state_changes / runtime:.0f} state changes per second")
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+        await hass.async_block_till_done()
+        await hass.async_add_executor_job(instance.join)
+
+    return runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -0,0 +1,75 @@
+"""Test the camera frame broker."""
+import asyncio
+from unittest.mock import AsyncMock
+
+from homeassistant.components.camera.const import DATA_FRAME_BROKERS
+from homeassistant.components.camera.frame_broker import (
+    async_get_frame_broker,
+    async_get_streaming_broker,
+    mjpeg_chunk,
+)
+
+
+async def test_frames_shared_between_viewers(hass):
+    """Test frames are fetched once and skipped when unchanged."""
+    frames = asyncio.Queue()
+    image_cb = AsyncMock(side_effect=frames.get)
+
+    broker = async_get_frame_broker(hass, image_cb, "image/jpeg", 0)
+    assert async_get_frame_broker(hass, image_cb, "image/jpeg", 0) is broker
+    first = broker.async_subscribe()
+    second = broker.async_subscribe()
+
+    frames.put_nowait(b"frame 1")
+    chunk = mjpeg_chunk("image/jpeg", b"frame 1")
+    assert await first.get() == chunk
+    assert await second.get() == chunk
+    assert async_get_streaming_broker(hass, image_cb) is broker
+
+    # A late viewer gets the current frame right away
+    third = broker.async_subscribe()
+    assert third.get_nowait() == chunk
+
+    frames.put_nowait(b"frame 1")
+    frames.put_nowait(b"frame 2")
+    assert await first.get() == mjpeg_chunk("image/jpeg", b"frame 2")
+    assert image_cb.call_count == 3
+
+    for queue in (first, second, third):
+        broker.async_unsubscribe(queue)
+    await hass.async_block_till_done()
+
+    assert hass.data[DATA_FRAME_BROKERS] == {}
+    assert async_get_streaming_broker(hass, image_cb) is None
+    # Fetching stopped with the last viewer
+    call_count = image_cb.call_count
+    frames.put_nowait(b"frame 3")
+    await asyncio.sleep(0)
+    assert image_cb.call_count == call_count
+    assert frames.qsize() == 1
+
+
+async def test_slow_viewer_skips_frames(hass):
+    """Test a viewer which does not keep up only gets the latest frame."""
+    frames = asyncio.Queue()
+    broker = async_get_frame_broker(hass, frames.get, "image/jpeg", 0)
+    queue = broker.async_subscribe()
+
+    for frame in (b"frame 1", b"frame 2", b"frame 3"):
+        frames.put_nowait(frame)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+    assert queue.qsize() == 1
+    assert queue.get_nowait() == mjpeg_chunk("image/jpeg", b"frame 3")
+    broker.async_unsubscribe(queue)
+
+
+async def test_stream_ends_without_image(hass):
+    """Test viewers are ended when there is no image."""
+    broker = async_get_frame_broker(hass, AsyncMock(return_value=None), "image/jpeg", 0)
+    queue = broker.async_subscribe()
+
+    assert await queue.get() is None
+    assert hass.data[DATA_FRAME_BROKERS] == {}
+    broker.async_unsubscribe(queue)
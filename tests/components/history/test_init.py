@@ -5,8 +5,10 @@ from http import HTTPStatus
 import json
 from unittest.mock import patch, sentinel
 
+from aiohttp import ClientPayloadError
 import pytest
 from pytest import approx
+from sqlalchemy.exc import SQLAlchemyError
 
 from homeassistant.components import history, recorder
 from homeassistant.components.recorder.history import get_significant_states
@@ -614,6 +616,189 @@ async def test_fetch_period_api_with_minimal_response(hass, hass_client):
     assert response.status == HTTPStatus.OK
 
 
+async def test_fetch_period_api_with_columnar_response(hass, hass_client):
+    """Test the fetch period view streaming columnar series."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+    hass.states.async_set("sensor.power", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.power", "2", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.power", "3", {"unit_of_measurement": "kW"})
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}",
+        params={
+            "columnar": "",
+            "filter_entity_id": "sensor.power,light.kitchen",
+            "end_time": dt_util.utcnow().isoformat(),
+        },
+    )
+    assert response.status == HTTPStatus.OK
+    response_json = await response.json()
+    assert [series["entity_id"] for series in response_json] == [
+        "light.kitchen",
+        "sensor.power",
+    ]
+
+    power = response_json[1]
+    power_state = hass.states.get("sensor.power")
+    assert power["state"] == ["1", "2", "3"]
+    assert power["last_updated"][-1] == power_state.last_updated.timestamp()
+    assert power["last_updated"] == sorted(power["last_updated"])
+    assert power["attributes"] == [
+        [0, {"unit_of_measurement": "W"}],
+        [2, {"unit_of_measurement": "kW"}],
+    ]
+    assert power["last_changed"] == []
+
+
+async def test_fetch_period_api_with_columnar_response_initial_state(hass, hass_client):
+    """Test the columnar series start with the state at the start time."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    hass.states.async_set("sensor.power", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.other", "5")
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    start = dt_util.utcnow()
+    hass.states.async_set("sensor.power", "2", {"unit_of_measurement": "W"})
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}",
+        params={"columnar": "", "filter_entity_id": "sensor.power,sensor.other"},
+    )
+    assert response.status == HTTPStatus.OK
+    response_json = await response.json()
+    assert response_json == [
+        {
+            "entity_id": "sensor.power",
+            "last_updated": [
+                start.timestamp(),
+                hass.states.get("sensor.power").last_updated.timestamp(),
+            ],
+            "state": ["1", "2"],
+            "attributes": [[0, {"unit_of_measurement": "W"}]],
+            "last_changed": [],
+        },
+        {
+            "entity_id": "sensor.other",
+            "last_updated": [start.timestamp()],
+            "state": ["5"],
+            "attributes": [[0, {}]],
+            "last_changed": [],
+        },
+    ]
+
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}",
+        params={
+            "columnar": "",
+            "filter_entity_id": "sensor.other",
+            "skip_initial_state": "",
+        },
+    )
+    assert response.status == HTTPStatus.OK
+    assert await response.json() == []
+
+
+async def test_fetch_period_api_with_max_points(hass, hass_client):
+    """Test the fetch period view downsampling series to max_points."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+    for idx in range(100):
+        hass.states.async_set("sensor.power", str(idx % 10))
+        hass.states.async_set("binary_sensor.motion", "on" if idx // 20 % 2 else "off")
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    params = {
+        "filter_entity_id": "sensor.power,binary_sensor.motion",
+        "skip_initial_state": "",
+        "end_time": dt_util.utcnow().isoformat(),
+    }
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}",
+        params={**params, "max_points": "12"},
+    )
+    assert response.status == HTTPStatus.OK
+    power, motion = await response.json()
+    assert len(power) == 12
+    assert power[-1]["state"] == "9"
+    assert [state["state"] for state in motion] == ["off", "on", "off", "on", "off"]
+
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}",
+        params={**params, "max_points": "12", "columnar": ""},
+    )
+    assert response.status == HTTPStatus.OK
+    motion, power = await response.json()
+    assert len(power["state"]) == 12
+    assert motion["state"] == ["off", "on", "off", "on", "off"]
+
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}",
+        params={**params, "max_points": "1"},
+    )
+    assert response.status == HTTPStatus.BAD_REQUEST
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}",
+        params={**params, "resolution": "none"},
+    )
+    assert response.status == HTTPStatus.BAD_REQUEST
+
+
+async def test_fetch_period_api_with_columnar_response_error(hass, hass_client):
+    """Test the columnar response is aborted if reading the database fails."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    def _failing_series(*args):
+        yield {"entity_id": "sensor.power", "state": ["1"]}
+        raise SQLAlchemyError("database is gone")
+
+    client = await hass_client()
+    with patch.object(
+        recorder.history,
+        "stream_significant_states_columnar",
+        side_effect=_failing_series,
+    ):
+        response = await client.get(
+            f"/api/history/period/{dt_util.utcnow().isoformat()}",
+            params={"columnar": "", "filter_entity_id": "sensor.power"},
+        )
+        assert response.status == HTTPStatus.OK
+        body = b""
+        with pytest.raises(ClientPayloadError):
+            async for data in response.content.iter_any():
+                body += data
+
+    # The list is not closed, so the response can't be taken as complete
+    assert body.startswith(b'[{"entity_id"')
+    assert not body.endswith(b"]")
+
+
 async def test_fetch_period_api_with_no_timestamp(hass, hass_client):
     """Test the fetch period view for history with no timestamp."""
     await hass.async_add_executor_job(init_recorder_component, hass)
@@ -423,3 +423,98 @@ async def async_test_measure(hass):
     assert hass.states.get("sensor.sensor2").state == STATE_UNKNOWN
     assert hass.states.get("sensor.sensor3").state == "2"
     assert hass.states.get("sensor.sensor4").state == "50.0"
+
+
+async def test_measure_tracks_state_changes(hass):
+    """Test state changes are tracked without querying the database again."""
+    await async_init_recorder_component(hass)
+
+    t0 = dt_util.utcnow() - timedelta(minutes=40)
+    t1 = t0 + timedelta(minutes=20)
+
+    # Start     t0        t1                  End
+    # |--20min--|--20min--|-------20min-------|
+    # |---on----|---off---|--------on---------|
+
+    fake_states = {
+        "binary_sensor.test_id": [
+            ha.State("binary_sensor.test_id", "off", last_changed=t0),
+            ha.State("binary_sensor.test_id", "on", last_changed=t1),
+        ]
+    }
+
+    await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "history_stats",
+                    "entity_id": "binary_sensor.test_id",
+                    "name": "sensor1",
+                    "state": "on",
+                    "start": "{{ as_timestamp(now()) - 3600 }}",
+                    "end": "{{ now() }}",
+                    "type": "count",
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    with patch(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+        return_value=fake_states,
+    ) as mock_changes, patch(
+        "homeassistant.components.recorder.history.get_state",
+        return_value=ha.State("binary_sensor.test_id", "on"),
+    ):
+        await hass.helpers.entity_component.async_update_entity("sensor.sensor1")
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.sensor1").state == "1"
+        assert hass.states.get("sensor.sensor1").attributes["value"] == "40m"
+
+        hass.states.async_set("binary_sensor.test_id", "off")
+        await hass.async_block_till_done()
+        hass.states.async_set("binary_sensor.test_id", "on")
+        await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.sensor1").state == "2"
+    assert mock_changes.call_count == 1
+
+
+async def test_measure_state_changes_not_recorded(hass):
+    """Test state changes of an entity without recorded history are tracked."""
+    await async_init_recorder_component(hass)
+
+    await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "history_stats",
+                    "entity_id": "binary_sensor.test_id",
+                    "name": "sensor1",
+                    "state": "on",
+                    "start": "{{ as_timestamp(now()) - 3600 }}",
+                    "end": "{{ now() }}",
+                    "type": "count",
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    with patch(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+        return_value={},
+    ) as mock_changes, patch(
+        "homeassistant.components.recorder.history.get_state", return_value=None
+    ):
+        for state in ("on", "off", "on"):
+            hass.states.async_set("binary_sensor.test_id", state)
+            await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.sensor1").state == "2"
+    assert mock_changes.call_count == 1
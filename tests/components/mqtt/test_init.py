@@ -666,6 +666,41 @@ async def test_subscribe_topic_non_async(hass, mqtt_mock, calls, record_calls):
     assert len(calls) == 1
 
 
+async def test_receive_messages_in_batches(hass, mqtt_mock, calls, record_calls):
+    """Test received messages are handed to the event loop in batches."""
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    # The MQTT client wrapped by the mock
+    mqtt_client = mqtt_mock.return_value
+
+    with patch("homeassistant.components.mqtt.MAX_MESSAGES_PER_BATCH", 2):
+        for idx in range(5):
+            mqtt_client._mqtt_on_message(
+                None, None, mqtt.ReceiveMessage(f"test-topic/{idx}", b"on", 0, False)
+            )
+        assert len(calls) == 0
+
+        await asyncio.sleep(0)
+        assert len(calls) == 2
+        stats = mqtt_client.message_queue_statistics
+        assert stats.batches == 1
+        assert stats.last_batch_size == 2
+        assert stats.queue_depth == 3
+        assert stats.max_queue_depth == 5
+
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+    await hass.async_block_till_done()
+    assert [call[0].topic for call in calls] == [
+        f"test-topic/{idx}" for idx in range(5)
+    ]
+    assert stats.batches == 3
+    assert stats.messages == 5
+    assert stats.last_batch_size == 1
+    assert stats.queue_depth == 0
+    assert stats.max_delay >= stats.last_delay >= 0
+
+
 async def test_subscribe_bad_topic(hass, mqtt_mock, calls, record_calls):
     """Test the subscription of a topic."""
     with pytest.raises(HomeAssistantError):
@@ -1186,13 +1221,9 @@ async def test_delayed_birth_message(hass, mqtt_client_mock, mqtt_config):
     assert result
     await hass.async_block_till_done()
 
-    # Workaround: asynctest==0.13 fails on @functools.lru_cache
-    spec = dir(hass.data["mqtt"])
-    spec.remove("_matching_subscriptions")
-
     mqtt_component_mock = MagicMock(
         return_value=hass.data["mqtt"],
-        spec_set=spec,
+        spec_set=hass.data["mqtt"],
         wraps=hass.data["mqtt"],
     )
     mqtt_component_mock._mqttc = mqtt_client_mock
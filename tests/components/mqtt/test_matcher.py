@@ -0,0 +1,98 @@
+"""The tests for the MQTT subscription trie."""
+import pytest
+
+from homeassistant.components.mqtt import Subscription
+from homeassistant.components.mqtt.matcher import SubscriptionTrie
+from homeassistant.core import HassJob
+
+
+def _sub(topic):
+    """Create a subscription for a topic filter."""
+    return Subscription(topic, HassJob(lambda msg: None))
+
+
+@pytest.mark.parametrize(
+    "topic_filter,topic,match",
+    [
+        ("a/b/c", "a/b/c", True),
+        ("a/b/c", "a/b", False),
+        ("a/b", "a/b/c", False),
+        ("a/+/c", "a/b/c", True),
+        ("a/+/c", "a/b/d", False),
+        ("a/+", "a/b/c", False),
+        ("+/+", "/b", True),
+        ("a/#", "a", True),
+        ("a/#", "a/b/c", True),
+        ("a/#", "b/c", False),
+        ("#", "a/b/c", True),
+        ("+/b/#", "a/b", True),
+        ("#", "$SYS/broker", False),
+        ("+/broker", "$SYS/broker", False),
+        ("$SYS/#", "$SYS/broker", True),
+        ("$SYS/+", "$SYS/broker", True),
+    ],
+)
+def test_matches(topic_filter, topic, match):
+    """Test matching topics against wildcard and plain filters."""
+    trie = SubscriptionTrie()
+    subscription = _sub(topic_filter)
+    trie.add(subscription)
+
+    assert (trie.matches(topic) == [subscription]) is match
+
+
+def test_matches_multiple_filters():
+    """Test all matching subscriptions are returned."""
+    trie = SubscriptionTrie()
+    plain = _sub("home/kitchen/temp")
+    plain_2 = _sub("home/kitchen/temp")
+    single = _sub("home/+/temp")
+    multi = _sub("home/#")
+    other = _sub("garden/#")
+    for subscription in (plain, plain_2, single, multi, other):
+        trie.add(subscription)
+
+    matches = trie.matches("home/kitchen/temp")
+    assert len(matches) == 4
+    assert set(map(id, matches)) == {id(plain), id(plain_2), id(single), id(multi)}
+    assert trie.matches("garden") == [other]
+    assert trie.matches("street/lamp") == []
+
+
+def test_add_remove():
+    """Test subscriptions are reference counted and branches pruned."""
+    trie = SubscriptionTrie()
+    first = _sub("a/+/c")
+    second = _sub("a/+/c")
+    trie.add(first)
+    trie.add(second)
+
+    assert len(trie) == 2
+    assert first in trie
+    assert trie.subscriptions_for_filter("a/+/c") == [first, second]
+
+    trie.remove(first)
+    assert first not in trie
+    assert second in trie
+    assert trie.subscriptions_for_filter("a/+/c") == [second]
+    assert trie.matches("a/b/c") == [second]
+
+    trie.remove(second)
+    assert len(trie) == 0
+    assert trie.subscriptions_for_filter("a/+/c") == []
+    assert trie.matches("a/b/c") == []
+    assert list(trie) == []
+    assert trie._root.children == {}
+
+    with pytest.raises(ValueError):
+        trie.remove(second)
+
+
+def test_iter():
+    """Test iterating over all subscriptions."""
+    trie = SubscriptionTrie()
+    subscriptions = [_sub("a"), _sub("a/b"), _sub("#"), _sub("c/+")]
+    for subscription in subscriptions:
+        trie.add(subscription)
+
+    assert sorted(sub.topic for sub in trie) == ["#", "a", "a/b", "c/+"]
@@ -0,0 +1,119 @@
+"""The tests for the recorder bulk write path."""
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import create_engine, event as sqlalchemy_event
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from homeassistant.components.recorder.bulk import PendingRows, write_pending_rows
+from homeassistant.components.recorder.models import (
+    Base,
+    Events,
+    StateAttributes,
+    States,
+)
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, State
+
+
+def _state_changed_event(entity_id, state, attributes=None):
+    """Create a state_changed event."""
+    new_state = State(entity_id, state, attributes)
+    return Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": entity_id, "old_state": None, "new_state": new_state},
+        time_fired=datetime(2021, 10, 10, tzinfo=timezone.utc),
+    )
+
+
+@pytest.fixture
+def engine():
+    """Create an in-memory database with the recorder schema."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_write_pending_rows(engine):
+    """Test rows referring to other pending rows are linked on write."""
+    pending = PendingRows()
+    assert not pending
+
+    # A state whose old state was written earlier
+    event = _state_changed_event("sensor.one", "1", {"unit": "W"})
+    attributes_index = pending.add_state_attributes(
+        StateAttributes.row_from_shared_attrs(
+            StateAttributes.shared_attrs_from_event(event)
+        )
+    )
+    state_row = States.row_from_event(event)
+    state_row["old_state_id"] = 1000
+    first = pending.add_state(
+        state_row,
+        pending.add_event(Events.row_from_event(event, event_data="{}")),
+        None,
+        attributes_index,
+    )
+    # A state whose old state is written in the same batch
+    event = _state_changed_event("sensor.one", "2", {"unit": "W"})
+    pending.add_state(
+        States.row_from_event(event),
+        pending.add_event(Events.row_from_event(event, event_data="{}")),
+        first,
+        attributes_index,
+    )
+    # An event which is not a state change
+    pending.add_event(Events.row_from_event(Event("test_event", {"data": 1})))
+    assert pending
+
+    with engine.begin() as connection:
+        # Make sure the ids do not start from 1
+        connection.execute(Events.__table__.insert(), [{"event_type": "old"}])
+        written_ids = write_pending_rows(connection, pending)
+
+    assert len(written_ids.event_ids) == 3
+    assert written_ids.event_ids[0] > 1
+    assert len(written_ids.attributes_ids) == 1
+    assert len(written_ids.state_ids) == 2
+
+    with Session(engine) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert [db_state.state_id for db_state in db_states] == written_ids.state_ids
+        assert [db_state.state for db_state in db_states] == ["1", "2"]
+        assert [db_state.old_state_id for db_state in db_states] == [
+            1000,
+            written_ids.state_ids[0],
+        ]
+        assert [db_state.event_id for db_state in db_states] == (
+            written_ids.event_ids[:2]
+        )
+        assert {db_state.attributes_id for db_state in db_states} == set(
+            written_ids.attributes_ids
+        )
+        db_state_attributes = session.query(StateAttributes).one()
+        assert db_state_attributes.to_native() == {"unit": "W"}
+        db_event = session.query(Events).filter(Events.event_type == "test_event").one()
+        assert db_event.event_id == written_ids.event_ids[2]
+        assert db_event.to_native().data == {"data": 1}
+
+
+def test_write_pending_rows_detects_concurrent_writer(engine):
+    """Test an error is raised if another writer inserted rows meanwhile."""
+    pending = PendingRows()
+    pending.add_event(Events.row_from_event(Event("test_event")))
+
+    with engine.begin() as connection:
+
+        def _insert_other_row(conn, cursor, statement, parameters, context, many):
+            if statement.startswith("INSERT INTO events") and (
+                "other_writer" not in statement
+            ):
+                conn.exec_driver_sql(
+                    "INSERT INTO events (event_type) VALUES ('other_writer')"
+                )
+
+        sqlalchemy_event.listen(connection, "after_cursor_execute", _insert_other_row)
+        with pytest.raises(SQLAlchemyError):
+            write_pending_rows(connection, pending)
@@ -0,0 +1,91 @@
+"""The tests for downsampling recorded state series."""
+import pytest
+
+from homeassistant.components.recorder.downsample import (
+    downsample_states,
+    largest_triangle_three_buckets,
+)
+
+
+def _downsample(states, max_points):
+    """Downsample (timestamp, state) tuples."""
+    return downsample_states(
+        states, max_points, lambda row: row[1], lambda row: float(row[0])
+    )
+
+
+@pytest.mark.parametrize("threshold", [0, 1, 2])
+def test_lttb_keeps_first_and_last(threshold):
+    """Test the first and last points are kept with a small threshold."""
+    assert largest_triangle_three_buckets([0, 1, 2, 3], [0, 5, 1, 2], threshold) == [
+        0,
+        3,
+    ]
+
+
+def test_lttb_keeps_all_points_under_threshold():
+    """Test nothing is dropped if there are fewer points than the threshold."""
+    assert largest_triangle_three_buckets([0, 1, 2], [1, 2, 3], 3) == [0, 1, 2]
+    assert largest_triangle_three_buckets([0, 1, 2], [1, 2, 3], 10) == [0, 1, 2]
+
+
+def test_lttb_keeps_peaks():
+    """Test spikes are selected over flat points."""
+    xs = list(range(101))
+    ys = [0.0] * 101
+    ys[30] = 100.0
+    ys[70] = -100.0
+
+    indexes = largest_triangle_three_buckets(xs, ys, 10)
+
+    assert len(indexes) == 10
+    assert indexes == sorted(indexes)
+    assert indexes[0] == 0
+    assert indexes[-1] == 100
+    assert 30 in indexes
+    assert 70 in indexes
+
+
+def test_downsample_numeric_states():
+    """Test numeric series are reduced to about max_points."""
+    states = [(idx, str(idx % 7)) for idx in range(1000)]
+
+    result = _downsample(states, 50)
+
+    assert len(result) == 50
+    assert result[0] == states[0]
+    assert result[-1] == states[-1]
+    assert result == sorted(result)
+
+
+def test_downsample_keeps_non_numeric_transitions():
+    """Test non numeric states are kept where the state changes."""
+    states = [(idx, "on" if idx // 10 % 2 else "off") for idx in range(100)]
+
+    result = _downsample(states, 5)
+
+    assert result == [(idx, states[idx][1]) for idx in range(0, 100, 10)]
+
+
+def test_downsample_numeric_with_gaps():
+    """Test unavailable gaps in a numeric series are kept."""
+    states = (
+        [(idx, str(idx)) for idx in range(100)]
+        + [(idx, "unavailable") for idx in range(100, 110)]
+        + [(idx, str(idx)) for idx in range(110, 200)]
+    )
+
+    result = _downsample(states, 20)
+
+    assert len(result) <= 21
+    assert (100, "unavailable") in result
+    assert (101, "unavailable") not in result
+    # The edges of both numeric runs are kept
+    for point in ((0, "0"), (99, "99"), (110, "110"), (199, "199")):
+        assert point in result
+
+
+def test_downsample_nothing_to_do():
+    """Test short series are returned as is."""
+    states = [(0, "1"), (1, "1"), (2, "unknown")]
+    assert _downsample(states, 3) == states
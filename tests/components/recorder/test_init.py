@@ -26,10 +26,12 @@ from homeassistant.components.recorder import (
     run_information_from_instance,
     run_information_with_session,
 )
+from homeassistant.components.recorder.bulk import write_pending_rows
 from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     process_timestamp,
@@ -69,6 +71,7 @@ def _default_recorder(hass):
         hass,
         auto_purge=True,
         keep_days=7,
+        purge_time_budget=1.0,
         commit_interval=1,
         uri="sqlite://",
         db_max_retries=10,
@@ -141,10 +144,18 @@ async def test_saving_state(
     await async_wait_recording_done(hass, instance)
 
     with session_scope(hass=hass) as session:
-        db_states = list(session.query(States))
+        db_states = []
+        for db_state, db_state_attributes in session.query(
+            States, StateAttributes
+        ).outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        ):
+            db_states.append(db_state)
+            state = db_state.to_native()
+            state.attributes = db_state_attributes.to_native()
         assert len(db_states) == 1
         assert db_states[0].event_id > 0
-        state = db_states[0].to_native()
+        assert db_states[0].attributes is None
 
     assert state == _state_empty_context(hass, entity_id)
 
@@ -152,27 +163,111 @@ async def test_saving_state(
 async def test_saving_many_states(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
-    """Test we expire after many commits."""
+    """Test states are linked to their old state within and across commits."""
     instance = await async_setup_recorder_instance(hass)
 
     entity_id = "test.recorder"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    with patch.object(
-        hass.data[DATA_INSTANCE].event_session, "expire_all"
-    ) as expire_all, patch.object(recorder, "EXPIRE_AFTER_COMMITS", 2):
-        for _ in range(3):
-            hass.states.async_set(entity_id, "on", attributes)
-            await async_wait_recording_done(hass, instance)
-            hass.states.async_set(entity_id, "off", attributes)
-            await async_wait_recording_done(hass, instance)
-
-    assert expire_all.called
+    for _ in range(3):
+        hass.states.async_set(entity_id, "on", attributes)
+        hass.states.async_set(entity_id, "off", attributes)
+        hass.states.async_set("test.other", "on", attributes)
+        hass.states.async_remove("test.other")
+        await async_wait_recording_done(hass, instance)
 
     with session_scope(hass=hass) as session:
-        db_states = list(session.query(States))
+        db_states = list(
+            session.query(States)
+            .filter(States.entity_id == entity_id)
+            .order_by(States.state_id)
+        )
         assert len(db_states) == 6
         assert db_states[0].event_id > 0
+        assert db_states[0].old_state_id is None
+        for db_state, old_db_state in zip(db_states[1:], db_states):
+            assert db_state.old_state_id == old_db_state.state_id
+        assert len({db_state.event_id for db_state in db_states}) == 6
+        assert len({db_state.attributes_id for db_state in db_states}) == 1
+
+        other_db_states = list(
+            session.query(States)
+            .filter(States.entity_id == "test.other")
+            .order_by(States.state_id)
+        )
+        assert len(other_db_states) == 6
+        assert [db_state.state for db_state in other_db_states] == [
+            "on",
+            None,
+        ] * 3
+        assert [db_state.old_state_id for db_state in other_db_states] == [
+            None,
+            other_db_states[0].state_id,
+            None,
+            other_db_states[2].state_id,
+            None,
+            other_db_states[4].state_id,
+        ]
+
+        assert instance._old_state_ids == {entity_id: db_states[-1].state_id}
+
+
+async def test_saving_states_shares_attributes(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test states with the same attributes share one attributes row."""
+    instance = await async_setup_recorder_instance(hass)
+
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+    attributes2 = {"test_attr": 10, "test_attr_10": "mean"}
+
+    # Within one commit interval
+    hass.states.async_set("test.one", "on", attributes)
+    hass.states.async_set("test.two", "on", attributes)
+    await async_wait_recording_done(hass, instance)
+    # Cached after the commit
+    hass.states.async_set("test.one", "off", attributes)
+    hass.states.async_set("test.two", "off", attributes2)
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        db_state_attributes = list(session.query(StateAttributes))
+        assert len(db_state_attributes) == 2
+        attributes_ids = {
+            db_state.entity_id + db_state.state: db_state.attributes_id
+            for db_state in session.query(States)
+        }
+
+    assert (
+        attributes_ids["test.oneon"]
+        == attributes_ids["test.twoon"]
+        == attributes_ids["test.oneoff"]
+    )
+    assert attributes_ids["test.twooff"] != attributes_ids["test.oneon"]
+
+    # Not cached, found in the database
+    instance._state_attributes_ids.clear()
+    hass.states.async_set("test.three", "on", attributes2)
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StateAttributes).count() == 2
+        db_state = session.query(States).filter(States.entity_id == "test.three").one()
+        assert db_state.attributes_id == attributes_ids["test.twooff"]
+
+
+async def test_state_attributes_ids_cache_is_bounded(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test the least recently used attributes ids are evicted from the cache."""
+    instance = await async_setup_recorder_instance(hass)
+
+    with patch.object(recorder, "STATE_ATTRIBUTES_ID_CACHE_SIZE", 2):
+        for idx in range(3):
+            hass.states.async_set("test.recorder", "on", {"idx": idx})
+            await async_wait_recording_done(hass, instance)
+
+    assert list(instance._state_attributes_ids) == ['{"idx":1}', '{"idx":2}']
 
 
 async def test_saving_state_with_intermixed_time_changes(
@@ -209,17 +304,14 @@ def test_saving_state_with_exception(hass, hass_recorder, caplog):
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in hass.data[DATA_INSTANCE].event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    def _throw_if_state_pending(connection, pending_rows):
+        if pending_rows.states:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
+        return write_pending_rows(connection, pending_rows)
 
-    with patch("time.sleep"), patch.object(
-        hass.data[DATA_INSTANCE].event_session,
-        "flush",
-        side_effect=_throw_if_state_in_session,
+    with patch("time.sleep"), patch(
+        "homeassistant.components.recorder.write_pending_rows",
+        side_effect=_throw_if_state_pending,
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -247,17 +339,14 @@ def test_saving_state_with_sqlalchemy_exception(hass, hass_recorder, caplog):
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in hass.data[DATA_INSTANCE].event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    def _throw_if_state_pending(connection, pending_rows):
+        if pending_rows.states:
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
+        return write_pending_rows(connection, pending_rows)
 
-    with patch("time.sleep"), patch.object(
-        hass.data[DATA_INSTANCE].event_session,
-        "flush",
-        side_effect=_throw_if_state_in_session,
+    with patch("time.sleep"), patch(
+        "homeassistant.components.recorder.write_pending_rows",
+        side_effect=_throw_if_state_pending,
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -288,9 +377,8 @@ async def test_force_shutdown_with_queue_of_writes_that_generate_exceptions(
 
     await async_wait_recording_done(hass, instance)
 
-    with patch.object(instance, "db_retry_wait", 0.2), patch.object(
-        instance.event_session,
-        "flush",
+    with patch.object(instance, "db_retry_wait", 0.2), patch(
+        "homeassistant.components.recorder.write_pending_rows",
         side_effect=OperationalError(
             "insert the state", "fake params", "forced to fail"
         ),
@@ -375,7 +463,14 @@ def _add_entities(hass, entity_ids):
     wait_recording_done(hass)
 
     with session_scope(hass=hass) as session:
-        return [st.to_native() for st in session.query(States)]
+        states = []
+        for state, state_attributes in session.query(States, StateAttributes).outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        ):
+            native_state = state.to_native()
+            native_state.attributes = state_attributes.to_native()
+            states.append(native_state)
+        return states
 
 
 def _add_events(hass, events):
@@ -1,5 +1,6 @@
 """The tests for the Recorder component."""
 from datetime import datetime
+from unittest.mock import PropertyMock
 
 import pytest
 from sqlalchemy import create_engine
@@ -8,7 +9,9 @@ from sqlalchemy.orm import scoped_session, sessionmaker
 from homeassistant.components.recorder.models import (
     Base,
     Events,
+    LazyState,
     RecorderRuns,
+    StateAttributes,
     States,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
@@ -40,6 +43,42 @@ def test_from_event_to_db_state():
     assert state == States.from_event(event).to_native()
 
 
+def test_from_event_to_db_state_attributes():
+    """Test converting event to db state attributes."""
+    attrs = {"this_attr": True}
+    state = ha.State("sensor.temperature", "18", attrs)
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+        context=state.context,
+    )
+    db_state_attributes = StateAttributes.from_event(event)
+    assert db_state_attributes.to_native() == attrs
+    assert db_state_attributes.hash == StateAttributes.hash_shared_attrs(
+        '{"this_attr":true}'
+    )
+    assert States.from_event(event).attributes is None
+
+
+def test_lazy_state_prefers_shared_attributes():
+    """Test LazyState reads shared attributes and falls back to legacy ones."""
+    row = PropertyMock(
+        entity_id="sensor.temperature",
+        state="18",
+        attributes=None,
+        shared_attrs='{"shared":true}',
+    )
+    assert LazyState(row).attributes == {"shared": True}
+
+    row = PropertyMock(
+        entity_id="sensor.temperature",
+        state="18",
+        attributes='{"legacy":true}',
+        shared_attrs=None,
+    )
+    assert LazyState(row).attributes == {"legacy": True}
+
+
 def test_from_event_to_delete_state():
     """Test converting deleting state event to db state."""
     event = ha.Event(
@@ -13,6 +13,7 @@ from homeassistant.components.recorder.const import MAX_ROWS_TO_PURGE
 from homeassistant.components.recorder.models import (
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     StatisticsShortTerm,
@@ -50,7 +51,7 @@ async def test_purge_old_states(
 
         events = session.query(Events).filter(Events.event_type == "state_changed")
         assert events.count() == 6
-        assert "test.recorder2" in instance._old_states
+        assert "test.recorder2" in instance._old_state_ids
 
         purge_before = dt_util.utcnow() - timedelta(days=4)
 
@@ -58,7 +59,7 @@ async def test_purge_old_states(
         finished = purge_old_data(instance, purge_before, repack=False)
         assert not finished
         assert states.count() == 2
-        assert "test.recorder2" in instance._old_states
+        assert "test.recorder2" in instance._old_state_ids
 
         states_after_purge = session.query(States)
         assert states_after_purge[1].old_state_id == states_after_purge[0].state_id
@@ -67,14 +68,14 @@ async def test_purge_old_states(
         finished = purge_old_data(instance, purge_before, repack=False)
         assert finished
         assert states.count() == 2
-        assert "test.recorder2" in instance._old_states
+        assert "test.recorder2" in instance._old_state_ids
 
         # run purge_old_data again
         purge_before = dt_util.utcnow()
         finished = purge_old_data(instance, purge_before, repack=False)
         assert not finished
         assert states.count() == 0
-        assert "test.recorder2" not in instance._old_states
+        assert "test.recorder2" not in instance._old_state_ids
 
     # Add some more states
     await _add_test_states(hass, instance)
@@ -88,7 +89,51 @@ async def test_purge_old_states(
 
         events = session.query(Events).filter(Events.event_type == "state_changed")
         assert events.count() == 6
-        assert "test.recorder2" in instance._old_states
+        assert "test.recorder2" in instance._old_state_ids
+
+
+async def test_purge_old_states_and_unused_attributes(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test deleting old states deletes the attributes no longer used."""
+    instance = await async_setup_recorder_instance(hass)
+
+    utcnow = dt_util.utcnow()
+    eleven_days_ago = utcnow - timedelta(days=11)
+
+    for idx, (timestamp, attributes) in enumerate(
+        (
+            (eleven_days_ago, {"purge": "me"}),
+            (eleven_days_ago, {"shared": True}),
+            (utcnow, {"shared": True}),
+        )
+    ):
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow", return_value=timestamp
+        ):
+            hass.states.async_set("test.recorder", f"state_{idx}", attributes)
+            await hass.async_block_till_done()
+            await async_wait_recording_done(hass, instance)
+
+    assert len(instance._state_attributes_ids) == 2
+
+    with session_scope(hass=hass) as session:
+        state_attributes = session.query(StateAttributes)
+        assert state_attributes.count() == 2
+
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+
+        assert session.query(States).count() == 1
+        assert [attrs.shared_attrs for attrs in state_attributes] == ['{"shared":true}']
+        assert list(instance._state_attributes_ids) == ['{"shared":true}']
+
+        finished = purge_old_data(instance, dt_util.utcnow(), repack=False)
+        assert not finished
+        assert session.query(States).count() == 0
+        assert state_attributes.count() == 0
+        assert not instance._state_attributes_ids
 
 
 async def test_purge_old_states_encouters_database_corruption(
@@ -209,6 +254,36 @@ async def test_purge_old_events(
         assert events.count() == 2
 
 
+async def test_purge_time_budget_and_progress(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test a purge task purges one batch per task without a time budget."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_events(hass, instance)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    instance.purge_time_budget = 0
+
+    with patch(
+        "homeassistant.components.recorder.purge.MAX_ROWS_TO_PURGE", 1
+    ), patch(
+        "homeassistant.components.recorder.purge.purge_old_data",
+        wraps=purge_old_data,
+    ) as purge_old_data_mock:
+        instance.queue.put(PurgeTask(purge_before, repack=False, apply_filter=False))
+        await async_wait_purge_done(hass, instance, 6)
+
+    # One task per old event and a last one to finish
+    assert purge_old_data_mock.call_count == 5
+    progress = instance.purge_progress
+    assert progress.finished
+    assert progress.rows_purged == 4
+    assert progress.rows_per_second > 0
+    with session_scope(hass=hass) as session:
+        events = session.query(Events).filter(Events.event_type.like("EVENT_TEST%"))
+        assert events.count() == 2
+
+
 async def test_purge_old_recorder_runs(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
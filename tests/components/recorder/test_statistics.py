@@ -1,5 +1,6 @@
 """The tests for sensor recorder platform."""
 # pylint: disable=protected-access,invalid-name
+import asyncio
 from datetime import timedelta
 import importlib
 import json
@@ -15,6 +16,8 @@ from homeassistant.components import recorder
 from homeassistant.components.recorder import SQLITE_URL_PREFIX, history, statistics
 from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
+    StatisticsDaily,
+    StatisticsMonthly,
     StatisticsShortTerm,
     process_timestamp_to_utc_isoformat,
 )
@@ -669,6 +672,205 @@ def test_monthly_statistics(hass_recorder, caplog, timezone):
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
 
 
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.freeze_time("2021-08-01 00:00:00+00:00")
+def test_statistics_rollups(hass_recorder, timezone):
+    """Test daily and monthly statistics are read from the rollup tables."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone(timezone))
+
+    hass = hass_recorder()
+    wait_recording_done(hass)
+
+    first_hour = dt_util.as_utc(dt_util.parse_datetime("2021-09-29 00:00:00"))
+    external_statistics = [
+        {
+            "start": first_hour + timedelta(hours=i),
+            "last_reset": None,
+            "mean": i % 7,
+            "min": i % 7 - 1,
+            "max": i % 7 + 1,
+            "state": i,
+            "sum": i * 2,
+        }
+        for i in range(24 * 3 + 12)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StatisticsDaily).count() == 4
+        assert session.query(StatisticsMonthly).count() == 2
+
+    def reduced_statistics(start_time, end_time, period):
+        """Reduce the hourly statistics like before the rollups existed."""
+        stats = statistics_during_period(
+            hass, start_time, end_time, period="hour", start_time_as_datetime=True
+        )
+        if period == "day":
+            return statistics._reduce_statistics_per_day(stats)
+        return statistics._reduce_statistics_per_month(stats)
+
+    def assert_rollups_match():
+        for start_time, end_time in (
+            (first_hour, None),
+            (first_hour + timedelta(hours=5), None),
+            (first_hour + timedelta(hours=5), first_hour + timedelta(hours=60)),
+            (first_hour, first_hour + timedelta(days=2)),
+            (first_hour + timedelta(hours=30), first_hour + timedelta(hours=40)),
+        ):
+            for period in ("day", "month"):
+                assert statistics_during_period(
+                    hass, start_time, end_time, period=period
+                ) == reduced_statistics(start_time, end_time, period)
+
+    assert_rollups_match()
+    with patch.object(
+        statistics,
+        "_reduced_statistics_during_period",
+        wraps=statistics._reduced_statistics_during_period,
+    ) as reduced_mock:
+        stats = statistics_during_period(hass, first_hour, period="day")
+        # All days are read from the rollup table
+        assert reduced_mock.call_count == 0
+        statistics_during_period(hass, first_hour + timedelta(hours=5), period="day")
+        # The first day is partial and reduced from the hourly statistics
+        assert reduced_mock.call_count == 1
+    assert [stat["max"] for stat in stats["test:total_energy_import"]] == [
+        approx(7.0),
+        approx(7.0),
+        approx(7.0),
+        approx(7.0),
+    ]
+
+    # Updating an hourly statistic updates its day and month
+    external_statistics[30]["max"] = 100
+    async_add_external_statistics(hass, external_metadata, (external_statistics[30],))
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StatisticsDaily).count() == 4
+        assert session.query(StatisticsMonthly).count() == 2
+
+    assert_rollups_match()
+    stats = statistics_during_period(hass, first_hour, period="day")
+    assert [stat["max"] for stat in stats["test:total_energy_import"]] == [
+        approx(7.0),
+        approx(100.0),
+        approx(7.0),
+        approx(7.0),
+    ]
+
+    # No statistics in the first hour of the period after the last full day
+    gap_metadata = {**external_metadata, "statistic_id": "test:gap"}
+    async_add_external_statistics(
+        hass, gap_metadata, external_statistics[:48] + external_statistics[49:]
+    )
+    wait_recording_done(hass)
+
+    end_time = first_hour + timedelta(hours=60)
+    stats = statistics_during_period(
+        hass, first_hour, end_time, statistic_ids=["test:gap"], period="day"
+    )
+    assert [stat["start"] for stat in stats["test:gap"]] == [
+        (first_hour + timedelta(days=day)).isoformat() for day in range(3)
+    ]
+    assert (
+        stats["test:gap"] == reduced_statistics(first_hour, end_time, "day")["test:gap"]
+    )
+
+    dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+
+def test_statistics_cache(hass_recorder):
+    """Test statistics_during_period results are cached until statistics change."""
+    hass = hass_recorder()
+    wait_recording_done(hass)
+
+    zero = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 00:00:00"))
+    external_statistics = [
+        {
+            "start": zero + timedelta(hours=i),
+            "last_reset": None,
+            "state": i,
+            "sum": i * 2,
+        }
+        for i in range(48)
+    ]
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    wait_recording_done(hass)
+
+    def cached_statistics(period):
+        return asyncio.run_coroutine_threadsafe(
+            statistics.async_statistics_during_period(
+                hass,
+                zero,
+                zero + timedelta(days=3),
+                ["test:total_energy_import"],
+                period,
+            ),
+            hass.loop,
+        ).result()
+
+    def sums(stats):
+        return [stat["sum"] for stat in stats["test:total_energy_import"]]
+
+    with patch.object(
+        statistics,
+        "statistics_during_period",
+        wraps=statistics.statistics_during_period,
+    ) as statistics_mock:
+        hourly = cached_statistics("hour")
+        daily = cached_statistics("day")
+        assert statistics_mock.call_count == 2
+        assert sums(hourly) == [approx(i * 2.0) for i in range(48)]
+        assert sums(daily) == [approx(46.0), approx(94.0)]
+
+        # Results are served from the cache
+        assert cached_statistics("hour") is hourly
+        assert cached_statistics("day") is daily
+        assert statistics_mock.call_count == 2
+
+        # Only the updated hour and the day it belongs to are queried again
+        external_statistics[40]["sum"] = 100
+        external_statistics[47]["sum"] = 200
+        async_add_external_statistics(hass, external_metadata, external_statistics[40:])
+        wait_recording_done(hass)
+        hourly = cached_statistics("hour")
+        daily = cached_statistics("day")
+        assert statistics_mock.call_count == 4
+        assert statistics_mock.call_args_list[2][0][1] == zero + timedelta(hours=40)
+        assert statistics_mock.call_args_list[3][0][1] == zero + timedelta(days=1)
+        assert sums(hourly) == [approx(i * 2.0) for i in range(40)] + [
+            approx(100.0)
+        ] + [approx(i * 2.0) for i in range(41, 47)] + [approx(200.0)]
+        assert sums(daily) == [approx(46.0), approx(200.0)]
+        assert cached_statistics("hour") is hourly
+        assert statistics_mock.call_count == 4
+
+        # Clearing statistics clears the cache
+        hass.data[DATA_INSTANCE].async_clear_statistics(["test:total_energy_import"])
+        wait_recording_done(hass)
+        assert cached_statistics("hour") == {}
+        assert statistics_mock.call_count == 5
+
+
 def _create_engine_test(*args, **kwargs):
     """Test version of create_engine that initializes with old schema.
 
@@ -138,6 +138,70 @@ def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_compile_hourly_statistics_from_states_buffer(hass_recorder, caplog):
+    """Test periods after the first compile run are compiled from buffered states."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    hass.states.set("sensor.test1", "0", TEMPERATURE_SENSOR_ATTRIBUTES)
+    # The first compile run starts buffering states
+    recorder.do_adhoc_statistics(start=dt_util.utcnow() - timedelta(minutes=10))
+    wait_recording_done(hass)
+    hass.block_till_done()
+
+    zero = dt_util.utcnow() + timedelta(minutes=5)
+    four, states = record_states(
+        hass, zero, "sensor.test1", TEMPERATURE_SENSOR_ATTRIBUTES
+    )
+    with patch.object(
+        history,
+        "get_significant_states_with_session",
+        side_effect=AssertionError("Unexpected history query"),
+    ):
+        recorder.do_adhoc_statistics(start=zero)
+        wait_recording_done(hass)
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "statistic_id": "sensor.test1",
+                "start": process_timestamp_to_utc_isoformat(zero),
+                "end": process_timestamp_to_utc_isoformat(zero + timedelta(minutes=5)),
+                "mean": approx(12.833333),
+                "min": approx(-10),
+                "max": approx(30),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ]
+    }
+
+    # The state at the start of the next period is carried over
+    with patch.object(
+        history,
+        "get_significant_states_with_session",
+        side_effect=AssertionError("Unexpected history query"),
+    ):
+        recorder.do_adhoc_statistics(start=zero + timedelta(minutes=5))
+        wait_recording_done(hass)
+    stats = statistics_during_period(
+        hass, zero + timedelta(minutes=5), period="5minute"
+    )
+    assert stats["sensor.test1"][0]["mean"] == approx(30)
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+    # Periods before the buffer was filled are compiled from the database
+    with patch.object(
+        history,
+        "get_significant_states_with_session",
+        wraps=history.get_significant_states_with_session,
+    ) as get_significant_states_mock:
+        recorder.do_adhoc_statistics(start=zero - timedelta(minutes=20))
+        wait_recording_done(hass)
+    assert get_significant_states_mock.called
+
+
 @pytest.mark.parametrize(
     "device_class,unit,native_unit",
     [
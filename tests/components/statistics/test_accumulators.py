@@ -0,0 +1,99 @@
+"""The tests for the statistics sliding window accumulators."""
+from collections import deque
+import random
+import statistics
+
+import pytest
+
+from homeassistant.components.statistics.accumulators import (
+    RunningSum,
+    RunningVariance,
+    SlidingExtreme,
+    SortedSamples,
+)
+
+
+def _sliding_windows(window_size, count=300):
+    """Yield the samples added, removed and the window after each change."""
+    rnd = random.Random(window_size)
+    window = deque()
+    for _ in range(count):
+        value = rnd.choice((rnd.randint(-5, 5), rnd.uniform(-1e3, 1e3)))
+        removed = window.popleft() if len(window) == window_size else None
+        window.append(value)
+        yield value, removed, window
+
+
+@pytest.mark.parametrize("window_size", [1, 2, 7, 50])
+def test_accumulators_match_statistics(window_size):
+    """Test the accumulators match recomputing the statistics of the window."""
+    running_sum = RunningSum()
+    running_variance = RunningVariance()
+    minimum = SlidingExtreme.minimum()
+    maximum = SlidingExtreme.maximum()
+    sorted_samples = SortedSamples()
+    accumulators = (running_sum, running_variance, minimum, maximum, sorted_samples)
+
+    for value, removed, window in _sliding_windows(window_size):
+        for accumulator in accumulators:
+            if removed is not None:
+                accumulator.remove(removed)
+            accumulator.add(value)
+
+        assert running_sum.count == len(window)
+        assert running_sum.value == pytest.approx(sum(window))
+        assert running_variance.mean == pytest.approx(statistics.mean(window))
+        assert minimum.value == min(window)
+        assert maximum.value == max(window)
+        assert sorted_samples.median() == statistics.median(window)
+        if len(window) >= 2:
+            # Removing samples leaves rounding errors relative to their values
+            assert running_variance.variance == pytest.approx(
+                statistics.variance(window), abs=1e-6
+            )
+            for intervals in (2, 4, 10):
+                for method in ("exclusive", "inclusive"):
+                    assert sorted_samples.quantiles(intervals, method) == (
+                        statistics.quantiles(window, n=intervals, method=method)
+                    )
+
+
+def test_running_sum_compensation():
+    """Test small samples are not lost next to a large one."""
+    running_sum = RunningSum()
+    running_sum.add(1e16)
+    for _ in range(10):
+        running_sum.add(1.0)
+    running_sum.remove(1e16)
+
+    assert running_sum.value == 10.0
+
+
+def test_running_variance_reset():
+    """Test resetting drops the rounding errors of removed samples."""
+    running_variance = RunningVariance()
+    for value in (1e9, 1.0, 1.0):
+        running_variance.add(value)
+    running_variance.remove(1e9)
+    running_variance.reset((1.0, 1.0))
+
+    assert running_variance.mean == 1.0
+    assert running_variance.variance == 0.0
+
+
+def test_accumulators_emptied():
+    """Test the accumulators are reset when the last sample is removed."""
+    running_sum = RunningSum()
+    running_variance = RunningVariance()
+    for value in (0.1, 0.2, 0.3):
+        running_sum.add(value)
+        running_variance.add(value)
+    for value in (0.1, 0.2, 0.3):
+        running_sum.remove(value)
+        running_variance.remove(value)
+
+    assert running_sum.value == 0.0
+    assert running_variance.mean == 0.0
+    running_variance.add(5.0)
+    running_variance.add(7.0)
+    assert running_variance.variance == 2.0
@@ -499,6 +499,62 @@ async def test_get_invalid_trace(hass, hass_ws_client, domain):
     assert response["error"]["code"] == "not_found"
 
 
+async def test_trace_modes(hass, hass_ws_client):
+    """Test traces are only retained as configured by the trace mode."""
+    configs = [
+        {
+            "id": item_id,
+            "trigger": {"platform": "event", "event_type": "test_event"},
+            "action": action,
+            "trace": trace_config,
+        }
+        for item_id, action, trace_config in (
+            ("full", {"event": "some_event"}, {}),
+            ("off", {"event": "some_event"}, {"mode": "off"}),
+            (
+                "sampled",
+                {"event": "some_event"},
+                {"mode": "sampled", "sample_every": 3},
+            ),
+            ("errors", {"event": "some_event"}, {"mode": "errors"}),
+            ("failing", {"service": "test.unknown"}, {"mode": "errors"}),
+        )
+    ]
+    await _setup_automation_or_script(hass, "automation", configs)
+    client = await hass_ws_client()
+
+    for _ in range(4):
+        await _run_automation_or_script(hass, "automation", configs[0], "test_event")
+        await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/list", "domain": "automation"})
+    response = await client.receive_json()
+    assert response["success"]
+    traces = response["result"]
+    assert len(_find_traces(traces, "automation", "full")) == 4
+    assert len(_find_traces(traces, "automation", "off")) == 0
+    # The first and the fourth run are sampled
+    assert len(_find_traces(traces, "automation", "sampled")) == 2
+    assert len(_find_traces(traces, "automation", "errors")) == 0
+    failing_traces = _find_traces(traces, "automation", "failing")
+    assert len(failing_traces) == 4
+    assert failing_traces[0]["error"] == "Unable to find service test.unknown"
+
+    # Variables are captured for retained traces
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "trace/get",
+            "domain": "automation",
+            "item_id": "sampled",
+            "run_id": _find_run_id(traces, "automation", "sampled"),
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert "trigger" in response["result"]["trace"]["trigger/0"][0]["changed_variables"]
+
+
 @pytest.mark.parametrize(
     "domain,stored_traces",
     [("automation", None), ("automation", 10), ("script", None), ("script", 10)],
@@ -7,6 +7,7 @@ from aiohttp import ServerDisconnectedError, WSMsgType, web
 import pytest
 
 from homeassistant.components.websocket_api import const, http
+from homeassistant.components.websocket_api.auth import TYPE_AUTH, TYPE_AUTH_OK
 from homeassistant.util.dt import utcnow
 
 from tests.common import async_fire_time_changed
@@ -92,3 +93,56 @@ async def test_prepare_fail(hass, hass_ws_client, caplog):
         await hass_ws_client(hass)
 
     assert "Timeout preparing request" in caplog.text
+
+
+async def test_coalesce_messages(hass, no_auth_websocket_client, hass_access_token):
+    """Test pending messages are sent as one frame if the client supports it."""
+    await no_auth_websocket_client.send_json(
+        {
+            "type": TYPE_AUTH,
+            "access_token": hass_access_token,
+            "supported_features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    auth_ok = await no_auth_websocket_client.receive_json()
+    assert auth_ok["type"] == TYPE_AUTH_OK
+
+    await no_auth_websocket_client.send_json(
+        {"id": 5, "type": "subscribe_events", "event_type": "test_event"}
+    )
+    msg = await no_auth_websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["success"]
+
+    writer_stats = hass.data[const.DATA_WRITER_STATS]
+    frames_sent = writer_stats.frames_sent
+    messages_sent = writer_stats.messages_sent
+
+    for idx in range(3):
+        hass.bus.async_fire("test_event", {"idx": idx})
+
+    msg = await no_auth_websocket_client.receive_json()
+    assert isinstance(msg, list)
+    assert [event_msg["event"]["data"] for event_msg in msg] == [
+        {"idx": 0},
+        {"idx": 1},
+        {"idx": 2},
+    ]
+    assert writer_stats.frames_sent == frames_sent + 1
+    assert writer_stats.messages_sent == messages_sent + 3
+
+
+async def test_no_coalesce_messages(hass, websocket_client):
+    """Test messages are sent one per frame if not supported by the client."""
+    await websocket_client.send_json(
+        {"id": 5, "type": "subscribe_events", "event_type": "test_event"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    for idx in range(3):
+        hass.bus.async_fire("test_event", {"idx": idx})
+
+    for idx in range(3):
+        msg = await websocket_client.receive_json()
+        assert msg["event"]["data"] == {"idx": idx}
@@ -1,8 +1,10 @@
 """Test Websocket API messages module."""
 
+from homeassistant.components.websocket_api.const import JSON_DUMP
 from homeassistant.components.websocket_api.messages import (
     _cached_event_message as lru_event_cache,
     cached_event_message,
+    event_message,
     message_to_json,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -78,6 +80,32 @@ async def test_cached_event_message_with_different_idens(hass):
     assert cache_info.currsize == 1
 
 
+async def test_cached_state_changed_event_message(hass):
+    """Test state changed event messages are spliced from cached states."""
+
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    hass.states.async_set("light.window", "on", {"brightness": 100})
+    hass.states.async_set("light.window", "off")
+    await hass.async_block_till_done()
+
+    assert len(events) == 2
+    lru_event_cache.cache_clear()
+
+    for event in events:
+        assert cached_event_message(2, event) == JSON_DUMP(event_message(2, event))
+
+    new_state = events[0].data["new_state"]
+    assert events[1].data["old_state"] is new_state
+    assert new_state.as_json() in cached_event_message(2, events[1])
+
+
 async def test_message_to_json(caplog):
     """Test we can serialize websocket messages."""
 
@@ -10,16 +10,25 @@ import pytest
 from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
+    ATTR_FRIENDLY_NAME,
+    ATTR_ICON,
+    ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
+    TEMP_CELSIUS,
+    TEMP_FAHRENHEIT,
 )
 from homeassistant.core import Context, HomeAssistantError
 from homeassistant.helpers import entity, entity_registry
+from homeassistant.util import dt as dt_util
 
 from tests.common import (
     MockConfigEntry,
     MockEntity,
     MockEntityPlatform,
+    async_capture_events,
+    async_fire_time_changed,
     get_test_home_assistant,
     mock_registry,
 )
@@ -657,6 +666,113 @@ async def test_capability_attrs(hass):
     assert state.attributes["always"] == "there"
 
 
+async def test_cached_static_attributes(hass):
+    """Test static attributes are only read again after an invalidation."""
+    entry = entity_registry.RegistryEntry(
+        entity_id="hello.world",
+        unique_id="test-unique-id",
+        platform="test-platform",
+    )
+    registry = mock_registry(hass, {"hello.world": entry})
+
+    class CachedEntity(entity.Entity):
+        """Entity with cached static attributes."""
+
+        _cache_static_attributes = True
+        _attr_unit_of_measurement = TEMP_FAHRENHEIT
+        name_reads = 0
+
+        @property
+        def name(self):
+            """Return the name and count the reads."""
+            self.name_reads += 1
+            return "Cached"
+
+    ent = CachedEntity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent.registry_entry = entry
+    ent._attr_extra_state_attributes = {"dynamic": 1}
+    ent._attr_state = "50.0"
+    ent.add_to_platform_start(hass, MagicMock(platform_name="test-platform"), None)
+    await ent.add_to_platform_finish()
+
+    state = hass.states.get("hello.world")
+    assert state.state == "10.0"
+    assert state.attributes == {
+        "dynamic": 1,
+        ATTR_FRIENDLY_NAME: "Cached",
+        ATTR_UNIT_OF_MEASUREMENT: TEMP_CELSIUS,
+    }
+
+    # Only the state changed, the attributes of the last write are reused
+    attributes = ent._last_written_attributes[3]
+    ent._attr_state = "59.0"
+    ent.async_write_ha_state()
+    new_state = hass.states.get("hello.world")
+    assert new_state.state == "15.0"
+    assert new_state.attributes == state.attributes
+    assert ent._last_written_attributes[3] is attributes
+    # The unit is not converted if the state is not a temperature
+    ent._attr_state = STATE_UNKNOWN
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes[ATTR_UNIT_OF_MEASUREMENT] == (
+        TEMP_FAHRENHEIT
+    )
+
+    ent._attr_state = "59.0"
+    ent._attr_extra_state_attributes = {"dynamic": 2}
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes["dynamic"] == 2
+    assert ent.name_reads == 1
+
+    ent._attr_icon = "mdi:test"
+    ent.async_write_ha_state()
+    assert ATTR_ICON not in hass.states.get("hello.world").attributes
+    ent.async_invalidate_static_attributes()
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes[ATTR_ICON] == "mdi:test"
+    assert ent.name_reads == 2
+
+    registry.async_update_entity("hello.world", name="Renamed")
+    await hass.async_block_till_done()
+    state = hass.states.get("hello.world")
+    assert state.attributes[ATTR_FRIENDLY_NAME] == "Renamed"
+    assert state.attributes[ATTR_UNIT_OF_MEASUREMENT] == TEMP_CELSIUS
+
+
+async def test_coalesced_writes(hass):
+    """Test writes within the coalescing interval are written once."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._write_coalesce_interval = 1
+
+    ent._attr_state = "1"
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").state == "1"
+
+    for value in ("2", "3", "4"):
+        ent._attr_state = value
+        ent.async_write_ha_state()
+    assert hass.states.get("hello.world").state == "1"
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert hass.states.get("hello.world").state == "4"
+    assert len(events) == 2
+
+    # A pending write is dropped when the entity is removed
+    ent._attr_state = "5"
+    ent.async_write_ha_state()
+    await ent.async_remove()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=4))
+    await hass.async_block_till_done()
+    assert hass.states.get("hello.world") is None
+    assert len(events) == 3
+
+
 async def test_warn_slow_write_state(hass, caplog):
     """Check that we log a warning if reading properties takes too long."""
     mock_entity = entity.Entity()
@@ -1,6 +1,7 @@
 """Tests for the Entity Registry."""
 from unittest.mock import patch
 
+import attr
 import pytest
 import voluptuous as vol
 
@@ -1083,6 +1084,75 @@ def test_entity_registry_items():
     assert entities.get_entry(entry2.id) is None
 
 
+def test_entity_registry_items_secondary_indexes():
+    """Test the device, area and config entry indexes follow the entries."""
+    entities = er.EntityRegistryItems()
+    entry1 = er.RegistryEntry(
+        "test.entity1",
+        "1234",
+        "hue",
+        area_id="kitchen",
+        config_entry_id="config-1",
+        device_id="device-1",
+    )
+    entry2 = er.RegistryEntry(
+        "test.entity2", "2345", "hue", config_entry_id="config-1", device_id="device-1"
+    )
+    entities["test.entity1"] = entry1
+    entities["test.entity2"] = entry2
+
+    assert entities.get_entries_for_device_id("device-1") == [entry1, entry2]
+    assert entities.get_entries_for_area_id("kitchen") == [entry1]
+    assert entities.get_entries_for_config_entry_id("config-1") == [entry1, entry2]
+    assert entities.get_entries_for_device_id("unknown") == []
+
+    # Updating an entry in place keeps its position in the index
+    updated_entry1 = attr.evolve(entry1, area_id="bedroom", name="Renamed")
+    entities["test.entity1"] = updated_entry1
+    assert entities.get_entries_for_device_id("device-1") == [updated_entry1, entry2]
+    assert entities.get_entries_for_area_id("kitchen") == []
+    assert entities.get_entries_for_area_id("bedroom") == [updated_entry1]
+
+    entities_copy = entities.copy()
+    del entities["test.entity1"]
+    assert entities.get_entries_for_device_id("device-1") == [entry2]
+    assert entities.get_entries_for_area_id("bedroom") == []
+    assert entities_copy.get_entries_for_area_id("bedroom") == [updated_entry1]
+    assert entities_copy.get_entries_for_device_id("device-1") == [
+        updated_entry1,
+        entry2,
+    ]
+
+    entities.pop("test.entity2")
+    assert entities.get_entries_for_device_id("device-1") == []
+    assert entities.get_entries_for_config_entry_id("config-1") == []
+    assert entities._device_id_index == {}
+    assert entities._config_entry_id_index == {}
+
+
+async def test_entries_for_device_after_update(registry):
+    """Test entity lookups by device follow device and entity id changes."""
+    entry = registry.async_get_or_create(
+        "light",
+        "hue",
+        "5678",
+        device_id="device-1",
+        config_entry=MockConfigEntry(domain="light"),
+    )
+    assert er.async_entries_for_device(registry, "device-1") == [entry]
+
+    entry = registry.async_update_entity(
+        entry.entity_id, new_entity_id="light.renamed", device_id="device-2"
+    )
+    assert er.async_entries_for_device(registry, "device-1") == []
+    assert er.async_entries_for_device(registry, "device-2") == [entry]
+    assert er.async_entries_for_config_entry(registry, entry.config_entry_id) == [entry]
+
+    registry.async_remove("light.renamed")
+    assert er.async_entries_for_device(registry, "device-2") == []
+    assert er.async_entries_for_config_entry(registry, entry.config_entry_id) == []
+
+
 async def test_deprecated_disabled_by_str(hass, registry, caplog):
     """Test deprecated str use of disabled_by converts to enum and logs a warning."""
     entry = registry.async_get_or_create(
@@ -30,6 +30,7 @@ from homeassistant.helpers.event import (
     async_track_state_removed_domain,
     async_track_sunrise,
     async_track_sunset,
+    async_template_render_stats,
     async_track_template,
     async_track_template_result,
     async_track_time_change,
@@ -1654,6 +1655,72 @@ async def test_track_template_result_super_template_2_initially_false(
     assert wildercard_runs == [(0, 10), (10, 35)]
 
 
+async def test_track_template_result_coalesces_state_changes(hass):
+    """Test tracked templates render once per loop iteration."""
+    template_temp = Template("{{ states.sensor.temp.state }}", hass)
+    template_light = Template("{{ states.light.kitchen.state }}", hass)
+    template_count = Template("{{ states.sensor | count }}", hass)
+    temp_runs = []
+    light_runs = []
+    count_runs = []
+
+    @ha.callback
+    def temp_callback(event, updates):
+        temp_runs.append((event.data["entity_id"], updates.pop().result))
+
+    @ha.callback
+    def light_callback(event, updates):
+        light_runs.append(updates.pop().result)
+
+    @ha.callback
+    def count_callback(event, updates):
+        count_runs.append(updates.pop().result)
+
+    info_temp = async_track_template_result(
+        hass, [TrackTemplate(template_temp, None)], temp_callback
+    )
+    async_track_template_result(
+        hass, [TrackTemplate(template_light, None)], light_callback
+    )
+    async_track_template_result(
+        hass,
+        [TrackTemplate(template_count, None, timedelta(seconds=0))],
+        count_callback,
+    )
+    await hass.async_block_till_done()
+    assert count_runs == []
+
+    for temp in range(10):
+        hass.states.async_set("sensor.temp", temp)
+    await hass.async_block_till_done()
+
+    assert temp_runs == [("sensor.temp", 9)]
+    assert light_runs == []
+    assert count_runs == [1]
+
+    hass.states.async_set("sensor.temp", 10)
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("sensor.other", 1)
+    await hass.async_block_till_done()
+
+    assert temp_runs == [("sensor.temp", 9), ("sensor.temp", 10)]
+    assert light_runs == ["on"]
+    assert count_runs == [1, 2]
+
+    render_stats = async_template_render_stats(hass)
+    assert render_stats[template_temp].renders == 3
+    assert render_stats[template_light].renders == 2
+    assert render_stats[template_count].renders == 3
+    assert render_stats[template_temp].render_time > 0
+
+    info_temp.async_remove()
+    hass.states.async_set("sensor.temp", 11)
+    await hass.async_block_till_done()
+
+    assert len(temp_runs) == 2
+    assert template_temp not in async_template_render_stats(hass)
+
+
 async def test_track_template_result_complex(hass):
     """Test tracking template."""
     specific_runs = []
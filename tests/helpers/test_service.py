@@ -529,6 +529,35 @@ async def test_call_with_required_features(hass, mock_entities):
     assert all(entity in actual for entity in expected)
 
 
+async def test_call_looks_up_referenced_entities(hass, mock_entities):
+    """Test targeted service calls do not iterate all platform entities."""
+
+    class NoIterDict(OrderedDict):
+        """Dictionary that fails when iterated."""
+
+        def __iter__(self):
+            raise AssertionError("Platform entities should not be iterated")
+
+        def items(self):
+            raise AssertionError("Platform entities should not be iterated")
+
+    test_service_mock = AsyncMock(return_value=None)
+    await service.entity_service_call(
+        hass,
+        [Mock(entities=NoIterDict(mock_entities))],
+        test_service_mock,
+        ha.ServiceCall(
+            "test_domain",
+            "test_service",
+            {"entity_id": ["light.kitchen", "light.unknown"]},
+        ),
+    )
+
+    assert [call[0][0] for call in test_service_mock.call_args_list] == [
+        mock_entities["light.kitchen"]
+    ]
+
+
 async def test_call_with_both_required_features(hass, mock_entities):
     """Test service calls invoked only if entity has both features."""
     test_service_mock = AsyncMock(return_value=None)
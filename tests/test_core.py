@@ -3,6 +3,7 @@
 import asyncio
 from datetime import datetime, timedelta
 import functools
+import json
 import logging
 import os
 from tempfile import TemporaryDirectory
@@ -353,6 +354,7 @@ def test_event_as_dict():
     assert event.as_dict() == expected
     # 2nd time to verify cache
     assert event.as_dict() == expected
+    assert event.as_dict() is event.as_dict()
 
 
 def test_state_as_dict():
@@ -383,6 +385,34 @@ def test_state_as_dict():
     assert state.as_dict() is state.as_dict()
 
 
+def test_state_as_json():
+    """Test a State as JSON."""
+    last_time = datetime(1984, 12, 8, 12, 0, 0)
+    state = ha.State(
+        "happy.happy",
+        "on",
+        {"pig": "dog"},
+        last_updated=last_time,
+        last_changed=last_time,
+    )
+    assert json.loads(state.as_json()) == state.as_dict()
+    # 2nd time to verify cache
+    assert state.as_json() is state.as_json()
+
+
+def test_states_share_entity_id_strings():
+    """Test states of the same entity share their entity id strings."""
+    state = ha.State("light.kitchen_lamp", "on")
+    state2 = ha.State("".join(["light.", "kitchen_lamp"]), "off")
+
+    assert state.entity_id == "light.kitchen_lamp"
+    assert state.domain == "light"
+    assert state.object_id == "kitchen_lamp"
+    assert state2.entity_id is state.entity_id
+    assert state2.domain is state.domain
+    assert state2.object_id is state.object_id
+
+
 async def test_eventbus_add_remove_listener(hass):
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -431,6 +461,49 @@ async def test_eventbus_filtered_listener(hass):
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass):
+    """Test listening to events by a value in the event data."""
+    calls = []
+    all_calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def all_listener(event):
+        """Mock match all listener."""
+        all_calls.append(event)
+
+    old_count = hass.bus.async_listeners().get("test", 0)
+    unsub = hass.bus.async_listen_keyed(
+        "test", "entity_id", ["light.kitchen", "light.bowl"], listener
+    )
+    unsub_all = hass.bus.async_listen(MATCH_ALL, all_listener)
+    assert hass.bus.async_listeners()["test"] == old_count + 1
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.ceiling"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other", {"entity_id": "light.bowl"})
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in calls] == ["light.kitchen"]
+    assert len(all_calls) == 5
+
+    unsub()
+    unsub_all()
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+    assert hass.bus.async_listeners().get(MATCH_ALL, 0) == 0
+
+    hass.bus.async_fire("test", {"entity_id": "light.bowl"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert len(all_calls) == 5
+
+
 async def test_eventbus_unsubscribe_listener(hass):
     """Test unsubscribe listener from returned function."""
     calls = []